@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """Dataclass storing the configuration of one throughput benchmark run."""
+    genotype: str
+    phenotype: str
+    fitness_function: str
+    use_array_population: bool
+    number_of_individuals: int
+    number_of_genes: int
+    number_of_generations: int
+
+    @property
+    def key(self) -> str:
+        """Identifier of the case, used to match results against a baseline."""
+        backend = "array" if self.use_array_population else "object"
+        return f"{self.genotype}/{self.phenotype}/{self.fitness_function}/{backend}/" \
+               f"{self.number_of_individuals}x{self.number_of_genes}"
+
+
+@dataclass
+class BenchmarkResult:
+    """Dataclass storing the measurements of one throughput benchmark run.
+
+    Cases that cannot run, e.g. a two variable phenotype with a single gene genotype, are stored with the
+    status "skipped" and the reason, without measurements. Cases whose run raised an exception are stored with
+    the status "failed" and the error as reason.
+    """
+    case: BenchmarkCase
+    status: str
+    reason: Optional[str] = None
+    generations_per_second: Optional[float] = None
+    evaluations_per_second: Optional[float] = None
+    peak_rss_bytes: Optional[int] = None
+    traced_peak_bytes_per_generation: Optional[float] = None
+    traced_net_bytes_per_generation: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class BenchmarkRegression:
+    """Dataclass storing a metric of a benchmark case that got worse than in the baseline.
+
+    A case measured in the baseline that is no longer measured has the metric "status", no values and the
+    status and reason of the current result as reason.
+    """
+    case_key: str
+    metric: str
+    baseline_value: Optional[float] = None
+    current_value: Optional[float] = None
+    relative_change: Optional[float] = None
+    reason: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ConvergenceProblem:
+    """Dataclass storing a phenotype to optimise, the direction of the optimisation and its optimal phenotype value."""
+    name: str
+    phenotype: str
+    fitness_function: str
+    optimum_phenotype_value: float
+    number_of_genes: int
+    value_range: Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class ConvergenceCase:
+    """Dataclass storing the problem and the parameters of the evolutionary algorithm of a convergence benchmark."""
+    problem: ConvergenceProblem
+    genotype: str
+    number_of_individuals: int = 100
+    ratio_of_elite_individuals: float = 0.1
+    mutation_probability: float = 0.1
+    ratio_of_population_for_crossover: float = 0.5
+    max_number_of_evaluations: int = 100000
+    use_array_population: bool = False
+
+    @property
+    def key(self) -> str:
+        """Identifier of the case, used to group the runs of its repetitions."""
+        backend = "array" if self.use_array_population else "object"
+        return f"{self.problem.name}/{self.genotype}/{backend}/n={self.number_of_individuals}/" \
+               f"elite={self.ratio_of_elite_individuals}/mutation={self.mutation_probability}/" \
+               f"crossover={self.ratio_of_population_for_crossover}"
+
+
+@dataclass
+class ConvergenceRun:
+    """Dataclass storing the outcome of one seeded repetition of a convergence benchmark case.
+
+    evaluations_to_target holds, for each precision in targets, the number of evaluations after which the best
+    phenotype value was within that precision of the optimum, None if it was never reached. Cases that cannot
+    run are stored with the reason and no evaluations.
+    """
+    case: ConvergenceCase
+    seed: int
+    targets: List[float]
+    evaluations_to_target: List[Optional[int]]
+    number_of_evaluations: int = 0
+    best_precision: Optional[float] = None
+    reason: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ConvergenceSummary:
+    """Dataclass storing the success rate and running times of the repetitions of a case for one target precision.
+
+    expected_running_time is the number of evaluations of all repetitions, successful or not, divided by the
+    number of successful repetitions, and is infinite if no repetition reached the target.
+    """
+    case_key: str
+    target: float
+    number_of_runs: int
+    success_rate: float
+    expected_running_time: float
+    median_evaluations_to_target: Optional[float]
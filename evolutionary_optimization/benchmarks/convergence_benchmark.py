@@ -0,0 +1,376 @@
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib import pyplot as plt
+from tqdm import tqdm
+
+from evolutionary_optimization.benchmarks.benchmark_data_model import ConvergenceCase, ConvergenceProblem, \
+    ConvergenceRun, ConvergenceSummary
+from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
+from evolutionary_optimization.fitness_functions.fitness_interface import FitnessFunction, FitnessFunctions
+from evolutionary_optimization.genotype.genotype_model.genotype_interface import Genotype, Genotypes
+from evolutionary_optimization.phenotype.implemented_phenotypes.benchmark_function_phenotypes import \
+    AckleyPhenotype, GriewankPhenotype, RastriginPhenotype, RosenbrockPhenotype, SchwefelPhenotype, SpherePhenotype
+from evolutionary_optimization.phenotype.phenotype_model.phenotype_interface import Phenotype, Phenotypes
+from evolutionary_optimization.termination_criteria.implemented_termination_criteria import \
+    EvaluationBudgetTerminationCriterion
+
+DEFAULT_TARGETS = (1e1, 1e0, 1e-1, 1e-2, 1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8)
+
+CONVERGENCE_PROBLEMS = {
+    "parabola": ConvergenceProblem(
+        name="parabola",
+        phenotype=Phenotypes.PARABOLA.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=0.0,
+        number_of_genes=1,
+        value_range=(-10, 10),
+    ),
+    "inverted_parabola": ConvergenceProblem(
+        name="inverted_parabola",
+        phenotype=Phenotypes.INVERTED_PARABOLA.value,
+        fitness_function=FitnessFunctions.MAXIMIZE.value,
+        optimum_phenotype_value=0.0,
+        number_of_genes=1,
+        value_range=(-10, 10),
+    ),
+    "saddle_point": ConvergenceProblem(
+        name="saddle_point",
+        phenotype=Phenotypes.SADDLE_POINT.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=0.3125,
+        number_of_genes=1,
+        value_range=(-10, 10),
+    ),
+    "booth": ConvergenceProblem(
+        name="booth",
+        phenotype=Phenotypes.BOOTH.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=0.0,
+        number_of_genes=2,
+        value_range=(-10, 10),
+    ),
+    "sphere_10": ConvergenceProblem(
+        name="sphere_10",
+        phenotype=Phenotypes.SPHERE.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=SpherePhenotype.optimum_phenotype_value,
+        number_of_genes=10,
+        value_range=SpherePhenotype.default_value_range,
+    ),
+    "rastrigin_10": ConvergenceProblem(
+        name="rastrigin_10",
+        phenotype=Phenotypes.RASTRIGIN.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=RastriginPhenotype.optimum_phenotype_value,
+        number_of_genes=10,
+        value_range=RastriginPhenotype.default_value_range,
+    ),
+    "rosenbrock_10": ConvergenceProblem(
+        name="rosenbrock_10",
+        phenotype=Phenotypes.ROSENBROCK.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=RosenbrockPhenotype.optimum_phenotype_value,
+        number_of_genes=10,
+        value_range=RosenbrockPhenotype.default_value_range,
+    ),
+    "ackley_10": ConvergenceProblem(
+        name="ackley_10",
+        phenotype=Phenotypes.ACKLEY.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=AckleyPhenotype.optimum_phenotype_value,
+        number_of_genes=10,
+        value_range=AckleyPhenotype.default_value_range,
+    ),
+    "griewank_10": ConvergenceProblem(
+        name="griewank_10",
+        phenotype=Phenotypes.GRIEWANK.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=GriewankPhenotype.optimum_phenotype_value,
+        number_of_genes=10,
+        value_range=GriewankPhenotype.default_value_range,
+    ),
+    "schwefel_10": ConvergenceProblem(
+        name="schwefel_10",
+        phenotype=Phenotypes.SCHWEFEL.value,
+        fitness_function=FitnessFunctions.MINIMIZE.value,
+        optimum_phenotype_value=SchwefelPhenotype.optimum_phenotype_value,
+        number_of_genes=10,
+        value_range=SchwefelPhenotype.default_value_range,
+    ),
+}
+
+
+def build_convergence_cases(
+    problems: Sequence[ConvergenceProblem] = tuple(CONVERGENCE_PROBLEMS.values()),
+    genotypes: Sequence[Genotypes] = (Genotypes.FLOAT_LIST,),
+    population_sizes: Sequence[int] = (100,),
+    ratios_of_elite_individuals: Sequence[float] = (0.1,),
+    mutation_probabilities: Sequence[float] = (0.1,),
+    ratios_of_population_for_crossover: Sequence[float] = (0.5,),
+    max_number_of_evaluations: int = 100000,
+    use_array_population: bool = False,
+) -> List[ConvergenceCase]:
+    """Build the convergence benchmark cases for every combination of problem, genotype and parameters.
+
+    Args:
+        problems: problems to optimise.
+        genotypes: genotypes to optimise the problems with.
+        population_sizes: numbers of individuals to try.
+        ratios_of_elite_individuals: values of ratio_of_elite_individuals to try.
+        mutation_probabilities: values of mutation_probability to try.
+        ratios_of_population_for_crossover: values of ratio_of_population_for_crossover to try.
+        max_number_of_evaluations: evaluation budget of every run.
+        use_array_population: if True the runs use an ArrayPopulation.
+
+    Returns:
+        List of ConvergenceCase, one per combination.
+    """
+    return [
+        ConvergenceCase(
+            problem=problem,
+            genotype=Genotypes(genotype).value,
+            number_of_individuals=number_of_individuals,
+            ratio_of_elite_individuals=ratio_of_elite_individuals,
+            mutation_probability=mutation_probability,
+            ratio_of_population_for_crossover=ratio_of_population_for_crossover,
+            max_number_of_evaluations=max_number_of_evaluations,
+            use_array_population=use_array_population,
+        )
+        for problem, genotype, number_of_individuals, ratio_of_elite_individuals, mutation_probability,
+        ratio_of_population_for_crossover in product(problems, genotypes, population_sizes,
+                                                     ratios_of_elite_individuals, mutation_probabilities,
+                                                     ratios_of_population_for_crossover)
+    ]
+
+
+def build_convergence_evolution(case: ConvergenceCase, seed: Optional[int] = None) -> Evolution:
+    """Build the seeded Evolution instance of a convergence benchmark case, stopping when the budget is spent."""
+    problem = case.problem
+    genotype_class = Genotype.get_genotype(Genotypes(case.genotype))
+    phenotype_class = Phenotype.get_phenotype(Phenotypes(problem.phenotype))
+    fitness_function_class = FitnessFunction.get_fitness_function(FitnessFunctions(problem.fitness_function))
+    if FitnessFunctions(problem.fitness_function) == FitnessFunctions.APPROACH_VALUE:
+        fitness_function = fitness_function_class(expected_value=problem.optimum_phenotype_value)
+    else:
+        fitness_function = fitness_function_class()
+
+    genotype = genotype_class(
+        number_of_genes=problem.number_of_genes,
+        value_range=problem.value_range,
+        mutation_probability=case.mutation_probability,
+        ratio_of_population_for_crossover=case.ratio_of_population_for_crossover,
+    )
+    return Evolution(
+        phenotype=phenotype_class(genotype),
+        fitness_function=fitness_function,
+        number_of_individuals=case.number_of_individuals,
+        number_of_generations=case.max_number_of_evaluations,
+        ratio_of_elite_individuals=case.ratio_of_elite_individuals,
+        use_array_population=case.use_array_population,
+        termination_criteria=[EvaluationBudgetTerminationCriterion(case.max_number_of_evaluations)],
+        seed=seed,
+    )
+
+
+def run_convergence_case(
+    case: ConvergenceCase,
+    seed: int,
+    targets: Sequence[float] = DEFAULT_TARGETS,
+) -> ConvergenceRun:
+    """Run one seeded repetition of a convergence benchmark case.
+
+    The run stops when the best phenotype value is within the smallest target precision of the optimum, or when
+    the evaluation budget is spent. Evaluations are counted once per generation, so the number of evaluations to
+    a target includes the whole generation in which it was reached.
+
+    Args:
+        case: problem and parameters of the run.
+        seed: seed of the random generator of the Evolution instance.
+        targets: precisions, absolute differences between the best phenotype value and the optimum.
+
+    Returns:
+        ConvergenceRun with the number of evaluations needed to reach each target.
+    """
+    targets = sorted(targets, reverse=True)
+    try:
+        evolution = build_convergence_evolution(case, seed)
+        evaluations_to_target: List[Optional[int]] = [None] * len(targets)
+        best_precision = np.inf
+        for snapshot in evolution.evolve_iter():
+            best_precision = min(
+                best_precision, abs(float(snapshot.best_phenotype_value) - case.problem.optimum_phenotype_value)
+            )
+            for index, target in enumerate(targets):
+                if evaluations_to_target[index] is None and best_precision <= target:
+                    evaluations_to_target[index] = snapshot.number_of_evaluations
+            if evaluations_to_target[-1] is not None:
+                break
+    except Exception as error:
+        return ConvergenceRun(case=case, seed=seed, targets=targets, evaluations_to_target=[None] * len(targets),
+                              reason=f"{type(error).__name__}: {error}")
+
+    return ConvergenceRun(
+        case=case,
+        seed=seed,
+        targets=targets,
+        evaluations_to_target=evaluations_to_target,
+        number_of_evaluations=evolution.population.number_of_evaluations,
+        best_precision=best_precision,
+    )
+
+
+def run_convergence_benchmark(
+    cases: List[ConvergenceCase],
+    number_of_repetitions: int = 15,
+    targets: Sequence[float] = DEFAULT_TARGETS,
+    seed: Optional[int] = 0,
+    max_workers: Optional[int] = None,
+    mp_context=None,
+) -> List[ConvergenceRun]:
+    """Run seeded repetitions of convergence benchmark cases in parallel processes.
+
+    The seeds of the repetitions are spawned from one SeedSequence, so a benchmark is reproducible from its seed,
+    and repetition i of every case uses the same seed.
+
+    Args:
+        cases: problems and parameters to run.
+        number_of_repetitions: number of independent runs of each case.
+        targets: precisions, absolute differences between the best phenotype value and the optimum.
+        seed: seed of the SeedSequence the seeds of the repetitions are spawned from.
+        max_workers: number of processes, defaults to the number of cores.
+        mp_context: optional multiprocessing context used to start the processes.
+
+    Returns:
+        List of ConvergenceRun, ordered by case and then by repetition.
+    """
+    seeds = [
+        int(child_seed_sequence.generate_state(1)[0])
+        for child_seed_sequence in np.random.SeedSequence(seed).spawn(number_of_repetitions)
+    ]
+    context = mp_context if mp_context is not None else multiprocessing.get_context()
+    runs: List[Optional[ConvergenceRun]] = [None] * (len(cases) * number_of_repetitions)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        futures = {
+            executor.submit(run_convergence_case, case, repetition_seed, targets): index
+            for index, (case, repetition_seed) in enumerate(product(cases, seeds))
+        }
+        for future in tqdm(as_completed(futures), total=len(futures)):
+            runs[futures[future]] = future.result()
+    return runs
+
+
+def group_convergence_runs(runs: List[ConvergenceRun]) -> Dict[str, List[ConvergenceRun]]:
+    """Group the runs that completed by case key, in the order the cases first appear."""
+    runs_by_case: Dict[str, List[ConvergenceRun]] = {}
+    for run in runs:
+        if run.reason is None:
+            runs_by_case.setdefault(run.case.key, []).append(run)
+    return runs_by_case
+
+
+def summarise_convergence_runs(runs: List[ConvergenceRun]) -> List[ConvergenceSummary]:
+    """Compute the success rate and running times of every case for every target precision.
+
+    Args:
+        runs: runs returned by run_convergence_benchmark, cases that could not run are ignored.
+
+    Returns:
+        List of ConvergenceSummary, ordered by case and then by decreasing target precision.
+    """
+    summaries = []
+    for case_key, case_runs in group_convergence_runs(runs).items():
+        for index, target in enumerate(case_runs[0].targets):
+            evaluations_to_target = [run.evaluations_to_target[index] for run in case_runs]
+            successful_evaluations = [evaluations for evaluations in evaluations_to_target if evaluations is not None]
+            spent_evaluations = sum(
+                run.number_of_evaluations if evaluations is None else evaluations
+                for run, evaluations in zip(case_runs, evaluations_to_target)
+            )
+            summaries.append(ConvergenceSummary(
+                case_key=case_key,
+                target=target,
+                number_of_runs=len(case_runs),
+                success_rate=len(successful_evaluations) / len(case_runs),
+                expected_running_time=spent_evaluations / len(successful_evaluations) if successful_evaluations
+                else np.inf,
+                median_evaluations_to_target=float(np.median(successful_evaluations)) if successful_evaluations
+                else None,
+            ))
+    return summaries
+
+
+def empirical_runtime_distribution(
+    runs: List[ConvergenceRun],
+    budgets: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the empirical cumulative distribution of the number of evaluations to target of a set of runs.
+
+    Every pair of run and target precision counts as one problem, as in the BBOB run-time distributions, so the
+    curve reaches 1 when every run reached every target.
+
+    Args:
+        runs: runs of one case, or of several cases to aggregate them.
+        budgets: numbers of evaluations at which the distribution is computed, defaults to 50 values spaced
+            logarithmically up to the largest number of evaluations of the runs.
+
+    Returns:
+        Tuple of the budgets and of the proportion of (run, target) pairs reached within each budget.
+    """
+    runs = [run for run in runs if run.reason is None]
+    if budgets is None:
+        max_number_of_evaluations = max([run.number_of_evaluations for run in runs] + [1])
+        budgets = np.unique(np.geomspace(1, max_number_of_evaluations, 50).astype(int))
+
+    evaluations_to_target = np.array(
+        [np.inf if evaluations is None else evaluations for run in runs for evaluations in run.evaluations_to_target],
+        dtype=float,
+    )
+    if len(evaluations_to_target) == 0:
+        return budgets, np.zeros(len(budgets))
+    evaluations_to_target.sort()
+    proportions = np.searchsorted(evaluations_to_target, budgets, side="right") / len(evaluations_to_target)
+    return budgets, proportions
+
+
+def plot_empirical_runtime_distributions(runs: List[ConvergenceRun]):
+    """Plot the empirical run-time distribution of every case, with a logarithmic number of evaluations."""
+    for case_key, case_runs in group_convergence_runs(runs).items():
+        budgets, proportions = empirical_runtime_distribution(case_runs)
+        plt.step(budgets, proportions, where="post", label=case_key)
+    plt.xscale("log")
+    plt.ylim(0, 1)
+    plt.title('Empirical Run-Time Distribution')
+    plt.xlabel('Number of evaluations')
+    plt.ylabel('Proportion of (run, target) pairs reached')
+    plt.legend()
+    plt.show()
+
+
+def save_convergence_runs(path: str, runs: List[ConvergenceRun]):
+    """Write the runs of a convergence benchmark and their summaries to a JSON file."""
+    report = {
+        "runs": [asdict(run) for run in runs],
+        "summaries": [asdict(summary) for summary in summarise_convergence_runs(runs)],
+    }
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_convergence_runs(path: str) -> List[ConvergenceRun]:
+    """Read the runs written by save_convergence_runs."""
+    with open(path) as file:
+        report = json.load(file)
+
+    runs = []
+    for run in report["runs"]:
+        case = run.pop("case")
+        problem = case.pop("problem")
+        problem["value_range"] = tuple(problem["value_range"])
+        runs.append(ConvergenceRun(case=ConvergenceCase(problem=ConvergenceProblem(**problem), **case), **run))
+    return runs
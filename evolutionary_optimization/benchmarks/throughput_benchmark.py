@@ -0,0 +1,273 @@
+import json
+import multiprocessing
+import platform
+import sys
+import tracemalloc
+from dataclasses import asdict
+from itertools import product
+from time import perf_counter
+from typing import List, Optional, Sequence
+
+import numpy as np
+from tqdm import tqdm
+
+from evolutionary_optimization.benchmarks.benchmark_data_model import BenchmarkCase, BenchmarkRegression, \
+    BenchmarkResult
+from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
+from evolutionary_optimization.fitness_functions.fitness_interface import FitnessFunction, FitnessFunctions
+from evolutionary_optimization.genotype.genotype_model.genotype_interface import Genotype, Genotypes
+from evolutionary_optimization.phenotype.phenotype_model.phenotype_interface import Phenotype, Phenotypes
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+HIGHER_IS_BETTER_METRICS = ("generations_per_second", "evaluations_per_second")
+LOWER_IS_BETTER_METRICS = ("peak_rss_bytes", "traced_peak_bytes_per_generation")
+MINIMUM_NUMBER_OF_VARIABLES = {Phenotypes.BOOTH: 2}
+
+
+def sum_of_squares(genotype_matrix: np.ndarray) -> np.ndarray:
+    """Vectorized objective of the FunctionPhenotype benchmark cases, defined at module level to be picklable."""
+    return np.sum(genotype_matrix ** 2, axis=1)
+
+
+def build_benchmark_cases(
+    genotypes: Sequence[Genotypes] = tuple(Genotypes),
+    phenotypes: Sequence[Phenotypes] = tuple(Phenotypes),
+    fitness_functions: Sequence[FitnessFunctions] = tuple(FitnessFunctions),
+    population_sizes: Sequence[int] = (100, 1000),
+    gene_counts: Sequence[int] = (1, 2),
+    use_array_population: Sequence[bool] = (False, True),
+    number_of_generations: int = 10,
+) -> List[BenchmarkCase]:
+    """Build the benchmark cases for every combination of the given parameters.
+
+    Args:
+        genotypes: genotypes to benchmark.
+        phenotypes: phenotypes to benchmark.
+        fitness_functions: fitness functions to benchmark.
+        population_sizes: numbers of individuals to benchmark.
+        gene_counts: numbers of genes to benchmark.
+        use_array_population: population backends to benchmark, False for Population and True for ArrayPopulation.
+        number_of_generations: number of timed generations of each case.
+
+    Returns:
+        List of BenchmarkCase, one per combination.
+    """
+    return [
+        BenchmarkCase(
+            genotype=Genotypes(genotype).value,
+            phenotype=Phenotypes(phenotype).value,
+            fitness_function=FitnessFunctions(fitness_function).value,
+            use_array_population=array_population,
+            number_of_individuals=number_of_individuals,
+            number_of_genes=number_of_genes,
+            number_of_generations=number_of_generations,
+        )
+        for genotype, phenotype, fitness_function, array_population, number_of_individuals, number_of_genes
+        in product(genotypes, phenotypes, fitness_functions, use_array_population, population_sizes, gene_counts)
+    ]
+
+
+def build_evolution(case: BenchmarkCase, seed: int = 0) -> Evolution:
+    """Build the Evolution instance of a benchmark case, seeded so that every run draws the same random numbers."""
+    genotype_class = Genotype.get_genotype(Genotypes(case.genotype))
+    phenotype_class = Phenotype.get_phenotype(Phenotypes(case.phenotype))
+    fitness_function_class = FitnessFunction.get_fitness_function(FitnessFunctions(case.fitness_function))
+    if FitnessFunctions(case.fitness_function) == FitnessFunctions.APPROACH_VALUE:
+        fitness_function = fitness_function_class(expected_value=0)
+    else:
+        fitness_function = fitness_function_class()
+
+    genotype = genotype_class(number_of_genes=case.number_of_genes, mutation_probability=0.1)
+    if Phenotypes(case.phenotype) == Phenotypes.FUNCTION:
+        phenotype = phenotype_class(genotype, sum_of_squares)
+    else:
+        phenotype = phenotype_class(genotype)
+
+    return Evolution(
+        phenotype=phenotype,
+        fitness_function=fitness_function,
+        number_of_individuals=case.number_of_individuals,
+        number_of_generations=case.number_of_generations,
+        use_array_population=case.use_array_population,
+        seed=seed,
+    )
+
+
+def get_skip_reason(case: BenchmarkCase) -> Optional[str]:
+    """Return why a benchmark case combines a genotype and a phenotype that are known to be incompatible.
+
+    Args:
+        case: configuration of the run.
+
+    Returns:
+        The reason, or None if the case can run.
+    """
+    minimum_number_of_variables = MINIMUM_NUMBER_OF_VARIABLES.get(Phenotypes(case.phenotype), 1)
+    genotype = Genotype.get_genotype(Genotypes(case.genotype))(number_of_genes=case.number_of_genes)
+    if genotype.number_of_variables < minimum_number_of_variables:
+        return (f"{case.phenotype} needs {minimum_number_of_variables} genotype values, {case.genotype} with "
+                f"{case.number_of_genes} genes has {genotype.number_of_variables}")
+    return None
+
+
+def run_benchmark_case(case: BenchmarkCase) -> BenchmarkResult:
+    """Measure the throughput and memory use of one benchmark case.
+
+    One untimed generation is run first. The timed generations are followed by one generation traced by
+    tracemalloc.
+
+    Args:
+        case: configuration of the run.
+
+    Returns:
+        BenchmarkResult with the measurements, with the status "skipped" if the genotype and phenotype are known
+            to be incompatible, or with the status "failed" and the error if the run raised an exception.
+    """
+    skip_reason = get_skip_reason(case)
+    if skip_reason is not None:
+        return BenchmarkResult(case=case, status="skipped", reason=skip_reason)
+
+    try:
+        return measure_benchmark_case(case)
+    except Exception as error:
+        return BenchmarkResult(case=case, status="failed", reason=f"{type(error).__name__}: {error}")
+
+
+def measure_benchmark_case(case: BenchmarkCase) -> BenchmarkResult:
+    """Run a benchmark case and return its measurements, exceptions raised by the run are propagated."""
+    evolution = build_evolution(case)
+    evolution.run_generation()
+
+    number_of_evaluations = evolution.population.number_of_evaluations
+    start_time = perf_counter()
+    for generation in range(case.number_of_generations):
+        evolution.run_generation()
+    elapsed_time = perf_counter() - start_time
+    number_of_evaluations = evolution.population.number_of_evaluations - number_of_evaluations
+
+    tracemalloc.start()
+    traced_memory_before, _ = tracemalloc.get_traced_memory()
+    evolution.run_generation()
+    traced_memory_after, traced_peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return BenchmarkResult(
+        case=case,
+        status="ok",
+        generations_per_second=case.number_of_generations / elapsed_time,
+        evaluations_per_second=number_of_evaluations / elapsed_time,
+        peak_rss_bytes=get_peak_rss_bytes(),
+        traced_peak_bytes_per_generation=traced_peak_memory - traced_memory_before,
+        traced_net_bytes_per_generation=traced_memory_after - traced_memory_before,
+    )
+
+
+def get_peak_rss_bytes() -> Optional[int]:
+    """Return the peak resident set size of the current process, None if it is not available on the platform."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def run_benchmark_suite(cases: List[BenchmarkCase], isolate: bool = True) -> List[BenchmarkResult]:
+    """Run benchmark cases one after the other.
+
+    Args:
+        cases: configurations to run.
+        isolate: if True every case runs in a new process, so that its peak RSS is not affected by the
+            previous cases.
+
+    Returns:
+        List of BenchmarkResult in the same order as cases.
+    """
+    if not isolate:
+        return [run_benchmark_case(case) for case in tqdm(cases)]
+
+    with multiprocessing.get_context("spawn").Pool(processes=1, maxtasksperchild=1) as pool:
+        return [pool.apply(run_benchmark_case, (case,)) for case in tqdm(cases)]
+
+
+def save_benchmark_results(path: str, results: List[BenchmarkResult]):
+    """Write benchmark results and a description of the environment to a JSON file."""
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_benchmark_results(path: str) -> List[BenchmarkResult]:
+    """Read benchmark results written by save_benchmark_results."""
+    with open(path) as file:
+        report = json.load(file)
+
+    results = []
+    for result in report["results"]:
+        case = BenchmarkCase(**result.pop("case"))
+        results.append(BenchmarkResult(case=case, **result))
+    return results
+
+
+def compare_benchmark_results(
+    baseline_results: List[BenchmarkResult],
+    current_results: List[BenchmarkResult],
+    tolerance: float = 0.1,
+) -> List[BenchmarkRegression]:
+    """Find the metrics that got worse than in a baseline by more than a tolerance.
+
+    Throughput (generations and evaluations per second) regresses when it decreases, memory (peak RSS and
+    traced peak bytes per generation) regresses when it increases. A case that was measured in the baseline and
+    is skipped or failed in the current results is flagged with the metric "status". Cases missing from one of
+    the lists or not measured in the baseline are ignored.
+
+    Args:
+        baseline_results: results of the reference run, e.g. the last release.
+        current_results: results of the run being checked.
+        tolerance: relative change allowed before a metric is flagged, e.g. 0.1 for 10%.
+
+    Returns:
+        List of BenchmarkRegression, empty if no metric regressed.
+    """
+    baseline_by_key = {result.case.key: result for result in baseline_results if result.status == "ok"}
+    regressions = []
+    for current in current_results:
+        baseline = baseline_by_key.get(current.case.key)
+        if baseline is None:
+            continue
+        if current.status != "ok":
+            regressions.append(BenchmarkRegression(
+                case_key=current.case.key,
+                metric="status",
+                reason=f"{current.status}: {current.reason}",
+            ))
+            continue
+
+        for metric in HIGHER_IS_BETTER_METRICS + LOWER_IS_BETTER_METRICS:
+            baseline_value = getattr(baseline, metric)
+            current_value = getattr(current, metric)
+            if baseline_value is None or current_value is None or baseline_value <= 0:
+                continue
+
+            relative_change = (current_value - baseline_value) / baseline_value
+            has_regressed = relative_change < -tolerance if metric in HIGHER_IS_BETTER_METRICS \
+                else relative_change > tolerance
+            if has_regressed:
+                regressions.append(BenchmarkRegression(
+                    case_key=current.case.key,
+                    metric=metric,
+                    baseline_value=baseline_value,
+                    current_value=current_value,
+                    relative_change=relative_change,
+                ))
+    return regressions
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+class AbstractEvaluator(ABC):
+    @abstractmethod
+    def evaluate(self, phenotype: AbstractPhenotype, genes: np.ndarray) -> np.ndarray:
+        """Calculate the phenotype values of a matrix of genes.
+
+        Args:
+            phenotype: phenotype instance used as a template for all rows.
+            genes: array of shape (number of individuals, number of genes).
+
+        Returns:
+            Array of shape (number of individuals,) with the phenotype value of each row, in the same order.
+        """
+        pass
+
+    def evaluate_individuals(self, phenotype: AbstractPhenotype, individuals: List[AbstractPhenotype]):
+        """In place calculation of the phenotype value of a list of phenotype instances.
+
+        The default implementation stacks the genes of the individuals into a matrix and calls evaluate.
+
+        Args:
+            phenotype: phenotype instance used as a template for all individuals.
+            individuals: phenotype instances whose phenotype_value attribute will be updated.
+        """
+        genes = np.stack([individual.genotype.to_array() for individual in individuals])
+        phenotype_values = self.evaluate(phenotype, genes).tolist()
+        for individual, phenotype_value in zip(individuals, phenotype_values):
+            individual.phenotype_value = phenotype_value
+
+    def close(self):
+        """Release resources held by the evaluator, e.g. worker pools."""
+        pass
+
+    def __enter__(self) -> "AbstractEvaluator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,83 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+class AsyncEvaluator:
+    def __init__(
+        self,
+        max_concurrency: int = 64,
+        timeout: Optional[float] = None,
+        failure_fitness: float = -np.inf,
+    ):
+        """Initialise AsyncEvaluator class.
+
+        The AsyncEvaluator is used by Evolution.evolve_async to evaluate a generation concurrently. It is meant
+        for phenotypes that spend most of their time waiting, e.g. on a subprocess or a network call, and
+        whose evaluate_phenotype is defined with async def. Phenotypes with a regular evaluate_phenotype are
+        run in the event loop's default thread pool.
+
+        Args:
+            max_concurrency: maximum number of evaluations in flight at the same time.
+            timeout: maximum time in seconds allowed for the evaluation of one individual, None for no limit.
+                Evaluations run in a thread cannot be interrupted, they are abandoned once they time out. Each
+                evaluation runs on a copy of the individual, so an abandoned evaluation never writes to it.
+            failure_fitness: fitness score given to individuals whose evaluation timed out.
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.failure_fitness = failure_fitness
+
+    async def evaluate_individuals(self, individuals: List[AbstractPhenotype]) -> np.ndarray:
+        """In place concurrent calculation of the phenotype value of a list of phenotype instances.
+
+        Args:
+            individuals: phenotype instances whose phenotype_value attribute will be updated.
+
+        Returns:
+            Boolean array which is True for the individuals whose evaluation timed out, their phenotype_value
+                is set to NaN.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def evaluate_individual(individual: AbstractPhenotype) -> bool:
+            async with semaphore:
+                individual_copy = individual.copy()
+                try:
+                    await asyncio.wait_for(self._evaluate_phenotype(individual_copy), self.timeout)
+                except asyncio.TimeoutError:
+                    individual.phenotype_value = float("nan")
+                    return True
+                individual.phenotype_value = individual_copy.phenotype_value
+                return False
+
+        failed = await asyncio.gather(*(evaluate_individual(individual) for individual in individuals))
+        return np.asarray(failed, dtype=bool)
+
+    async def evaluate(self, phenotype: AbstractPhenotype, genes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Concurrently calculate the phenotype values of a matrix of genes.
+
+        Args:
+            phenotype: phenotype instance used as a template for all rows.
+            genes: array of shape (number of individuals, number of genes).
+
+        Returns:
+            Tuple of an array with the phenotype value of each row, NaN where the evaluation timed out,
+                and a boolean array which is True for those rows.
+        """
+        genotype = phenotype.genotype
+        individuals = [phenotype.from_genotype(phenotype, genotype.from_array(genotype, row)) for row in genes]
+        failed = await self.evaluate_individuals(individuals)
+        phenotype_values = np.asarray([individual.phenotype_value for individual in individuals], dtype=float)
+        return phenotype_values, failed
+
+    @staticmethod
+    async def _evaluate_phenotype(individual: AbstractPhenotype):
+        """Await evaluate_phenotype, running it in a thread if it is not a coroutine function."""
+        if individual.has_async_evaluation():
+            await individual.evaluate_phenotype()
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, individual.evaluate_phenotype)
@@ -0,0 +1,29 @@
+from enum import Enum
+
+from evolutionary_optimization.evaluators.abstract_evaluator import AbstractEvaluator
+from evolutionary_optimization.evaluators.implemented_evaluators import SerialEvaluator, ThreadPoolEvaluator, \
+    ProcessPoolEvaluator
+from evolutionary_optimization.evaluators.remote_evaluator import RemoteEvaluator
+
+
+class Evaluators(str, Enum):
+    """Enum containing implemented evaluators."""
+    SERIAL = "serial"
+    THREAD_POOL = "thread_pool"
+    PROCESS_POOL = "process_pool"
+    REMOTE = "remote"
+
+
+class Evaluator:
+    """Maps Evaluators to their associated concrete class based on AbstractEvaluator."""
+    evaluators_dictionary = {
+        Evaluators.SERIAL: SerialEvaluator,
+        Evaluators.THREAD_POOL: ThreadPoolEvaluator,
+        Evaluators.PROCESS_POOL: ProcessPoolEvaluator,
+        Evaluators.REMOTE: RemoteEvaluator,
+    }
+
+    @classmethod
+    def get_evaluator(cls, evaluator: Evaluators) -> type(AbstractEvaluator):
+        """Return class of desired AbstractEvaluator."""
+        return cls.evaluators_dictionary[evaluator]
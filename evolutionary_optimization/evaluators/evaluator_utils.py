@@ -0,0 +1,55 @@
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+def evaluate_genes(phenotype: AbstractPhenotype, genes: np.ndarray) -> np.ndarray:
+    """Calculate the phenotype values of a matrix of genes.
+
+    If the phenotype implements evaluate_phenotype_batch all rows are evaluated with a single call,
+    otherwise a phenotype is built for every row and evaluate_phenotype is called on it.
+
+    Args:
+        phenotype: phenotype instance used as a template for all rows.
+        genes: array of shape (number of individuals, number of genes) as stored by the ArrayPopulation.
+
+    Returns:
+        Array of shape (number of individuals,) with the phenotype value of each row.
+    """
+    genotype = phenotype.genotype
+
+    if phenotype.has_batch_evaluation():
+        return np.asarray(phenotype.evaluate_phenotype_batch(genotype.decode_population(genes)), dtype=float)
+
+    phenotype_values = np.empty(len(genes))
+    for i, row in enumerate(genes):
+        individual = phenotype.from_genotype(phenotype, genotype.from_array(genotype, row))
+        individual.evaluate_phenotype()
+        phenotype_values[i] = individual.phenotype_value
+    return phenotype_values
+
+
+def split_into_chunks(genes: np.ndarray, chunk_size: int) -> List[np.ndarray]:
+    """Split a matrix of genes into consecutive chunks of at most chunk_size rows."""
+    return [genes[i:i + chunk_size] for i in range(0, len(genes), chunk_size)]
+
+
+def parse_address(address: str) -> Union[Tuple[str, int], str]:
+    """Parse the address of a RemoteEvaluator given as a string, e.g. on the command line.
+
+    Args:
+        address: either "host:port" for a TCP socket or "unix:path" for a Unix socket.
+
+    Returns:
+        Tuple of host and port for a TCP socket, or the path of a Unix socket, as expected by
+            multiprocessing.connection.
+    """
+    if address.startswith("unix:"):
+        return address[len("unix:"):]
+
+    host, separator, port = address.rpartition(":")
+    if not separator:
+        raise ValueError(f"Address {address} should be host:port or unix:path")
+    return host, int(port)
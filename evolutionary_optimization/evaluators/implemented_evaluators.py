@@ -0,0 +1,105 @@
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional
+
+import numpy as np
+
+from evolutionary_optimization.evaluators.abstract_evaluator import AbstractEvaluator
+from evolutionary_optimization.evaluators.evaluator_utils import evaluate_genes, split_into_chunks
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+class SerialEvaluator(AbstractEvaluator):
+    def evaluate(self, phenotype: AbstractPhenotype, genes: np.ndarray) -> np.ndarray:
+        """Calculate the phenotype values of a matrix of genes in the current thread."""
+        return evaluate_genes(phenotype, genes)
+
+    def evaluate_individuals(self, phenotype: AbstractPhenotype, individuals: List[AbstractPhenotype]):
+        """In place calculation of the phenotype value of a list of phenotype instances.
+
+        If the phenotype implements evaluate_phenotype_batch all individuals are evaluated with a single call,
+        otherwise evaluate_phenotype is called on each individual.
+        """
+        if phenotype.has_batch_evaluation():
+            genotype_matrix = np.asarray([individual.genotype.genotype for individual in individuals])
+            phenotype_values = phenotype.evaluate_phenotype_batch(genotype_matrix).tolist()
+            for individual, phenotype_value in zip(individuals, phenotype_values):
+                individual.phenotype_value = phenotype_value
+        else:
+            for individual in individuals:
+                individual.evaluate_phenotype()
+
+
+class _PoolEvaluator(AbstractEvaluator):
+    def __init__(self, number_of_workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        """Initialise evaluator running on a pool of workers.
+
+        The pool is created on the first call to evaluate and kept alive until close is called,
+        so it is reused across generations.
+
+        Args:
+            number_of_workers: number of workers in the pool, defaults to the number of CPUs.
+            chunk_size: number of individuals sent to a worker at once. Defaults to splitting the
+                population into four chunks per worker.
+        """
+        self.number_of_workers = number_of_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = None
+
+    def _create_executor(self) -> Executor:
+        """Create the pool of workers."""
+        raise NotImplementedError
+
+    def evaluate(self, phenotype: AbstractPhenotype, genes: np.ndarray) -> np.ndarray:
+        """Calculate the phenotype values of a matrix of genes by splitting it in chunks across workers."""
+        if len(genes) == 0:
+            return np.empty(0)
+
+        if self._executor is None:
+            self._executor = self._create_executor()
+
+        chunk_size = self.chunk_size or math.ceil(len(genes) / (self.number_of_workers * 4))
+        chunks = split_into_chunks(genes, chunk_size)
+        return np.concatenate(list(self._executor.map(partial(evaluate_genes, phenotype), chunks)))
+
+    def close(self):
+        """Shut down the pool of workers."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """Evaluator running on a pool of threads, suited to phenotypes that release the GIL or wait on I/O."""
+
+    def _create_executor(self) -> Executor:
+        """Create the pool of threads."""
+        return ThreadPoolExecutor(max_workers=self.number_of_workers)
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    def __init__(
+        self,
+        number_of_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        mp_context=None,
+    ):
+        """Initialise evaluator running on a pool of processes, suited to CPU-bound phenotypes.
+
+        The phenotype and its genotype must be picklable, as they are sent to the worker processes
+        together with each chunk of genes.
+
+        Args:
+            number_of_workers: number of worker processes, defaults to the number of CPUs.
+            chunk_size: number of individuals sent to a worker at once. Defaults to splitting the
+                population into four chunks per worker.
+            mp_context: optional multiprocessing context used to start the worker processes.
+        """
+        super().__init__(number_of_workers, chunk_size)
+        self.mp_context = mp_context
+
+    def _create_executor(self) -> Executor:
+        """Create the pool of processes."""
+        return ProcessPoolExecutor(max_workers=self.number_of_workers, mp_context=self.mp_context)
@@ -0,0 +1,322 @@
+import multiprocessing
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import AuthenticationError, Client, Connection, Listener
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from evolutionary_optimization.evaluators.abstract_evaluator import AbstractEvaluator
+from evolutionary_optimization.evaluators.evaluator_utils import split_into_chunks
+from evolutionary_optimization.evaluators.remote_worker import run_worker
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+class _RemoteWorker:
+    def __init__(self, connection: Connection, name: str):
+        """State kept by the RemoteEvaluator about one connected worker.
+
+        Args:
+            connection: connection to the worker.
+            name: name sent by the worker when it connected.
+        """
+        self.connection = connection
+        self.name = name
+        self.last_seen = time.monotonic()
+        self.batches_in_flight: Dict[int, np.ndarray] = {}
+        self.phenotype_version = -1
+        self.alive = True
+        self.send_lock = threading.Lock()
+
+
+class RemoteEvaluator(AbstractEvaluator):
+    def __init__(
+        self,
+        address: Union[Tuple[str, int], str] = ("127.0.0.1", 0),
+        authentication_key: Optional[bytes] = None,
+        batch_size: int = 64,
+        max_batches_per_worker: int = 2,
+        heartbeat_interval: float = 1.0,
+        heartbeat_timeout: float = 5.0,
+        worker_wait_timeout: Optional[float] = None,
+    ):
+        """Initialise RemoteEvaluator class.
+
+        The RemoteEvaluator is a coordinator that listens on a TCP or Unix socket for workers started with
+        run_evolution_worker, possibly on other machines. Each call to evaluate splits the genes into batches
+        which are sent to the connected workers, and gathers the phenotype values they send back.
+
+        Workers send a heartbeat every heartbeat_interval seconds, also while evaluating a batch. A worker
+        that disconnects or misses heartbeats for heartbeat_timeout seconds is dropped and its batches are
+        queued again for the other workers. A worker never has more than max_batches_per_worker batches in
+        flight, the remaining batches wait on the coordinator until a worker returns a result.
+
+        Messages are pickled, workers should only be connected through a trusted network and an
+        authentication_key should be set when the socket is reachable by other users.
+
+        Args:
+            address: (host, port) of a TCP socket, port 0 picks a free port, or path of a Unix socket.
+                The actual address is stored in the address attribute.
+            authentication_key: optional key shared with the workers, used to authenticate connections.
+            batch_size: number of individuals sent to a worker at once.
+            max_batches_per_worker: maximum number of batches sent to a worker and not yet returned.
+            heartbeat_interval: time in seconds between two heartbeats of a worker.
+            heartbeat_timeout: time in seconds without any message after which a worker is considered dead.
+            worker_wait_timeout: maximum time in seconds evaluate waits while no worker is connected,
+                None to wait indefinitely.
+        """
+        self.authentication_key = authentication_key
+        self.batch_size = batch_size
+        self.max_batches_per_worker = max_batches_per_worker
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.worker_wait_timeout = worker_wait_timeout
+
+        self._condition = threading.Condition()
+        self._workers: List[_RemoteWorker] = []
+        self._pending_batches = deque()
+        self._batches: Dict[int, np.ndarray] = {}
+        self._results: Dict[int, np.ndarray] = {}
+        self._error: Optional[Exception] = None
+        self._next_batch_id = 0
+        self._phenotype = None
+        self._phenotype_version = 0
+        self._local_workers = []
+        self._closed = False
+
+        self._listener = Listener(address, authkey=authentication_key)
+        self.address = self._listener.address
+        self._accept_thread = threading.Thread(target=self._accept_workers, daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def number_of_workers(self) -> int:
+        """Number of workers currently connected."""
+        with self._condition:
+            return len(self._workers)
+
+    def start_local_workers(self, number_of_workers: int, mp_context=None):
+        """Start worker processes on this machine, connected to the coordinator, e.g. to test a setup.
+
+        The processes are stopped by close.
+
+        Args:
+            number_of_workers: number of worker processes to start.
+            mp_context: optional multiprocessing context used to start the worker processes.
+        """
+        context = mp_context if mp_context is not None else multiprocessing.get_context()
+        for i in range(number_of_workers):
+            process = context.Process(
+                target=run_worker,
+                args=(self.address, self.authentication_key),
+                kwargs=dict(name=f"local-worker-{len(self._local_workers)}"),
+                daemon=True,
+            )
+            process.start()
+            self._local_workers.append(process)
+
+    def wait_for_workers(self, number_of_workers: int, timeout: Optional[float] = None) -> bool:
+        """Block until at least number_of_workers workers are connected.
+
+        Args:
+            number_of_workers: number of workers to wait for.
+            timeout: maximum time to wait in seconds, None to wait indefinitely.
+
+        Returns:
+            True if the workers are connected, False if the timeout expired.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._workers) >= number_of_workers, timeout)
+
+    def evaluate(self, phenotype: AbstractPhenotype, genes: np.ndarray) -> np.ndarray:
+        """Calculate the phenotype values of a matrix of genes on the connected workers."""
+        if len(genes) == 0:
+            return np.empty(0)
+
+        with self._condition:
+            if phenotype is not self._phenotype:
+                self._phenotype = phenotype
+                self._phenotype_version += 1
+            self._results = {}
+            self._error = None
+            batch_ids = []
+            for chunk in split_into_chunks(genes, self.batch_size):
+                batch_ids.append(self._next_batch_id)
+                self._batches[self._next_batch_id] = chunk
+                self._pending_batches.append(self._next_batch_id)
+                self._next_batch_id += 1
+
+        try:
+            no_worker_since = time.monotonic()
+            while True:
+                with self._condition:
+                    self._drop_silent_workers()
+                    if self._error is not None:
+                        raise self._error
+                    if len(self._results) == len(batch_ids):
+                        break
+
+                    if self._workers:
+                        no_worker_since = time.monotonic()
+                    elif self.worker_wait_timeout is not None \
+                            and time.monotonic() - no_worker_since > self.worker_wait_timeout:
+                        raise TimeoutError(f"No worker connected to {self.address} for {self.worker_wait_timeout}s")
+
+                    assignments = self._assign_batches()
+                    if not assignments:
+                        self._condition.wait(self.heartbeat_interval)
+
+                for worker, batch_id in assignments:
+                    self._send_batch(worker, batch_id)
+        finally:
+            with self._condition:
+                self._pending_batches.clear()
+                self._batches.clear()
+
+        return np.concatenate([self._results[batch_id] for batch_id in batch_ids])
+
+    def _assign_batches(self) -> List[Tuple[_RemoteWorker, int]]:
+        """Assign pending batches to workers with free slots in a round robin. Called with the lock held."""
+        assignments = []
+        has_free_slots = True
+        while self._pending_batches and has_free_slots:
+            has_free_slots = False
+            for worker in self._workers:
+                if not self._pending_batches:
+                    break
+                if len(worker.batches_in_flight) < self.max_batches_per_worker:
+                    batch_id = self._pending_batches.popleft()
+                    worker.batches_in_flight[batch_id] = self._batches[batch_id]
+                    assignments.append((worker, batch_id))
+                    has_free_slots = True
+        return assignments
+
+    def _send_batch(self, worker: _RemoteWorker, batch_id: int):
+        """Send a batch to a worker, preceded by the phenotype if the worker does not have it yet.
+
+        Called without the lock held, so that a slow send does not block the threads receiving results.
+        """
+        with self._condition:
+            phenotype, phenotype_version = self._phenotype, self._phenotype_version
+            genes = worker.batches_in_flight.get(batch_id)
+        if genes is None:
+            return
+
+        try:
+            with worker.send_lock:
+                if worker.phenotype_version != phenotype_version:
+                    worker.connection.send(("phenotype", phenotype))
+                    worker.phenotype_version = phenotype_version
+                worker.connection.send(("evaluate", (batch_id, genes)))
+        except (OSError, ValueError):
+            with self._condition:
+                self._drop_worker(worker)
+
+    def _drop_silent_workers(self):
+        """Drop the workers that missed their heartbeats. Called with the lock held."""
+        now = time.monotonic()
+        for worker in list(self._workers):
+            if now - worker.last_seen > self.heartbeat_timeout:
+                self._drop_worker(worker)
+
+    def _drop_worker(self, worker: _RemoteWorker):
+        """Stop using a worker and queue its batches again. Called with the lock held.
+
+        The connection is closed by the thread receiving from the worker, once it returns from recv.
+        """
+        if not worker.alive:
+            return
+
+        worker.alive = False
+        self._workers.remove(worker)
+        for batch_id in reversed(list(worker.batches_in_flight)):
+            if batch_id in self._batches and batch_id not in self._results:
+                self._pending_batches.appendleft(batch_id)
+        worker.batches_in_flight.clear()
+        self._condition.notify_all()
+
+    def _accept_workers(self):
+        """Accept connections from workers until the evaluator is closed. Runs in a background thread."""
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+            if self._closed:
+                connection.close()
+                break
+            threading.Thread(target=self._receive_from_worker, args=(connection,), daemon=True).start()
+
+    def _receive_from_worker(self, connection: Connection):
+        """Register a worker and process its messages until it disconnects. Runs in a background thread."""
+        worker = None
+        try:
+            command, name = connection.recv()
+            if command != "hello":
+                return
+            connection.send(("configure", self.heartbeat_interval))
+
+            worker = _RemoteWorker(connection, name)
+            with self._condition:
+                if self._closed:
+                    return
+                self._workers.append(worker)
+                self._condition.notify_all()
+
+            while True:
+                command, payload = connection.recv()
+                with self._condition:
+                    if not worker.alive:
+                        return
+                    worker.last_seen = time.monotonic()
+                    if command == "result":
+                        batch_id, phenotype_values = payload
+                        worker.batches_in_flight.pop(batch_id, None)
+                        if batch_id in self._batches:
+                            self._results[batch_id] = np.asarray(phenotype_values, dtype=float)
+                    elif command == "error":
+                        batch_id, error = payload
+                        worker.batches_in_flight.pop(batch_id, None)
+                        if batch_id in self._batches:
+                            self._error = error
+                    self._condition.notify_all()
+        except (OSError, EOFError, ValueError):
+            pass
+        finally:
+            if worker is not None:
+                with self._condition:
+                    self._drop_worker(worker)
+            connection.close()
+
+    def close(self):
+        """Stop the connected workers, the local worker processes and the listener."""
+        if self._closed:
+            return
+
+        with self._condition:
+            self._closed = True
+            workers = list(self._workers)
+        for worker in workers:
+            try:
+                with worker.send_lock:
+                    worker.connection.send(("stop", None))
+            except (OSError, ValueError):
+                pass
+        with self._condition:
+            for worker in workers:
+                self._drop_worker(worker)
+
+        try:
+            # wake the accept thread up so that it sees the evaluator is closed
+            Client(self.address, authkey=self.authentication_key).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
+        self._accept_thread.join(timeout=self.heartbeat_timeout)
+        self._listener.close()
+
+        for process in self._local_workers:
+            process.join(timeout=self.heartbeat_timeout)
+            if process.is_alive():
+                process.terminate()
+        self._local_workers = []
@@ -0,0 +1,83 @@
+import os
+import socket
+import threading
+import time
+from multiprocessing.connection import Client, Connection
+from typing import Optional, Tuple, Union
+
+from evolutionary_optimization.evaluators.evaluator_utils import evaluate_genes
+
+
+def run_worker(
+    address: Union[Tuple[str, int], str],
+    authentication_key: Optional[bytes] = None,
+    name: Optional[str] = None,
+    connect_timeout: float = 30.0,
+):
+    """Connect to a RemoteEvaluator and evaluate the batches of genes it sends until it stops the worker.
+
+    Args:
+        address: (host, port) of the coordinator's TCP socket or path of its Unix socket.
+        authentication_key: key shared with the coordinator, if it was given one.
+        name: name identifying the worker on the coordinator, defaults to hostname and process id.
+        connect_timeout: time in seconds during which connection attempts are repeated, so that workers
+            can be started before the coordinator.
+    """
+    connection = _connect(address, authentication_key, connect_timeout)
+    name = name if name is not None else f"{socket.gethostname()}-{os.getpid()}"
+    send_lock = threading.Lock()
+
+    connection.send(("hello", name))
+    command, heartbeat_interval = connection.recv()
+
+    stopped = threading.Event()
+    heartbeat_thread = threading.Thread(
+        target=_send_heartbeats,
+        args=(connection, send_lock, heartbeat_interval, stopped),
+        daemon=True,
+    )
+    heartbeat_thread.start()
+
+    phenotype = None
+    try:
+        while True:
+            command, payload = connection.recv()
+            if command == "stop":
+                break
+            elif command == "phenotype":
+                phenotype = payload
+            elif command == "evaluate":
+                batch_id, genes = payload
+                try:
+                    message = ("result", (batch_id, evaluate_genes(phenotype, genes)))
+                except Exception as error:
+                    message = ("error", (batch_id, error))
+                with send_lock:
+                    connection.send(message)
+    except (EOFError, OSError):
+        pass
+    finally:
+        stopped.set()
+        connection.close()
+
+
+def _connect(address: Union[Tuple[str, int], str], authentication_key: Optional[bytes], timeout: float) -> Connection:
+    """Connect to the coordinator, retrying until the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Client(address, authkey=authentication_key)
+        except (ConnectionRefusedError, FileNotFoundError):
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def _send_heartbeats(connection: Connection, send_lock: threading.Lock, interval: float, stopped: threading.Event):
+    """Send a heartbeat to the coordinator every interval seconds until stopped is set."""
+    while not stopped.wait(interval):
+        try:
+            with send_lock:
+                connection.send(("heartbeat", None))
+        except (OSError, ValueError):
+            break
@@ -0,0 +1,330 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from evolutionary_optimization.evaluators.abstract_evaluator import AbstractEvaluator
+from evolutionary_optimization.evaluators.async_evaluator import AsyncEvaluator
+from evolutionary_optimization.evaluators.implemented_evaluators import SerialEvaluator
+from evolutionary_optimization.evolutionary_algorithm.evaluation_cache import EvaluationCache
+from evolutionary_optimization.evolutionary_algorithm.hall_of_fame import HallOfFame
+from evolutionary_optimization.evolutionary_algorithm.stage_timer import StageTimer
+from evolutionary_optimization.fitness_functions.abstract_fitness_function import AbstractFitnessFunction
+from evolutionary_optimization.fitness_functions.fitness_utils import select_top_k
+from evolutionary_optimization.genotype.crossover_operators.abstract_crossover_operator import \
+    AbstractCrossoverOperator
+from evolutionary_optimization.genotype.mutation_operators.abstract_mutation_operator import \
+    AbstractMutationOperator
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+class ArrayPopulation:
+    def __init__(
+        self,
+        number_of_individuals: int,
+        phenotype: AbstractPhenotype,
+        ratio_of_elite_individuals: float,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        hall_of_fame_size: int = 1,
+        evaluator: Optional[AbstractEvaluator] = None,
+        stage_timer: Optional[StageTimer] = None,
+        rng: Optional[np.random.Generator] = None,
+        mutation_operator: Optional[AbstractMutationOperator] = None,
+        crossover_operator: Optional[AbstractCrossoverOperator] = None,
+    ):
+        """Create and store the genes of all individuals used in the Evolution object in numpy arrays.
+
+        The ArrayPopulation is a structure-of-arrays alternative to Population. Instead of keeping one phenotype
+        object per individual it keeps the genes of all individuals in a single matrix (individuals x genes),
+        with parallel arrays for the phenotype values and fitness scores. Phenotype objects are only built
+        on demand, as views of a row, by the population and best_individual attributes.
+
+        A boolean stale array marks the rows whose genes changed since they were last evaluated,
+        only those rows are evaluated and scored by evaluate_population. The number_of_evaluations attribute
+        counts the phenotype evaluations performed, excluding rows found in the evaluation cache.
+
+        Args:
+            number_of_individuals: number of individuals in the desired population.
+            phenotype: a phenotype instance with the desired genotype, used as a template for all individuals.
+            ratio_of_elite_individuals: proportion of best scoring phenotypes in population that will be kept
+                to the next generation.
+            evaluation_cache: optional cache of phenotype values shared across generations.
+            hall_of_fame_size: number of best individuals over the whole run kept in the hall_of_fame attribute.
+            evaluator: evaluator used to calculate phenotype values, defaults to a SerialEvaluator.
+            stage_timer: optional StageTimer measuring the stages of update_population.
+            rng: random generator used to build, shuffle, cross over and mutate the genes, defaults to a new
+                unseeded generator.
+            mutation_operator: operator mutating the genes of all non-elite individuals at once, defaults to
+                the mutate_population method of the genotype.
+            crossover_operator: operator crossing over the genes of all pairs of parents at once, defaults to
+                the crossover_population method of the genotype.
+        """
+        self.number_of_individuals = number_of_individuals
+        self.phenotype = phenotype
+        self.ratio_of_elite_individuals = ratio_of_elite_individuals
+        self.evaluation_cache = evaluation_cache
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.stage_timer = stage_timer if stage_timer is not None else StageTimer(enabled=False)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.mutation_operator = mutation_operator
+        self.crossover_operator = crossover_operator
+        self.mutation = True if phenotype.genotype.mutation_probability > 0 else False
+        self.crossover = True if phenotype.genotype.ratio_of_population_for_crossover > 0 else False
+
+        self.genes = phenotype.genotype.build_random_population(number_of_individuals, self.rng)
+        self.phenotype_values = np.full(number_of_individuals, np.nan)
+        self.fitness_scores = np.full(number_of_individuals, -np.inf)
+        self.stale = np.ones(number_of_individuals, dtype=bool)
+        self.number_of_evaluations = 0
+
+        self.hall_of_fame = HallOfFame(hall_of_fame_size)
+
+    @property
+    def population(self) -> List[AbstractPhenotype]:
+        """List of phenotype views of every individual, for compatibility with Population."""
+        return [self.individual(i) for i in range(self.number_of_individuals)]
+
+    @property
+    def best_individual(self) -> AbstractPhenotype:
+        """Phenotype view of the best individual in the hall of fame, or of the first row before evaluation."""
+        best_entry = self.hall_of_fame.best
+        if best_entry is None:
+            return self._build_phenotype(self.genes[0], None)
+        return self._build_phenotype(best_entry.genes, best_entry.phenotype_value)
+
+    @property
+    def best_fitness_score(self) -> Optional[float]:
+        """Fitness score of the best individual found so far, None before the first evaluation."""
+        best_entry = self.hall_of_fame.best
+        return None if best_entry is None else best_entry.fitness_score
+
+    def individual(self, index: int) -> AbstractPhenotype:
+        """Build a phenotype view of the individual stored in a given row.
+
+        Args:
+            index: row of the individual in the genes matrix.
+
+        Returns:
+            New phenotype instance holding a copy of the individual's genes and its phenotype value.
+        """
+        phenotype_value = None if self.stale[index] else self.phenotype_values[index]
+        return self._build_phenotype(self.genes[index], phenotype_value)
+
+    def _build_phenotype(self, genes: np.ndarray, phenotype_value) -> AbstractPhenotype:
+        """Build a phenotype instance from a row of genes."""
+        genotype = self.phenotype.genotype.from_array(self.phenotype.genotype, genes)
+        phenotype = self.phenotype.from_genotype(self.phenotype, genotype)
+        phenotype.phenotype_value = phenotype_value
+        return phenotype
+
+    def evaluate_population(self, fitness_function: AbstractFitnessFunction):
+        """Calculate phenotype values and fitness scores for stale individuals and update the best individual.
+
+        Args:
+            fitness_function: fitness function used to evaluate the phenotype.
+        """
+        if self.phenotype.has_async_evaluation():
+            raise TypeError("The phenotype has an async evaluate_phenotype method, use Evolution.evolve_async.")
+
+        stale_indices = np.flatnonzero(self.stale)
+        if len(stale_indices) > 0:
+            self.phenotype_values[stale_indices] = self._evaluate_genes(self.genes[stale_indices])
+            self.fitness_scores[stale_indices] = fitness_function.evaluate_batch(self.phenotype_values[stale_indices])
+            self.stale[stale_indices] = False
+
+        self._update_hall_of_fame()
+
+    async def evaluate_population_async(
+        self,
+        fitness_function: AbstractFitnessFunction,
+        async_evaluator: AsyncEvaluator,
+    ):
+        """Asynchronous version of evaluate_population.
+
+        Stale rows are evaluated concurrently by the async_evaluator. Rows whose evaluation timed out get a NaN
+        phenotype value and the async_evaluator's failure_fitness as fitness score.
+
+        Args:
+            fitness_function: fitness function used to evaluate the phenotype.
+            async_evaluator: evaluator used to calculate phenotype values concurrently.
+        """
+        stale_indices = np.flatnonzero(self.stale)
+        if len(stale_indices) > 0:
+            genes = self.genes[stale_indices]
+            phenotype_values = np.full(len(stale_indices), np.nan)
+            missing = np.ones(len(stale_indices), dtype=bool)
+            if self.evaluation_cache is not None:
+                phenotype_values, missing = self.evaluation_cache.lookup(genes)
+
+            failed = np.zeros(len(stale_indices), dtype=bool)
+            if np.any(missing):
+                phenotype_values[missing], failed[missing] = await async_evaluator.evaluate(
+                    self.phenotype, genes[missing],
+                )
+                self.number_of_evaluations += int(np.count_nonzero(missing))
+                if self.evaluation_cache is not None:
+                    stored = missing & ~failed
+                    self.evaluation_cache.store(genes[stored], phenotype_values[stored])
+
+            fitness_scores = fitness_function.evaluate_batch(phenotype_values)
+            fitness_scores[failed] = async_evaluator.failure_fitness
+            self.phenotype_values[stale_indices] = phenotype_values
+            self.fitness_scores[stale_indices] = fitness_scores
+            self.stale[stale_indices] = False
+
+        self._update_hall_of_fame()
+
+    def _update_hall_of_fame(self):
+        """Offer the best individuals of the population to the hall of fame."""
+        candidate_indices = select_top_k(self.fitness_scores, self.hall_of_fame.capacity)
+        self.hall_of_fame.update(
+            genes=self.genes[candidate_indices],
+            phenotype_values=self.phenotype_values[candidate_indices],
+            fitness_scores=self.fitness_scores[candidate_indices],
+        )
+
+    def _evaluate_genes(self, genes: np.ndarray) -> np.ndarray:
+        """Calculate the phenotype values of a matrix of genes with the evaluator, using the evaluation cache."""
+        if self.evaluation_cache is None:
+            self.number_of_evaluations += len(genes)
+            return self.evaluator.evaluate(self.phenotype, genes)
+
+        phenotype_values, missing = self.evaluation_cache.lookup(genes)
+        if np.any(missing):
+            phenotype_values[missing] = self.evaluator.evaluate(self.phenotype, genes[missing])
+            self.number_of_evaluations += int(np.count_nonzero(missing))
+            self.evaluation_cache.store(genes[missing], phenotype_values[missing])
+        return phenotype_values
+
+    def update_population(self, fitness_function: AbstractFitnessFunction):
+        """Update genes matrix following evaluation.
+
+        Follows the same procedure as Population.update_population: the top individuals are kept (elitism),
+        copies of the elite individuals replace randomly chosen non-elite individuals, and the non-elite
+        individuals are updated by crossover and/or mutation. Rows are moved with numpy indexing rather than
+        by copying phenotype objects. Only rows whose genes were changed by crossover or mutation are marked
+        as stale.
+
+        Args:
+            fitness_function: fitness function used to evaluate the phenotype. Fitness scores are taken from
+                the last call to evaluate_population.
+        """
+        with self.stage_timer.stage("split_elite_individuals"):
+            elite_indices, non_elite_indices = self.split_elite_individuals()
+
+        with self.stage_timer.stage("copy_elites"):
+            non_elite_indices = np.concatenate((non_elite_indices[len(elite_indices):], elite_indices))
+            order = np.concatenate((elite_indices, non_elite_indices))
+
+            self.genes = self.genes[order]
+            self.phenotype_values = self.phenotype_values[order]
+            self.fitness_scores = self.fitness_scores[order]
+            self.stale = self.stale[order]
+            previous_genes = self.genes.copy()
+
+        number_of_elite_individuals = len(elite_indices)
+        genotype = self.phenotype.genotype
+
+        if self.crossover:
+            with self.stage_timer.stage("crossover"):
+                number_of_individuals_for_crossover = int(genotype.ratio_of_population_for_crossover
+                                                          * self.number_of_individuals)
+                number_of_individuals_for_crossover = min(number_of_individuals_for_crossover,
+                                                          self.number_of_individuals - number_of_elite_individuals)
+                number_of_pairs = number_of_individuals_for_crossover // 2
+                parents_1 = slice(number_of_elite_individuals, number_of_elite_individuals + number_of_pairs)
+                parents_2 = slice(parents_1.stop, parents_1.stop + number_of_pairs)
+                if number_of_pairs > 0:
+                    if self.crossover_operator is not None:
+                        self.genes[parents_1], self.genes[parents_2] = self.crossover_operator.crossover(
+                            self.genes[parents_1], self.genes[parents_2], genotype, self.rng,
+                        )
+                    else:
+                        self.genes[parents_1], self.genes[parents_2] = genotype.crossover_population(
+                            self.genes[parents_1], self.genes[parents_2], self.rng,
+                        )
+
+        if self.mutation:
+            with self.stage_timer.stage("mutation"):
+                non_elite_genes = self.genes[number_of_elite_individuals:]
+                if self.mutation_operator is not None:
+                    self.genes[number_of_elite_individuals:] = self.mutation_operator.mutate(
+                        non_elite_genes, genotype, self.rng,
+                    )
+                else:
+                    self.genes[number_of_elite_individuals:] = genotype.mutate_population(non_elite_genes, self.rng)
+
+        with self.stage_timer.stage("mark_stale"):
+            self.stale |= np.any(self.genes != previous_genes, axis=1)
+
+    def select_migrants(
+        self,
+        number_of_migrants: int,
+        fitness_function: AbstractFitnessFunction,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return copies of the genes of the best individuals of the population, to be sent to another population.
+
+        The population should have been evaluated since its last update.
+
+        Args:
+            number_of_migrants: number of individuals to return.
+            fitness_function: fitness function used to evaluate the phenotype, fitness scores are taken
+                from the last call to evaluate_population.
+
+        Returns:
+            Tuple of the genes of the migrants, one row per migrant, and their fitness scores.
+        """
+        migrant_indices = select_top_k(self.fitness_scores, number_of_migrants)
+        return self.genes[migrant_indices].copy(), self.fitness_scores[migrant_indices].copy()
+
+    def receive_migrants(self, genes: np.ndarray, fitness_function: AbstractFitnessFunction):
+        """Replace the worst individuals of the population with migrants from another population.
+
+        The population should have been evaluated since its last update.
+
+        Args:
+            genes: genes of the migrants, one row per migrant.
+            fitness_function: fitness function used to evaluate the phenotype, fitness scores are taken
+                from the last call to evaluate_population.
+        """
+        replaced_indices = select_top_k(-self.fitness_scores, len(genes))
+        self.genes[replaced_indices] = genes[:len(replaced_indices)]
+        self.stale[replaced_indices] = True
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Return copies of the arrays describing the population, e.g. to save a checkpoint."""
+        hall_of_fame_state = self.hall_of_fame.get_state()
+        return {
+            "genes": self.genes.copy(),
+            "phenotype_values": self.phenotype_values.copy(),
+            "fitness_scores": self.fitness_scores.copy(),
+            "stale": self.stale.copy(),
+            "number_of_evaluations": np.asarray(self.number_of_evaluations),
+            **{f"hall_of_fame_{key}": value for key, value in hall_of_fame_state.items()},
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """Restore the population from the arrays returned by get_state."""
+        self.genes = np.array(state["genes"])
+        self.phenotype_values = np.array(state["phenotype_values"])
+        self.fitness_scores = np.array(state["fitness_scores"])
+        self.stale = np.array(state["stale"])
+        self.number_of_individuals = len(self.genes)
+        self.number_of_evaluations = int(state["number_of_evaluations"])
+        self.hall_of_fame.set_state({key[len("hall_of_fame_"):]: value for key, value in state.items()
+                                     if key.startswith("hall_of_fame_")})
+
+    def split_elite_individuals(self):
+        """Split row indices into elite and non-elite individuals.
+
+        The elite individuals are selected with argpartition, the rest of the population is not sorted.
+
+        Returns:
+            Tuple of two integer arrays: indices of the elite individuals sorted by descending fitness score,
+                and the shuffled indices of the remaining individuals.
+        """
+        elite_individual_threshold = int(self.number_of_individuals * self.ratio_of_elite_individuals)
+        elite_indices = select_top_k(self.fitness_scores, elite_individual_threshold)
+        is_elite = np.zeros(self.number_of_individuals, dtype=bool)
+        is_elite[elite_indices] = True
+        non_elite_indices = self.rng.permutation(np.flatnonzero(~is_elite))
+        return elite_indices, non_elite_indices
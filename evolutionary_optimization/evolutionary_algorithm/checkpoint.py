@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
+
+
+def save_checkpoint(path: str, state: Dict[str, np.ndarray], compress: bool = False):
+    """Atomically write a dictionary of arrays to a .npz file.
+
+    The arrays are written to a temporary file in the same directory, which then replaces the checkpoint,
+    so a crash during the write leaves the previous checkpoint intact.
+
+    Args:
+        path: path of the checkpoint file.
+        state: dictionary of arrays to save, e.g. returned by Evolution.get_state.
+        compress: if True the arrays are compressed, which makes the file smaller and the write slower.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            if compress:
+                np.savez_compressed(file, **state)
+            else:
+                np.savez(file, **state)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def load_checkpoint(path: str) -> Dict[str, np.ndarray]:
+    """Read a dictionary of arrays written by save_checkpoint."""
+    with np.load(path, allow_pickle=False) as checkpoint:
+        return {key: checkpoint[key] for key in checkpoint.files}
+
+
+def get_random_state(rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Return the state of a random generator as arrays.
+
+    The state of the bit generator holds integers larger than 64 bits, so it is stored as a JSON string.
+    """
+    return {"bit_generator_state": np.asarray(json.dumps(rng.bit_generator.state))}
+
+
+def set_random_state(state: Dict[str, np.ndarray], rng: np.random.Generator):
+    """Restore the state of a random generator from get_random_state arrays."""
+    rng.bit_generator.state = json.loads(str(state["bit_generator_state"]))
+
+
+class Checkpointer:
+    def __init__(
+        self,
+        path: str,
+        every_n_generations: Optional[int] = None,
+        every_n_seconds: Optional[float] = None,
+        compress: bool = False,
+    ):
+        """Initialise Checkpointer class.
+
+        The Checkpointer is passed to Evolution to save its state periodically. A copy of the state is taken
+        between two generations and written to disk by a background thread, so that the main loop only waits
+        for the copy. If a write is still running when the next checkpoint is due, the main loop waits for it.
+
+        Args:
+            path: path of the .npz checkpoint file, overwritten by every checkpoint.
+            every_n_generations: save a checkpoint every this number of generations.
+            every_n_seconds: save a checkpoint when this number of seconds passed since the last checkpoint.
+            compress: if True the arrays are compressed, which makes the file smaller and the write slower.
+        """
+        self.path = path
+        self.every_n_generations = every_n_generations
+        self.every_n_seconds = every_n_seconds
+        self.compress = compress
+        self._last_save_time = time.monotonic()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_write: Optional[Future] = None
+
+    def maybe_save(self, evolution: "Evolution"):
+        """Save a checkpoint if one is due after the current generation of an Evolution instance."""
+        is_due = self.every_n_generations is not None and evolution.generation % self.every_n_generations == 0
+        is_due = is_due or (self.every_n_seconds is not None
+                            and time.monotonic() - self._last_save_time >= self.every_n_seconds)
+        if is_due:
+            self.save(evolution)
+
+    def save(self, evolution: "Evolution"):
+        """Copy the state of an Evolution instance and write it to disk in the background."""
+        self.wait()
+        state = evolution.get_state()
+        self._pending_write = self._executor.submit(save_checkpoint, self.path, state, self.compress)
+        self._last_save_time = time.monotonic()
+
+    def wait(self):
+        """Wait until the last checkpoint is written, raising any error that occurred while writing it."""
+        if self._pending_write is not None:
+            self._pending_write.result()
+            self._pending_write = None
+
+    def close(self):
+        """Wait for the last checkpoint and stop the background thread."""
+        self.wait()
+        self._executor.shutdown()
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Union, List
+from typing import Optional, Union, List
+
+import numpy as np
 
 
 @dataclass
@@ -8,3 +10,28 @@ class PerformancePlotting:
     fitness_over_time: List[Union[float, int]]
     phenotype_over_time: List[Union[float, int]]
     genotype_over_time: List[Union[float, int, List[Union[float, int]]]]
+
+
+@dataclass(frozen=True)
+class GenerationSnapshot:
+    """Dataclass storing a read-only summary of an Evolution run after a generation, yielded by evolve_iter.
+
+    best_genes is a read-only view of the genes of the best individual held by the hall of fame, as returned
+    by genotype.to_array.
+    """
+    generation: int
+    best_fitness_score: Optional[float]
+    best_phenotype_value: Optional[Union[float, int]]
+    best_genes: Optional[np.ndarray]
+    number_of_evaluations: int
+    number_of_evaluations_in_generation: int
+    termination_reason: Optional[str]
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Dataclass storing the wall time and number of calls of a stage of the evolution loop, used by StageTimer."""
+    number_of_calls: int
+    total_seconds: float
+    last_generation_seconds: float
+    mean_seconds_per_generation: float
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class EvaluationCache:
+    def __init__(self, capacity: int = 100000, quantization: Optional[float] = None):
+        """Initialise EvaluationCache class.
+
+        The EvaluationCache memoizes phenotype values across generations. Entries are keyed on a hash of the
+        genes of an individual, so a genotype that was already evaluated in an earlier generation is not
+        evaluated again. When the cache is full the least recently used entry is evicted.
+
+        Args:
+            capacity: maximum number of phenotype values kept in the cache.
+            quantization: if given, genes are rounded to a multiple of this value before hashing, so that
+                float genotypes closer than the quantization share a cache entry.
+        """
+        self.capacity = capacity
+        self.quantization = quantization
+        self.hits = 0
+        self.misses = 0
+        self._phenotype_values = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._phenotype_values)
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion of lookups that were found in the cache."""
+        number_of_lookups = self.hits + self.misses
+        return self.hits / number_of_lookups if number_of_lookups > 0 else 0.0
+
+    def key(self, genes: np.ndarray) -> bytes:
+        """Return the hash of the genes of one individual used as a cache key."""
+        genes = np.asarray(genes)
+        if self.quantization is not None:
+            genes = np.round(genes / self.quantization).astype(np.int64)
+        return blake2b(np.ascontiguousarray(genes).tobytes(), digest_size=16).digest()
+
+    def lookup(self, genes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Look up the phenotype values of a matrix of genes.
+
+        Args:
+            genes: array of shape (number of individuals, number of genes).
+
+        Returns:
+            Tuple of an array of phenotype values, NaN where the individual is not cached, and a boolean array
+                which is True for the individuals that are not cached.
+        """
+        phenotype_values = np.full(len(genes), np.nan)
+        missing = np.ones(len(genes), dtype=bool)
+
+        for i, row in enumerate(genes):
+            key = self.key(row)
+            if key in self._phenotype_values:
+                self._phenotype_values.move_to_end(key)
+                phenotype_values[i] = self._phenotype_values[key]
+                missing[i] = False
+
+        number_of_misses = int(np.count_nonzero(missing))
+        self.misses += number_of_misses
+        self.hits += len(genes) - number_of_misses
+        return phenotype_values, missing
+
+    def store(self, genes: np.ndarray, phenotype_values: np.ndarray):
+        """Add the phenotype values of a matrix of genes to the cache, evicting the least recently used entries.
+
+        Args:
+            genes: array of shape (number of individuals, number of genes).
+            phenotype_values: phenotype value of each row of genes.
+        """
+        for row, phenotype_value in zip(genes, phenotype_values):
+            key = self.key(row)
+            self._phenotype_values[key] = phenotype_value
+            self._phenotype_values.move_to_end(key)
+
+        while len(self._phenotype_values) > self.capacity:
+            self._phenotype_values.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        self._phenotype_values.clear()
+        self.hits = 0
+        self.misses = 0
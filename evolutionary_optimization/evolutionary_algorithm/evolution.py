@@ -1,14 +1,30 @@
+from typing import Dict, Iterator, List, Optional, Union
+
 import numpy as np
 from matplotlib import pyplot as plt, cm
 from tqdm import tqdm
 
-from evolutionary_optimization.evolutionary_algorithm.ea_data_model import PerformancePlotting
+from evolutionary_optimization.evaluators.abstract_evaluator import AbstractEvaluator
+from evolutionary_optimization.evaluators.async_evaluator import AsyncEvaluator
+from evolutionary_optimization.evolutionary_algorithm.array_population import ArrayPopulation
+from evolutionary_optimization.evolutionary_algorithm.checkpoint import Checkpointer, get_random_state, \
+    load_checkpoint, set_random_state
+from evolutionary_optimization.evolutionary_algorithm.ea_data_model import GenerationSnapshot
 from evolutionary_optimization.evolutionary_algorithm.ea_utils import CreateGif2D, CreateGif3D
+from evolutionary_optimization.evolutionary_algorithm.evaluation_cache import EvaluationCache
+from evolutionary_optimization.evolutionary_algorithm.performance_recorder import PerformanceRecorder
 from evolutionary_optimization.evolutionary_algorithm.population import Population
+from evolutionary_optimization.evolutionary_algorithm.stage_timer import StageTimer
 from evolutionary_optimization.fitness_functions.abstract_fitness_function import AbstractFitnessFunction
 from evolutionary_optimization.fitness_functions.implemented_fitness_functions import MaximizeFitnessFunction
+from evolutionary_optimization.genotype.crossover_operators.abstract_crossover_operator import \
+    AbstractCrossoverOperator
+from evolutionary_optimization.genotype.mutation_operators.abstract_mutation_operator import \
+    AbstractMutationOperator
 from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
 from evolutionary_optimization.phenotype.phenotype_model.phenotype_utils import PlottingData
+from evolutionary_optimization.termination_criteria.abstract_termination_criterion import \
+    AbstractTerminationCriterion
 
 
 class Evolution:
@@ -19,6 +35,17 @@ class Evolution:
         number_of_individuals: int = 100,
         number_of_generations: int = 20,
         ratio_of_elite_individuals: float = 0.1,
+        use_array_population: bool = False,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        hall_of_fame_size: int = 1,
+        evaluator: Optional[AbstractEvaluator] = None,
+        termination_criteria: Optional[List[AbstractTerminationCriterion]] = None,
+        checkpointer: Optional[Checkpointer] = None,
+        performance_recorder: Optional[PerformanceRecorder] = None,
+        stage_timer: Optional[StageTimer] = None,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        mutation_operator: Optional[AbstractMutationOperator] = None,
+        crossover_operator: Optional[AbstractCrossoverOperator] = None,
     ):
         """Initialise Evolution class.
 
@@ -30,51 +57,285 @@ class Evolution:
             phenotype: a phenotype instance with the desired genotype.
             fitness_function: desired fitness function from interface.
             number_of_individuals: number of phenotype instances to be used within the population.
-            number_of_generations: number of times the algorithm will be run.
+            number_of_generations: maximum number of times the algorithm will be run.
             ratio_of_elite_individuals: proportion of best scoring phenotypes in population that will be kept
                 to the next generation.
+            use_array_population: if True the population is stored in an ArrayPopulation, which keeps the genes
+                of all individuals in a single numpy matrix, instead of a list of phenotype instances.
+            evaluation_cache: optional EvaluationCache used to memoize phenotype values across generations,
+                useful when the phenotype is expensive to evaluate.
+            hall_of_fame_size: number of best individuals over the whole run kept in population.hall_of_fame.
+            evaluator: evaluator used to calculate phenotype values, e.g. a ProcessPoolEvaluator to spread
+                evaluation over several cores. Defaults to a SerialEvaluator.
+            termination_criteria: optional list of termination criteria checked after every generation, the run
+                stops before number_of_generations as soon as one of them is met. The reason for stopping is
+                stored in the termination_reason attribute.
+            checkpointer: optional Checkpointer saving the state of the run periodically, a run can then be
+                continued with resume.
+            performance_recorder: PerformanceRecorder storing the best individual of each generation in the
+                performance_over_time attribute, e.g. with decimation or streaming to a file for very long runs.
+                Defaults to a PerformanceRecorder keeping every generation in memory.
+            stage_timer: optional StageTimer measuring the wall time of each stage of a generation, and
+                optionally profiling some generations. Timing is disabled by default.
+            seed: seed of the random generator of the run, or a SeedSequence e.g. spawned for an island. All
+                random numbers of the run (initial population, shuffling, crossover and mutation) are drawn from
+                the rng attribute, so two runs with the same seed and a deterministic phenotype are identical.
+                Defaults to fresh entropy from the operating system.
+            mutation_operator: optional operator mutating the genes of all non-elite individuals at once, e.g. a
+                GaussianMutationOperator with per-gene probabilities and bound handling. Defaults to the
+                mutate_population method of the genotype.
+            crossover_operator: optional operator crossing over the genes of all pairs of parents at once, e.g. a
+                TwoPointCrossoverOperator or a BlendCrossoverOperator for float genotypes. Defaults to the
+                crossover_population method of the genotype, a single point crossover.
         """
-        self.population = Population(number_of_individuals, phenotype, ratio_of_elite_individuals)
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        self.stage_timer = stage_timer if stage_timer is not None else StageTimer(enabled=False)
+        population_class = ArrayPopulation if use_array_population else Population
+        self.population = population_class(
+            number_of_individuals=number_of_individuals,
+            phenotype=phenotype,
+            ratio_of_elite_individuals=ratio_of_elite_individuals,
+            evaluation_cache=evaluation_cache,
+            hall_of_fame_size=hall_of_fame_size,
+            evaluator=evaluator,
+            stage_timer=self.stage_timer,
+            rng=self.rng,
+            mutation_operator=mutation_operator,
+            crossover_operator=crossover_operator,
+        )
         self.epochs = number_of_generations
+        self.generation = 0
         self.fitness_function = fitness_function
-        self.performance_over_time = PerformancePlotting(
-            fitness_over_time=[],
-            phenotype_over_time=[],
-            genotype_over_time=[],
-        )
+        self.termination_criteria = termination_criteria if termination_criteria is not None else []
+        self.termination_reason: Optional[str] = None
+        self.checkpointer = checkpointer
+        self.performance_over_time = performance_recorder if performance_recorder is not None \
+            else PerformanceRecorder()
 
     def evolve(self):
         """Perform evolutionary optimisation.
 
         This function performs the evolutionary optimisation. Over number_of_generations it evaluates the population,
         updates the population (with crossover and/ or mutation as initialised). It then records the
-        best fitness score at each generation.
+        best fitness score at each generation. The run stops early if one of the termination criteria is met.
+        After a call to resume the run continues from the generation stored in the checkpoint.
+        """
+        progress_bar = tqdm(self.evolve_iter(), initial=self.generation, total=self.epochs)
+        for snapshot in progress_bar:
+            if self.stage_timer.show_in_progress_bar:
+                progress_bar.set_postfix(self.stage_timer.postfix(), refresh=False)
+
+        self.print_result()
+
+    def evolve_iter(self) -> Iterator[GenerationSnapshot]:
+        """Perform evolutionary optimisation one generation at a time.
+
+        This generator runs a generation each time the next snapshot is requested, so the caller can interleave
+        the run with other work, throttle it, or stop it by not requesting more snapshots. The snapshots
+        reference the best genes held by the hall of fame through a read-only view, the population is not copied.
+        The run ends after the snapshot of the last generation, whose termination_reason is set.
+
+        Yields:
+            GenerationSnapshot of the run after each generation.
         """
-        for epoch in tqdm(range(self.epochs)):
+        self.reset_termination_criteria()
+        try:
+            for epoch in range(self.generation, self.epochs):
+                number_of_evaluations = self.population.number_of_evaluations
+                self.run_generation()
+                self.complete_generation()
+
+                yield self.get_snapshot(self.population.number_of_evaluations - number_of_evaluations)
+                if self.termination_reason is not None:
+                    break
+            else:
+                self.termination_reason = f"Reached number_of_generations ({self.epochs})"
+        finally:
+            self.finish_run()
+
+    def get_snapshot(self, number_of_evaluations_in_generation: int = 0) -> GenerationSnapshot:
+        """Return a read-only summary of the run after the current generation, without copying the population.
+
+        Args:
+            number_of_evaluations_in_generation: number of phenotype evaluations performed by the last generation.
+        """
+        best_entry = self.population.hall_of_fame.best
+        best_genes = None
+        if best_entry is not None:
+            best_genes = best_entry.genes.view()
+            best_genes.flags.writeable = False
+
+        return GenerationSnapshot(
+            generation=self.generation,
+            best_fitness_score=None if best_entry is None else best_entry.fitness_score,
+            best_phenotype_value=None if best_entry is None else best_entry.phenotype_value,
+            best_genes=best_genes,
+            number_of_evaluations=self.population.number_of_evaluations,
+            number_of_evaluations_in_generation=number_of_evaluations_in_generation,
+            termination_reason=self.termination_reason,
+        )
+
+    def run_generation(self):
+        """Evaluate and update the population once, then record the performance of the best individual."""
+        self.stage_timer.start_generation(self.generation)
+        with self.stage_timer.stage("evaluate_population"):
             self.population.evaluate_population(self.fitness_function)
-            self.population.update_population(self.fitness_function)
+        self.update_and_record_generation()
+
+    async def run_generation_async(self, async_evaluator: AsyncEvaluator):
+        """Asynchronous version of run_generation, evaluating the population concurrently."""
+        self.stage_timer.start_generation(self.generation)
+        with self.stage_timer.stage("evaluate_population"):
+            await self.population.evaluate_population_async(self.fitness_function, async_evaluator)
+        self.update_and_record_generation()
+
+    def update_and_record_generation(self):
+        """Update the evaluated population, record the performance of the best individual, save a checkpoint if
+        one is due and end the generation.
+
+        The checkpoint is saved before the generation ends, so that its time is part of the generation in the
+        report of the stage timer and in the profiled generations.
+        """
+        self.population.update_population(self.fitness_function)
+        with self.stage_timer.stage("record_performance"):
             self.record_performance()
+        self.generation += 1
+        with self.stage_timer.stage("checkpoint"):
+            self.save_checkpoint_if_due()
+        self.stage_timer.end_generation()
+
+    def complete_generation(self) -> bool:
+        """Check whether the run should stop after this generation.
+
+        Returns:
+            True if the run should stop, the reason is then stored in termination_reason.
+        """
+        if not self.check_termination_criteria() and self.generation >= self.epochs:
+            self.termination_reason = f"Reached number_of_generations ({self.epochs})"
+        return self.termination_reason is not None
 
+    def finish_run(self):
+        """Flush the performance recorder and wait for the checkpoint being written, at the end of a run."""
+        self.performance_over_time.flush()
+        if self.checkpointer is not None:
+            self.checkpointer.wait()
+
+    def print_result(self):
+        """Print the reason the run stopped and the genotype of the best individual."""
+        print(f"{self.termination_reason}.")
         print(f"The value of the best individual is {self.population.best_individual.genotype.genotype}")
 
+    def save_checkpoint_if_due(self):
+        """Save a checkpoint with the checkpointer, if there is one and a checkpoint is due."""
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save(self)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Return the state of the run as a dictionary of arrays.
+
+        The state holds the population, the hall of fame, the performance history, the generation counter and
+        the state of the random generator.
+        """
+        population_state = self.population.get_state()
+        performance_state = self.performance_over_time.get_state()
+        random_state = get_random_state(self.rng)
+        return {
+            "generation": np.asarray(self.generation),
+            **{f"population_{key}": value for key, value in population_state.items()},
+            **{f"performance_{key}": value for key, value in performance_state.items()},
+            **{f"random_{key}": value for key, value in random_state.items()},
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """Restore the state of the run from the arrays returned by get_state."""
+        self.generation = int(state["generation"])
+        self.population.set_state({key[len("population_"):]: value for key, value in state.items()
+                                   if key.startswith("population_")})
+        self.performance_over_time.set_state({key[len("performance_"):]: value for key, value in state.items()
+                                              if key.startswith("performance_")})
+        set_random_state({key[len("random_"):]: value for key, value in state.items()
+                          if key.startswith("random_")}, self.rng)
+
+    def resume(self, path: str):
+        """Restore the state of a run from a checkpoint, the next call to evolve continues that run.
+
+        The Evolution instance should be created with the same arguments as the one that saved the checkpoint.
+        With a deterministic phenotype the resumed run produces the same populations as an uninterrupted run.
+        The evaluation cache and the state of the termination criteria are not part of the checkpoint,
+        so the termination criteria start over when the run is resumed.
+
+        Args:
+            path: path of a checkpoint saved by a Checkpointer.
+        """
+        self.set_state(load_checkpoint(path))
+
+    def reset_termination_criteria(self):
+        """Reset the termination criteria and the termination reason at the start of a run."""
+        self.termination_reason = None
+        for criterion in self.termination_criteria:
+            criterion.reset()
+
+    def check_termination_criteria(self) -> bool:
+        """Check whether the run should stop after the current generation and record the reason.
+
+        All termination criteria are checked, so that stateful criteria see every generation.
+
+        Returns:
+            True if one of the termination criteria is met.
+        """
+        met_criteria = [criterion for criterion in self.termination_criteria if criterion.is_met(self)]
+        if met_criteria:
+            self.termination_reason = met_criteria[0].reason
+        return self.termination_reason is not None
+
+    async def evolve_async(self, async_evaluator: Optional[AsyncEvaluator] = None):
+        """Perform evolutionary optimisation, evaluating each generation concurrently.
+
+        This is the asynchronous version of evolve, to be used with phenotypes whose evaluate_phenotype is defined
+        with async def, e.g. phenotypes waiting on external solvers. The stale individuals of a generation are
+        evaluated concurrently by the async_evaluator.
+
+        Args:
+            async_evaluator: evaluator setting the maximum number of concurrent evaluations, the timeout of
+                an evaluation and the fitness score of individuals that time out. Defaults to AsyncEvaluator().
+        """
+        async_evaluator = async_evaluator if async_evaluator is not None else AsyncEvaluator()
+
+        self.reset_termination_criteria()
+        try:
+            for epoch in tqdm(range(self.generation, self.epochs), initial=self.generation, total=self.epochs):
+                await self.run_generation_async(async_evaluator)
+                if self.complete_generation():
+                    break
+            else:
+                self.termination_reason = f"Reached number_of_generations ({self.epochs})"
+        finally:
+            self.finish_run()
+
+        self.print_result()
+
     def record_performance(self):
         """In place addition of fitness score, phenotype and genotype values of the current best individual.
 
         This function performs in place addition of the current best fitness score, phenotype value
-        and genotype value to the performance_over_time attribute.
+        and genotype value to the performance_over_time attribute. The fitness score stored in the hall of fame
+        is recorded, the fitness function is not evaluated again.
         You can visualise fitness over time using the plot_fitness_score_over_time function, and you can visualise
         phenotype and genotype values over time using plot_phenotype_function_and_best_individuals function.
         """
-        self.performance_over_time.fitness_over_time.append(self.fitness_function.evaluate(
-            phenotype=self.population.best_individual)
+        best_individual = self.population.best_individual
+        self.performance_over_time.record(
+            generation=self.generation,
+            fitness_score=self.population.best_fitness_score,
+            phenotype_value=best_individual.phenotype_value,
+            genotype=best_individual.genotype.genotype,
         )
-        self.performance_over_time.phenotype_over_time.append(self.population.best_individual.phenotype_value)
-        self.performance_over_time.genotype_over_time.append(self.population.best_individual.genotype.genotype)
 
     def plot_fitness_score_over_time(self):
         """Plot score of the best individual at each generation."""
-        x_axis = list(range(0, len(self.performance_over_time.fitness_over_time)))
-        plt.plot(x_axis, self.performance_over_time.fitness_over_time)
+        records = self.performance_over_time.records
+        plt.plot(records["generation"], records["fitness_score"])
         plt.title('Algorithm Performance Over Time')
         plt.xlabel('Epoch')
         plt.ylabel('Fitness score')
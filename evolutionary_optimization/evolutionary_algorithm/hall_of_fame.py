@@ -0,0 +1,88 @@
+import heapq
+from dataclasses import dataclass
+from itertools import count
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class HallOfFameEntry:
+    """Dataclass storing the genes, phenotype value and fitness score of an individual in the HallOfFame."""
+    genes: np.ndarray
+    phenotype_value: Union[float, int]
+    fitness_score: float
+
+
+class HallOfFame:
+    def __init__(self, capacity: int = 1):
+        """Initialise HallOfFame class.
+
+        The HallOfFame keeps the best individuals found over a whole run. It is a bounded min-heap on fitness
+        score, so adding a candidate costs O(log capacity), and it stores a copy of the genes of each individual
+        rather than a copy of the phenotype object. Individuals with genes already in the hall of fame are
+        not added again. When fitness scores are equal the individual found first is ranked higher.
+
+        Args:
+            capacity: maximum number of individuals kept.
+        """
+        self.capacity = capacity
+        self._heap = []
+        self._keys = set()
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def best(self) -> Optional[HallOfFameEntry]:
+        """Entry with the highest fitness score, None if the hall of fame is empty."""
+        if not self._heap:
+            return None
+        return max(self._heap)[2]
+
+    @property
+    def entries(self) -> List[HallOfFameEntry]:
+        """All entries sorted by descending fitness score."""
+        return [item[2] for item in sorted(self._heap, reverse=True)]
+
+    def update(self, genes: np.ndarray, phenotype_values: np.ndarray, fitness_scores: np.ndarray):
+        """Offer candidate individuals to the hall of fame.
+
+        Args:
+            genes: array of shape (number of candidates, number of genes).
+            phenotype_values: phenotype value of each candidate.
+            fitness_scores: fitness score of each candidate.
+        """
+        for row, phenotype_value, fitness_score in zip(genes, phenotype_values, fitness_scores):
+            if len(self._heap) == self.capacity and fitness_score <= self._heap[0][0]:
+                continue
+
+            key = np.ascontiguousarray(row).tobytes()
+            if key in self._keys:
+                continue
+
+            entry = HallOfFameEntry(genes=np.array(row), phenotype_value=phenotype_value, fitness_score=fitness_score)
+            item = (fitness_score, -next(self._counter), entry, key)
+            if len(self._heap) < self.capacity:
+                heapq.heappush(self._heap, item)
+            else:
+                removed_item = heapq.heapreplace(self._heap, item)
+                self._keys.discard(removed_item[3])
+            self._keys.add(key)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Return the entries as arrays, sorted by descending fitness score, e.g. to save a checkpoint."""
+        entries = self.entries
+        return {
+            "genes": np.array([entry.genes for entry in entries]),
+            "phenotype_values": np.array([entry.phenotype_value for entry in entries]),
+            "fitness_scores": np.array([entry.fitness_score for entry in entries], dtype=float),
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """Replace the entries with the ones returned by get_state, keeping their ranking."""
+        self._heap = []
+        self._keys = set()
+        self._counter = count()
+        self.update(state["genes"], state["phenotype_values"], state["fitness_scores"])
@@ -0,0 +1,332 @@
+import multiprocessing
+import os
+from enum import Enum
+from typing import List, Optional, Tuple
+
+import numpy as np
+from tqdm import tqdm
+
+from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
+from evolutionary_optimization.evolutionary_algorithm.performance_recorder import PerformanceRecorder
+from evolutionary_optimization.fitness_functions.abstract_fitness_function import AbstractFitnessFunction
+from evolutionary_optimization.fitness_functions.implemented_fitness_functions import MaximizeFitnessFunction
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+class MigrationTopologies(str, Enum):
+    """Enum containing the implemented migration topologies of the IslandModel."""
+    RING = "ring"
+    FULLY_CONNECTED = "fully_connected"
+    RANDOM = "random"
+
+
+class IslandModel:
+    def __init__(
+        self,
+        phenotype: AbstractPhenotype,
+        fitness_function: AbstractFitnessFunction = MaximizeFitnessFunction(),
+        number_of_islands: int = 4,
+        number_of_individuals: int = 100,
+        number_of_generations: int = 20,
+        ratio_of_elite_individuals: float = 0.1,
+        migration_interval: int = 5,
+        number_of_migrants: int = 1,
+        migration_topology: MigrationTopologies = MigrationTopologies.RING,
+        seed: Optional[int] = None,
+        mp_context=None,
+        **evolution_kwargs,
+    ):
+        """Initialise IslandModel class.
+
+        The IslandModel runs several independent Evolution instances (islands), each in its own process and
+        with its own random number stream. Every migration_interval generations the best individuals of each
+        island replace the worst individuals of its neighbours, as defined by the migration topology.
+
+        Args:
+            phenotype: a phenotype instance with the desired genotype.
+            fitness_function: desired fitness function from interface.
+            number_of_islands: number of populations, each evolved in a separate process.
+            number_of_individuals: number of individuals in the population of each island.
+            number_of_generations: number of times the algorithm will be run on each island.
+            ratio_of_elite_individuals: proportion of best scoring phenotypes in population that will be kept
+                to the next generation.
+            migration_interval: number of generations between two migrations.
+            number_of_migrants: number of individuals received by each island at every migration.
+            migration_topology: defines from which islands an island receives migrants. With RING island i
+                receives from island i - 1, with FULLY_CONNECTED it receives the best migrants of all other
+                islands and with RANDOM it receives from one other island chosen at random at every migration.
+            seed: seed of the RANDOM topology and of the SeedSequence the random generators of the islands are
+                spawned from.
+            mp_context: optional multiprocessing context used to start the island processes.
+            evolution_kwargs: further keyword arguments passed to the Evolution instance of every island, e.g.
+                genotype_kwargs, use_array_population or termination_criteria. The initial capacity, decimation
+                and stream path of a performance_recorder are used by the recorders of the IslandModel, the stream
+                path of the recorder of island i gets an "_island_i" suffix. Every island checks its own copy of
+                the termination_criteria after each generation and the IslandModel stops at the end of the
+                migration interval in which one of the islands met them. A checkpointer is not supported.
+
+        Raises:
+            ValueError: if a checkpointer is given, the islands can not be checkpointed.
+        """
+        if evolution_kwargs.get("checkpointer") is not None:
+            raise ValueError("The IslandModel does not support a checkpointer, the islands run in separate processes "
+                             "and their state can not be saved.")
+
+        self.phenotype = phenotype
+        self.fitness_function = fitness_function
+        self.number_of_islands = number_of_islands
+        self.epochs = number_of_generations
+        self.migration_interval = migration_interval
+        self.number_of_migrants = number_of_migrants
+        self.migration_topology = migration_topology
+        self.mp_context = mp_context
+        self.evolution_kwargs = dict(
+            phenotype=phenotype,
+            fitness_function=fitness_function,
+            number_of_individuals=number_of_individuals,
+            number_of_generations=number_of_generations,
+            ratio_of_elite_individuals=ratio_of_elite_individuals,
+            **evolution_kwargs,
+        )
+
+        seed_sequence = np.random.SeedSequence(seed)
+        self.island_seeds = seed_sequence.spawn(number_of_islands)
+        self.rng = np.random.default_rng(seed_sequence)
+
+        performance_recorder = evolution_kwargs.get("performance_recorder")
+        self.performance_over_time = build_performance_recorder(performance_recorder)
+        self.island_performance_over_time = [
+            build_performance_recorder(performance_recorder, island) for island in range(number_of_islands)
+        ]
+        self.best_genes = None
+        self.best_phenotype_value = None
+        self.best_fitness_score = None
+        self.termination_reason: Optional[str] = None
+        self._connections = []
+        self._processes = []
+
+    @property
+    def best_individual(self) -> Optional[AbstractPhenotype]:
+        """New phenotype instance built from the best individual over all islands, None before evolve."""
+        if self.best_genes is None:
+            return None
+
+        genotype = self.phenotype.genotype.from_array(self.phenotype.genotype, self.best_genes)
+        best_individual = self.phenotype.from_genotype(self.phenotype, genotype)
+        best_individual.phenotype_value = self.best_phenotype_value
+        best_individual.fitness_score = self.best_fitness_score
+        return best_individual
+
+    def evolve(self):
+        """Perform evolutionary optimisation on all islands, with periodic migration.
+
+        The per island history of the best individual is stored in island_performance_over_time and the best
+        individual over all islands at every generation is stored in performance_over_time. The run stops early,
+        at the end of a migration interval, if one of the islands met its termination criteria. The reason the run
+        stopped is stored in the termination_reason attribute.
+        """
+        self.termination_reason = None
+        self._start_islands()
+        try:
+            generation = 0
+            with tqdm(total=self.epochs) as progress_bar:
+                while generation < self.epochs:
+                    number_of_generations = min(self.migration_interval, self.epochs - generation)
+                    island_results = self._call_islands([("evolve", number_of_generations)] * self.number_of_islands)
+                    self._record_performance([records for records, _ in island_results])
+                    generation += number_of_generations
+                    progress_bar.update(number_of_generations)
+
+                    island_termination_reasons = [
+                        f"Island {island}: {termination_reason}"
+                        for island, (_, termination_reason) in enumerate(island_results)
+                        if termination_reason is not None
+                    ]
+                    if island_termination_reasons:
+                        self.termination_reason = island_termination_reasons[0]
+                        break
+
+                    if generation < self.epochs and self.number_of_islands > 1:
+                        self.migrate()
+                else:
+                    self.termination_reason = f"Reached number_of_generations ({self.epochs})"
+
+            island_bests = self._call_islands([("best", None)] * self.number_of_islands)
+            self.best_genes, self.best_phenotype_value, self.best_fitness_score = max(
+                island_bests, key=lambda island_best: island_best[2],
+            )
+        finally:
+            self._stop_islands()
+            self.performance_over_time.flush()
+            for island_performance in self.island_performance_over_time:
+                island_performance.flush()
+
+        print(f"{self.termination_reason}.")
+        print(f"The value of the best individual is {self.best_individual.genotype.genotype}")
+
+    def migrate(self):
+        """Send the best individuals of every island to its neighbours in the migration topology."""
+        migrants = self._call_islands([("select_migrants", self.number_of_migrants)] * self.number_of_islands)
+
+        commands = []
+        for sources in self._migration_sources():
+            genes = np.concatenate([migrants[source][0] for source in sources])
+            fitness_scores = np.concatenate([migrants[source][1] for source in sources])
+            best_migrants = np.argsort(-fitness_scores, kind="stable")[:self.number_of_migrants]
+            commands.append(("receive_migrants", genes[best_migrants]))
+
+        self._call_islands(commands)
+
+    def _migration_sources(self) -> List[List[int]]:
+        """Return, for every island, the list of islands it receives migrants from."""
+        islands = range(self.number_of_islands)
+        if self.migration_topology == MigrationTopologies.RING:
+            return [[(island - 1) % self.number_of_islands] for island in islands]
+        if self.migration_topology == MigrationTopologies.FULLY_CONNECTED:
+            return [[source for source in islands if source != island] for island in islands]
+        if self.migration_topology == MigrationTopologies.RANDOM:
+            return [[int(self.rng.choice([source for source in islands if source != island]))]
+                    for island in islands]
+        raise NameError(f"Unknown migration topology {self.migration_topology}")
+
+    def _record_performance(self, island_records: List[np.ndarray]):
+        """Record the best individual of each island and of all islands for every generation of an interval.
+
+        Args:
+            island_records: one structured array per island, with one record per generation of the interval.
+        """
+        for island_performance, records in zip(self.island_performance_over_time, island_records):
+            for record in records:
+                _record(island_performance, record)
+
+        for generation in range(len(island_records[0])):
+            best_record = max((records[generation] for records in island_records),
+                              key=lambda record: record["fitness_score"])
+            _record(self.performance_over_time, best_record)
+
+    def _start_islands(self):
+        """Start one process per island."""
+        context = self.mp_context if self.mp_context is not None else multiprocessing.get_context()
+        for seed in self.island_seeds:
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_run_island,
+                args=(child_connection, self.evolution_kwargs, seed),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+
+    def _call_islands(self, commands: List[Tuple[str, object]]) -> list:
+        """Send one command to every island, then wait for all the results."""
+        for connection, command in zip(self._connections, commands):
+            connection.send(command)
+
+        results = [connection.recv() for connection in self._connections]
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    def _stop_islands(self):
+        """Stop the island processes."""
+        for connection in self._connections:
+            try:
+                connection.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+
+def build_performance_recorder(
+    performance_recorder: Optional[PerformanceRecorder] = None,
+    island: Optional[int] = None,
+) -> PerformanceRecorder:
+    """Build an empty PerformanceRecorder of an IslandModel with the settings of the given recorder.
+
+    Args:
+        performance_recorder: recorder whose initial capacity, decimation and stream path are used, defaults to
+            a PerformanceRecorder keeping every generation in memory.
+        island: index of the island recorded, None for the best individual over all islands. The stream path of
+            an island recorder gets an "_island_i" suffix, so that every recorder writes its own file.
+
+    Returns:
+        New PerformanceRecorder instance.
+    """
+    if performance_recorder is None:
+        return PerformanceRecorder()
+
+    stream_path = performance_recorder.stream_path
+    if stream_path is not None and island is not None:
+        root, extension = os.path.splitext(stream_path)
+        stream_path = f"{root}_island_{island}{extension}"
+    return PerformanceRecorder(
+        initial_capacity=performance_recorder.initial_capacity,
+        decimation=performance_recorder.decimation,
+        decimation_mode=performance_recorder.decimation_mode,
+        stream_path=stream_path,
+    )
+
+
+def _record(performance_recorder: PerformanceRecorder, record: np.ndarray):
+    """Record a record returned by an island in a PerformanceRecorder."""
+    performance_recorder.record(
+        generation=int(record["generation"]),
+        fitness_score=record["fitness_score"],
+        phenotype_value=record["phenotype_value"],
+        genotype=record["genotype"],
+    )
+
+
+def _run_island(connection, evolution_kwargs: dict, seed: np.random.SeedSequence):
+    """Run an Evolution instance in a worker process, following commands received from the IslandModel.
+
+    The island records the best individual of every generation of an interval in a recorder without decimation
+    or streaming, sends these records to the IslandModel and empties the recorder. The history of the run is only
+    kept by the recorders of the IslandModel. The termination criteria of the island are checked after every
+    generation and the first reason met is sent with the records, the island keeps evolving until the end of the
+    interval so that all islands send records of the same generations.
+
+    Args:
+        connection: end of the pipe connected to the IslandModel.
+        evolution_kwargs: keyword arguments used to create the Evolution instance.
+        seed: SeedSequence of the random generator of this island, spawned from the seed of the IslandModel.
+    """
+    evolution = Evolution(**evolution_kwargs, seed=seed)
+    evolution.performance_over_time = PerformanceRecorder()
+    population = evolution.population
+    evolution.reset_termination_criteria()
+
+    while True:
+        command, argument = connection.recv()
+        try:
+            if command == "stop":
+                break
+            elif command == "evolve":
+                for generation in range(argument):
+                    evolution.run_generation()
+                    if evolution.termination_reason is None:
+                        evolution.check_termination_criteria()
+                result = evolution.performance_over_time.records.copy(), evolution.termination_reason
+                evolution.performance_over_time.set_state({})
+            elif command == "select_migrants":
+                population.evaluate_population(evolution.fitness_function)
+                result = population.select_migrants(argument, evolution.fitness_function)
+            elif command == "receive_migrants":
+                result = population.receive_migrants(argument, evolution.fitness_function)
+            elif command == "best":
+                best_entry = population.hall_of_fame.best
+                result = best_entry.genes, best_entry.phenotype_value, best_entry.fitness_score
+            else:
+                raise NameError(f"Unknown island command {command}")
+        except Exception as error:
+            result = error
+        connection.send(result)
+
+    connection.close()
@@ -0,0 +1,243 @@
+import json
+from enum import Enum
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+
+class DecimationModes(str, Enum):
+    """Enum containing the ways the PerformanceRecorder can reduce the number of recorded generations."""
+    KEEP_EVERY_KTH = "keep_every_kth"
+    MIN_MAX = "min_max"
+
+
+def read_performance_stream(path: str) -> np.ndarray:
+    """Read the records appended to a file by a PerformanceRecorder.
+
+    Args:
+        path: path of the stream file.
+
+    Returns:
+        Structured array with the fields generation, fitness_score, phenotype_value and genotype.
+    """
+    with open(path, "rb") as file:
+        header = file.readline()
+        record_dtype = np.lib.format.descr_to_dtype(_to_descr(json.loads(header)))
+        return np.fromfile(file, dtype=record_dtype)
+
+
+def _to_descr(descr: list) -> list:
+    """Convert a dtype description read from JSON back into the list of tuples used by numpy."""
+    return [tuple(tuple(item) if isinstance(item, list) else item for item in field) for field in descr]
+
+
+class PerformanceRecorder:
+    def __init__(
+        self,
+        initial_capacity: int = 1024,
+        decimation: int = 1,
+        decimation_mode: DecimationModes = DecimationModes.KEEP_EVERY_KTH,
+        stream_path: Optional[str] = None,
+    ):
+        """Initialise PerformanceRecorder class.
+
+        The PerformanceRecorder stores the fitness score, phenotype value and genotype value of the best
+        individual of each generation. Records are kept in a preallocated numpy structured array whose capacity
+        doubles when it is full.
+
+        The number of records can be reduced with decimation. With KEEP_EVERY_KTH only every decimation-th
+        generation is recorded, with MIN_MAX the records with the lowest and the highest fitness score of every
+        window of decimation generations are kept.
+
+        If stream_path is given, the records are appended to that file each time initial_capacity records are
+        in memory, so the memory used by the recorder does not grow with the number of generations. The file
+        starts with a line describing the record dtype, followed by the raw records.
+
+        The fitness_over_time, phenotype_over_time and genotype_over_time attributes return the whole
+        history, read back from the stream file if there is one, and are used by the plotting methods of
+        Evolution.
+
+        Args:
+            initial_capacity: number of records allocated at first, and number of records kept in memory
+                before they are written to the stream file.
+            decimation: number of generations represented by one record (KEEP_EVERY_KTH) or by a pair of
+                records (MIN_MAX), 1 to record every generation.
+            decimation_mode: how generations are selected when decimation is greater than 1.
+            stream_path: optional path of a file the records are appended to. The file is overwritten by a
+                new run.
+        """
+        self.initial_capacity = initial_capacity
+        self.decimation = decimation
+        self.decimation_mode = decimation_mode
+        self.stream_path = stream_path
+
+        self._records: Optional[np.ndarray] = None
+        self._number_of_records = 0
+        self._number_of_streamed_records = 0
+        self._window: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return self._number_of_streamed_records + self._number_of_records
+
+    @property
+    def records(self) -> np.ndarray:
+        """Structured array of all records, with the fields generation, fitness_score, phenotype_value and genotype."""
+        if self._records is None:
+            return np.empty(0, dtype=[("generation", np.int64), ("fitness_score", float), ("phenotype_value", float),
+                                      ("genotype", float, (1,))])
+
+        records_in_memory = self._records[:self._number_of_records]
+        if self.stream_path is None or self._number_of_streamed_records == 0:
+            return records_in_memory
+        streamed_records = read_performance_stream(self.stream_path)[:self._number_of_streamed_records]
+        return np.concatenate((streamed_records, records_in_memory))
+
+    @property
+    def generations(self) -> np.ndarray:
+        """Generation of each record."""
+        return self.records["generation"]
+
+    @property
+    def fitness_over_time(self) -> np.ndarray:
+        """Fitness score of the best individual of each record."""
+        return self.records["fitness_score"]
+
+    @property
+    def phenotype_over_time(self) -> np.ndarray:
+        """Phenotype value of the best individual of each record."""
+        return self.records["phenotype_value"]
+
+    @property
+    def genotype_over_time(self) -> np.ndarray:
+        """Genotype value of the best individual of each record, one row per record."""
+        return self.records["genotype"]
+
+    def record(
+        self,
+        generation: int,
+        fitness_score: float,
+        phenotype_value: Union[float, int],
+        genotype: Union[float, int, List[Union[float, int]]],
+    ):
+        """Record the best individual of a generation, subject to decimation.
+
+        Args:
+            generation: index of the generation.
+            fitness_score: fitness score of the best individual.
+            phenotype_value: phenotype value of the best individual.
+            genotype: genotype value of the best individual.
+        """
+        genotype = np.atleast_1d(np.asarray(genotype))
+        if genotype.dtype == object:
+            genotype = genotype.astype(float)
+        if self._records is None:
+            record_dtype = np.dtype([
+                ("generation", np.int64),
+                ("fitness_score", np.float64),
+                ("phenotype_value", np.float64),
+                ("genotype", genotype.dtype, genotype.shape),
+            ])
+            self._records = np.empty(self.initial_capacity, dtype=record_dtype)
+
+        record = np.empty((), dtype=self._records.dtype)
+        record["generation"] = generation
+        record["fitness_score"] = fitness_score
+        record["phenotype_value"] = phenotype_value
+        record["genotype"] = genotype
+
+        if self.decimation == 1:
+            self._append(record)
+        elif self.decimation_mode == DecimationModes.KEEP_EVERY_KTH:
+            if generation % self.decimation == 0:
+                self._append(record)
+        elif self.decimation_mode == DecimationModes.MIN_MAX:
+            self._update_window(record)
+            if (generation + 1) % self.decimation == 0:
+                self._flush_window()
+        else:
+            raise NameError(f"Unknown decimation mode {self.decimation_mode}")
+
+    def _update_window(self, record: np.ndarray):
+        """Keep the records with the lowest and the highest fitness score of the current window."""
+        if not self._window:
+            self._window = [record, record]
+        else:
+            if record["fitness_score"] < self._window[0]["fitness_score"]:
+                self._window[0] = record
+            if record["fitness_score"] > self._window[1]["fitness_score"]:
+                self._window[1] = record
+
+    def _flush_window(self):
+        """Append the records of the current window in generation order."""
+        window_records = sorted({int(record["generation"]): record for record in self._window}.items())
+        for generation, record in window_records:
+            self._append(record)
+        self._window = []
+
+    def _append(self, record: np.ndarray):
+        """Append a record to the in memory array, growing it or streaming it to disk when it is full."""
+        if self._number_of_records == len(self._records):
+            if self.stream_path is not None:
+                self._write_stream()
+            else:
+                self._records = np.concatenate((self._records, np.empty_like(self._records)))
+
+        self._records[self._number_of_records] = record
+        self._number_of_records += 1
+
+    def _write_stream(self):
+        """Append the records in memory to the stream file and empty the in memory array."""
+        if self._number_of_streamed_records == 0:
+            with open(self.stream_path, "wb") as file:
+                descr = np.lib.format.dtype_to_descr(self._records.dtype)
+                file.write(json.dumps(descr).encode() + b"\n")
+                self._records[:self._number_of_records].tofile(file)
+        else:
+            with open(self.stream_path, "r+b") as file:
+                file.readline()
+                file.seek(file.tell() + self._number_of_streamed_records * self._records.dtype.itemsize)
+                file.truncate()
+                self._records[:self._number_of_records].tofile(file)
+
+        self._number_of_streamed_records += self._number_of_records
+        self._number_of_records = 0
+
+    def flush(self):
+        """Record the incomplete MIN_MAX window and write the records in memory to the stream file, if any."""
+        if self._window:
+            self._flush_window()
+        if self.stream_path is not None and self._number_of_records > 0:
+            self._write_stream()
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Return copies of the records in memory and of the decimation window, e.g. to save a checkpoint.
+
+        Records already written to the stream file are not copied, only their number is kept.
+        """
+        if self._records is None:
+            return {}
+        return {
+            "records": self._records[:self._number_of_records].copy(),
+            "window": np.array(self._window, dtype=self._records.dtype),
+            "number_of_streamed_records": np.asarray(self._number_of_streamed_records),
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """Restore the recorder from the arrays returned by get_state.
+
+        When streaming, records written to the stream file after the state was saved are discarded
+        at the next write.
+        """
+        if "records" not in state:
+            self._records = None
+            self._number_of_records = 0
+            self._number_of_streamed_records = 0
+            self._window = []
+            return
+
+        records = state["records"]
+        self._records = np.empty(max(self.initial_capacity, len(records)), dtype=records.dtype)
+        self._records[:len(records)] = records
+        self._number_of_records = len(records)
+        self._number_of_streamed_records = int(state["number_of_streamed_records"])
+        self._window = list(state["window"])
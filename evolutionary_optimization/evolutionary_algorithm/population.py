@@ -1,9 +1,20 @@
-import copy
-from copy import deepcopy
-from random import shuffle
-from typing import Tuple, List, Union
+from typing import Dict, Tuple, List, Union, Optional
 
+import numpy as np
+
+from evolutionary_optimization.evaluators.abstract_evaluator import AbstractEvaluator
+from evolutionary_optimization.evaluators.async_evaluator import AsyncEvaluator
+from evolutionary_optimization.evaluators.implemented_evaluators import SerialEvaluator
+from evolutionary_optimization.evolutionary_algorithm.evaluation_cache import EvaluationCache
+from evolutionary_optimization.evolutionary_algorithm.hall_of_fame import HallOfFame
+from evolutionary_optimization.evolutionary_algorithm.stage_timer import StageTimer
 from evolutionary_optimization.fitness_functions.abstract_fitness_function import AbstractFitnessFunction
+from evolutionary_optimization.fitness_functions.fitness_utils import select_top_k
+from evolutionary_optimization.genotype.crossover_operators.abstract_crossover_operator import \
+    AbstractCrossoverOperator
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import accepts_rng_argument
+from evolutionary_optimization.genotype.mutation_operators.abstract_mutation_operator import \
+    AbstractMutationOperator
 from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
 
 
@@ -13,6 +24,13 @@ class Population:
         number_of_individuals: int,
         phenotype: AbstractPhenotype,
         ratio_of_elite_individuals: float,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        hall_of_fame_size: int = 1,
+        evaluator: Optional[AbstractEvaluator] = None,
+        stage_timer: Optional[StageTimer] = None,
+        rng: Optional[np.random.Generator] = None,
+        mutation_operator: Optional[AbstractMutationOperator] = None,
+        crossover_operator: Optional[AbstractCrossoverOperator] = None,
     ):
         """Create and store phenotypes used in the Evolution object.
 
@@ -23,15 +41,72 @@ class Population:
             phenotype: a phenotype instance with the desired genotype.
             ratio_of_elite_individuals: proportion of best scoring phenotypes in population that will be kept
                 to the next generation.
+            evaluation_cache: optional cache of phenotype values shared across generations.
+            hall_of_fame_size: number of best individuals over the whole run kept in the hall_of_fame attribute.
+            evaluator: evaluator used to calculate phenotype values, defaults to a SerialEvaluator.
+            stage_timer: optional StageTimer measuring the stages of update_population.
+            rng: random generator used to build, shuffle, cross over and mutate individuals, defaults to a new
+                unseeded generator.
+            mutation_operator: operator mutating the genes of all non-elite individuals at once, defaults to
+                the mutate_population method of the genotype.
+            crossover_operator: operator crossing over the genes of all pairs of parents at once, defaults to
+                the crossover_population method of the genotype.
+
+        The number_of_evaluations attribute counts the phenotype evaluations performed, excluding individuals
+        whose phenotype value was reused from the previous generation or found in the evaluation cache.
         """
 
         self.number_of_individuals = number_of_individuals
         self.phenotype = phenotype
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._from_phenotype_accepts_rng = accepts_rng_argument(phenotype.from_phenotype)
+        self.mutation_operator = mutation_operator
+        self.crossover_operator = crossover_operator
         self.population = self._create_population()
-        self.best_individual = phenotype.from_phenotype(phenotype)
+        self.hall_of_fame = HallOfFame(hall_of_fame_size)
+        self._unevaluated_best_individual = self._build_random_individual()
         self.mutation = True if phenotype.genotype.mutation_probability > 0 else False
-        self.crossover = True if phenotype.genotype.mutation_probability > 0 else False
+        self.crossover = True if phenotype.genotype.ratio_of_population_for_crossover > 0 else False
         self.ratio_of_elite_individuals = ratio_of_elite_individuals
+        self.evaluation_cache = evaluation_cache
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.stage_timer = stage_timer if stage_timer is not None else StageTimer(enabled=False)
+        self.fitness_scores = None
+        self.number_of_evaluations = 0
+
+    @property
+    def best_individual(self) -> AbstractPhenotype:
+        """New phenotype instance built from the best individual in the hall of fame."""
+        best_entry = self.hall_of_fame.best
+        if best_entry is None:
+            return self._unevaluated_best_individual
+
+        genotype = self.phenotype.genotype.from_array(self.phenotype.genotype, best_entry.genes)
+        best_individual = self.phenotype.from_genotype(self.phenotype, genotype)
+        best_individual.phenotype_value = best_entry.phenotype_value
+        best_individual.fitness_score = best_entry.fitness_score
+        return best_individual
+
+    @best_individual.setter
+    def best_individual(self, value: AbstractPhenotype):
+        """Offer an individual to the hall of fame.
+
+        An individual with a fitness score is added to the hall of fame and is returned by best_individual only
+        if it scores higher than the individuals already in it. An individual without a fitness score is returned
+        by best_individual until the first individual enters the hall of fame.
+        """
+        if value.fitness_score is None:
+            self._unevaluated_best_individual = value
+        else:
+            self.hall_of_fame.update(
+                value.genotype.to_array()[np.newaxis], [value.phenotype_value], [value.fitness_score],
+            )
+
+    @property
+    def best_fitness_score(self) -> Optional[float]:
+        """Fitness score of the best individual found so far, None before the first evaluation."""
+        best_entry = self.hall_of_fame.best
+        return None if best_entry is None else best_entry.fitness_score
 
     def _create_population(self) -> List[AbstractPhenotype]:
         """Create initial population of individuals.
@@ -41,10 +116,16 @@ class Population:
         """
         individuals = []
         for i in range(self.number_of_individuals):
-            new_individual = self.phenotype.from_phenotype(self.phenotype)
+            new_individual = self._build_random_individual()
             individuals.append(new_individual)
         return individuals
 
+    def _build_random_individual(self) -> AbstractPhenotype:
+        """Build a phenotype with a random genotype, passing rng to from_phenotype if it accepts it."""
+        if self._from_phenotype_accepts_rng:
+            return self.phenotype.from_phenotype(self.phenotype, rng=self.rng)
+        return self.phenotype.from_phenotype(self.phenotype)
+
     def create_list_of_new_individuals(self, n_new_individuals: int) -> List[AbstractPhenotype]:
         """Create a list of Individual instances.
 
@@ -56,27 +137,128 @@ class Population:
         """
         new_individuals_list = []
         for i in range(n_new_individuals):
-            new_individuals_list.append(self.phenotype.from_phenotype(self.phenotype))
+            new_individuals_list.append(self._build_random_individual())
 
         return new_individuals_list
 
     def evaluate_population(self, fitness_function: AbstractFitnessFunction):
         """Find best_individual in population by calculating fitness scores for all individuals.
 
-        For each individual in the population calculates the fitness score and stores the best individual
-        in the population.best_individual attribute.
+        For each individual in the population calculates the fitness score and offers the best individuals
+        to the hall_of_fame attribute, which serves population.best_individual. If the phenotype implements
+        evaluate_phenotype_batch, the phenotype values of all individuals are calculated with a single call.
+
+        Args:
+            fitness_function: fitness function used to evaluate the phenotype.
+        """
+        if self.phenotype.has_async_evaluation():
+            raise TypeError("The phenotype has an async evaluate_phenotype method, use Evolution.evolve_async.")
+
+        self.evaluate_phenotypes()
+        self._update_best_individuals(fitness_function)
+
+    async def evaluate_population_async(
+        self,
+        fitness_function: AbstractFitnessFunction,
+        async_evaluator: AsyncEvaluator,
+    ):
+        """Asynchronous version of evaluate_population.
+
+        Stale individuals are evaluated concurrently by the async_evaluator. Individuals whose evaluation
+        timed out get a NaN phenotype value and the async_evaluator's failure_fitness as fitness score.
 
         Args:
             fitness_function: fitness function used to evaluate the phenotype.
+            async_evaluator: evaluator used to calculate phenotype values concurrently.
+        """
+        individuals = self._lookup_cached_phenotypes()
+        failed = await async_evaluator.evaluate_individuals(individuals)
+        self.number_of_evaluations += len(individuals)
+
+        for individual, is_failed in zip(individuals, failed):
+            if is_failed:
+                individual.fitness_score = async_evaluator.failure_fitness
+        self._store_cached_phenotypes([individual for individual, is_failed in zip(individuals, failed)
+                                       if not is_failed])
+
+        self._update_best_individuals(fitness_function)
+
+    def _update_best_individuals(self, fitness_function: AbstractFitnessFunction):
+        """Score the population and offer its best individuals to the hall of fame."""
+        self.fitness_scores = self.score_population(fitness_function)
+
+        candidate_indices = select_top_k(self.fitness_scores, self.hall_of_fame.capacity)
+        self.hall_of_fame.update(
+            genes=[self.population[i].genotype.to_array() for i in candidate_indices],
+            phenotype_values=[self.population[i].phenotype_value for i in candidate_indices],
+            fitness_scores=self.fitness_scores[candidate_indices],
+        )
+
+    def evaluate_phenotypes(self):
+        """Calculate the phenotype value of every individual whose cached phenotype value is stale.
+
+        Individuals carried over unchanged from the previous generation (e.g. elite individuals) keep their
+        phenotype value and are not evaluated again. If the population has an evaluation cache, individuals
+        whose genotype is found in the cache are not evaluated either.
+        """
+        individuals = self._lookup_cached_phenotypes()
+        self._evaluate_individuals(individuals)
+        self._store_cached_phenotypes(individuals)
+
+    def _lookup_cached_phenotypes(self) -> List[AbstractPhenotype]:
+        """Fill in stale phenotype values found in the evaluation cache.
+
+        Returns:
+            List of the individuals that still need to be evaluated.
         """
-        for individual in self.population:
-            individual.evaluate_phenotype()
-            fitness_score = fitness_function.evaluate(phenotype=individual)
+        stale_individuals = [individual for individual in self.population if individual.phenotype_value is None]
+        if self.evaluation_cache is None or not stale_individuals:
+            return stale_individuals
+
+        genes = np.stack([individual.genotype.to_array() for individual in stale_individuals])
+        phenotype_values, missing = self.evaluation_cache.lookup(genes)
+        for individual, phenotype_value, is_missing in zip(stale_individuals, phenotype_values.tolist(), missing):
+            if not is_missing:
+                individual.phenotype_value = phenotype_value
+        return [individual for individual, is_missing in zip(stale_individuals, missing) if is_missing]
+
+    def _store_cached_phenotypes(self, individuals: List[AbstractPhenotype]):
+        """Add the phenotype values of evaluated individuals to the evaluation cache."""
+        if self.evaluation_cache is None or not individuals:
+            return
+
+        self.evaluation_cache.store(
+            np.stack([individual.genotype.to_array() for individual in individuals]),
+            [individual.phenotype_value for individual in individuals],
+        )
+
+    def _evaluate_individuals(self, individuals: List[AbstractPhenotype]):
+        """Calculate the phenotype value of each individual in a list with the evaluator."""
+        if individuals:
+            self.evaluator.evaluate_individuals(self.phenotype, individuals)
+            self.number_of_evaluations += len(individuals)
+
+    def score_population(self, fitness_function: AbstractFitnessFunction) -> np.ndarray:
+        """Calculate the fitness score of every individual in the population.
+
+        Fitness scores cached on the individuals are reused, the remaining individuals are scored with a single
+        call to the fitness function's evaluate_batch method.
 
-            if self.best_individual.phenotype_value is None or \
-                    fitness_score > fitness_function.evaluate(self.best_individual):
+        Args:
+            fitness_function: fitness function used to evaluate the phenotype.
+
+        Returns:
+            Array of fitness scores in the same order as the population attribute.
+        """
+        stale_individuals = [individual for individual in self.population if individual.fitness_score is None]
+        if stale_individuals:
+            phenotype_values = np.asarray([individual.phenotype_value for individual in stale_individuals],
+                                          dtype=float)
+            fitness_scores = fitness_function.evaluate_batch(phenotype_values).tolist()
+            for individual, fitness_score in zip(stale_individuals, fitness_scores):
+                individual.fitness_score = fitness_score
 
-                self.best_individual = copy.deepcopy(individual)
+        return np.asarray([individual.fitness_score for individual in self.population], dtype=float)
 
     def update_population(self, fitness_function: AbstractFitnessFunction):
         """Update population attribute following evaluation.
@@ -89,49 +271,176 @@ class Population:
         Args:
             fitness_function: fitness function used to evaluate the phenotype.
         """
-        elite_individuals, non_elite_individuals = self.split_elite_individuals(fitness_function)
+        with self.stage_timer.stage("split_elite_individuals"):
+            elite_individuals, non_elite_individuals = self.split_elite_individuals(fitness_function)
+
+        with self.stage_timer.stage("copy_elites"):
+            non_elite_individuals = non_elite_individuals[len(elite_individuals):] + [
+                elite_individual.copy() for elite_individual in elite_individuals
+            ]
 
-        non_elite_individuals = non_elite_individuals[len(elite_individuals):] + deepcopy(elite_individuals)
         if self.crossover:
-            number_of_individuals_for_crossover = int(self.phenotype.genotype.ratio_of_population_for_crossover
-                                                      * self.number_of_individuals)
-            non_elite_individuals = \
-                self.crossover_for_population_segment(non_elite_individuals[:number_of_individuals_for_crossover]) + \
-                non_elite_individuals[number_of_individuals_for_crossover:]
+            with self.stage_timer.stage("crossover"):
+                number_of_individuals_for_crossover = int(self.phenotype.genotype.ratio_of_population_for_crossover
+                                                          * self.number_of_individuals)
+                non_elite_individuals = \
+                    self.crossover_for_population_segment(
+                        non_elite_individuals[:number_of_individuals_for_crossover]
+                    ) + non_elite_individuals[number_of_individuals_for_crossover:]
 
         if self.mutation:
-            for individual in non_elite_individuals:
-                individual.mutate()
+            with self.stage_timer.stage("mutation"):
+                self.mutate_individuals(non_elite_individuals)
 
         new_individuals_list = elite_individuals + non_elite_individuals
         self.population = new_individuals_list
+        self.fitness_scores = None
+
+    def mutate_individuals(self, individuals: List[AbstractPhenotype]):
+        """In place mutation of a list of individuals.
+
+        The genes of all individuals are stacked in a matrix and mutated at once, by the mutation_operator if
+        there is one. Only individuals whose genes changed get a new genotype and have their cached phenotype
+        value and fitness score invalidated, the others keep them.
+
+        Args:
+            individuals: phenotypes to mutate.
+        """
+        if not individuals:
+            return
 
-    @staticmethod
-    def crossover_for_population_segment(list_of_parents: List[AbstractPhenotype]) -> List[AbstractPhenotype]:
+        genotype = self.phenotype.genotype
+        genes = np.stack([individual.genotype.to_array() for individual in individuals])
+        if self.mutation_operator is not None:
+            mutated_genes = self.mutation_operator.mutate(genes, genotype, self.rng)
+        else:
+            mutated_genes = genotype.mutate_population(genes, self.rng)
+
+        for i in np.flatnonzero(np.any(mutated_genes != genes, axis=1)):
+            individuals[i].genotype = genotype.from_array(genotype, mutated_genes[i])
+            individuals[i].invalidate_cache()
+
+    def crossover_for_population_segment(self, list_of_parents: List[AbstractPhenotype]) -> List[AbstractPhenotype]:
         """Perform crossover for a list of phenotypes.
 
-        This method creates a new list of phenotypes (children) based on the parents' genotypes by calling the
-        phenotype's crossover method.
+        Consecutive parents are paired and the genes of all pairs are crossed over at once, by the
+        crossover_operator if there is one. A child whose genes are the same as those of the parent at its
+        position is that parent instance, so that its phenotype value is not calculated again.
 
         Args:
             list_of_parents: list of phenotypes which should be used to generate offspring.
 
         Returns:
-            List of new Phenotype objects created from their parents' genotypes.
+            List of Phenotype objects created from their parents' genotypes.
         """
         list_of_children = []
 
         if len(list_of_parents) % 2 != 0:
             list_of_children.append(list_of_parents[-1])
-            list_of_parents.pop(-1)
+            list_of_parents = list_of_parents[:-1]
+
+        if not list_of_parents:
+            return list_of_children
+
+        genotype = self.phenotype.genotype
+        genes = np.stack([parent.genotype.to_array() for parent in list_of_parents])
+        if self.crossover_operator is not None:
+            children_1, children_2 = self.crossover_operator.crossover(genes[0::2], genes[1::2], genotype, self.rng)
+        else:
+            children_1, children_2 = genotype.crossover_population(genes[0::2], genes[1::2], self.rng)
 
-        for i in range(0, len(list_of_parents), 2):
-            child_1, child_2 = list_of_parents[i].crossover(list_of_parents[i + 1])
-            list_of_children.append(child_1)
-            list_of_children.append(child_2)
+        children_genes = np.empty((len(genes), genes.shape[1]), dtype=np.result_type(children_1, children_2))
+        children_genes[0::2] = children_1
+        children_genes[1::2] = children_2
+
+        for parent, parent_genes, child_genes in zip(list_of_parents, genes, children_genes):
+            if np.array_equal(parent_genes, child_genes):
+                list_of_children.append(parent)
+            else:
+                child_genotype = genotype.from_array(genotype, child_genes)
+                list_of_children.append(self.phenotype.from_genotype(self.phenotype, child_genotype))
 
         return list_of_children
 
+    def select_migrants(
+        self,
+        number_of_migrants: int,
+        fitness_function: AbstractFitnessFunction,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return copies of the genes of the best individuals of the population, to be sent to another population.
+
+        Args:
+            number_of_migrants: number of individuals to return.
+            fitness_function: fitness function used to evaluate the phenotype.
+
+        Returns:
+            Tuple of the genes of the migrants, one row per migrant, and their fitness scores.
+        """
+        fitness_scores = self.fitness_scores
+        if fitness_scores is None:
+            fitness_scores = self.score_population(fitness_function)
+
+        migrant_indices = select_top_k(fitness_scores, number_of_migrants)
+        genes = np.stack([self.population[i].genotype.to_array() for i in migrant_indices])
+        return genes, fitness_scores[migrant_indices]
+
+    def receive_migrants(self, genes: np.ndarray, fitness_function: AbstractFitnessFunction):
+        """Replace the worst individuals of the population with migrants from another population.
+
+        Args:
+            genes: genes of the migrants, one row per migrant.
+            fitness_function: fitness function used to evaluate the phenotype.
+        """
+        fitness_scores = self.fitness_scores
+        if fitness_scores is None:
+            fitness_scores = self.score_population(fitness_function)
+
+        genotype = self.phenotype.genotype
+        for i, row in zip(select_top_k(-fitness_scores, len(genes)), genes):
+            self.population[i] = self.phenotype.from_genotype(self.phenotype, genotype.from_array(genotype, row))
+        self.fitness_scores = None
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Return arrays describing the population, e.g. to save a checkpoint.
+
+        Phenotype values and fitness scores which are not calculated yet are stored as NaN, with a boolean
+        array marking the calculated ones.
+        """
+        phenotype_values = [individual.phenotype_value for individual in self.population]
+        fitness_scores = [individual.fitness_score for individual in self.population]
+        hall_of_fame_state = self.hall_of_fame.get_state()
+        return {
+            "genes": np.stack([individual.genotype.to_array() for individual in self.population]),
+            "phenotype_values": np.array([np.nan if value is None else value for value in phenotype_values]),
+            "is_evaluated": np.array([value is not None for value in phenotype_values]),
+            "fitness_scores": np.array([np.nan if score is None else score for score in fitness_scores], dtype=float),
+            "is_scored": np.array([score is not None for score in fitness_scores]),
+            "number_of_evaluations": np.asarray(self.number_of_evaluations),
+            **{f"hall_of_fame_{key}": value for key, value in hall_of_fame_state.items()},
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """Restore the population from the arrays returned by get_state."""
+        genotype = self.phenotype.genotype
+        self.population = []
+        for genes, phenotype_value, is_evaluated, fitness_score, is_scored in zip(
+            state["genes"],
+            state["phenotype_values"].tolist(),
+            state["is_evaluated"],
+            state["fitness_scores"].tolist(),
+            state["is_scored"],
+        ):
+            individual = self.phenotype.from_genotype(self.phenotype, genotype.from_array(genotype, genes))
+            individual.phenotype_value = phenotype_value if is_evaluated else None
+            individual.fitness_score = fitness_score if is_scored else None
+            self.population.append(individual)
+
+        self.number_of_individuals = len(self.population)
+        self.number_of_evaluations = int(state["number_of_evaluations"])
+        self.fitness_scores = None
+        self.hall_of_fame.set_state({key[len("hall_of_fame_"):]: value for key, value in state.items()
+                                     if key.startswith("hall_of_fame_")})
+
     def split_elite_individuals(self, fitness_function: AbstractFitnessFunction) \
             -> Tuple[List[AbstractPhenotype], List[AbstractPhenotype]]:
         """Split list of individuals into elite and non-elite individuals.
@@ -139,25 +448,36 @@ class Population:
         The function will create two lists to separate out elite individuals i.e. ones with the highest fitness
         scores, from those with lower fitness scores. Top 10% of individuals (or at least 1) will be kept from
         a list. The rest will be assigned to a separate list, which will be updated using crossover and/or mutation.
+        The elite individuals are selected with argpartition rather than by sorting the whole population.
 
         Returns:
             Tuple of List[Phenotype] and List[Phenotype] representing separate groups of
                 elite and non_elite individuals.
         """
-        sorted_individuals = self.sort_phenotypes_by_fitness_score(fitness_function)
+        fitness_scores = self.fitness_scores
+        if fitness_scores is None:
+            fitness_scores = self.score_population(fitness_function)
+
         elite_individual_threshold = int(self.number_of_individuals * self.ratio_of_elite_individuals)
-        elite_individuals = sorted_individuals[:elite_individual_threshold]
-        non_elite_individuals = sorted_individuals[elite_individual_threshold:]
-        shuffle(non_elite_individuals)
+        elite_indices = select_top_k(fitness_scores, elite_individual_threshold)
+        is_elite = np.zeros(len(self.population), dtype=bool)
+        is_elite[elite_indices] = True
+
+        elite_individuals = [self.population[i] for i in elite_indices]
+        non_elite_individuals = [self.population[i] for i in self.rng.permutation(np.flatnonzero(~is_elite))]
         return elite_individuals, non_elite_individuals
 
     def sort_phenotypes_by_fitness_score(self, fitness_function: AbstractFitnessFunction) -> List[AbstractPhenotype]:
-        """Sort list of AbstractPhenotype by descending fitness score."""
-        phenotype_and_fitness_score_tuple_list = []
-        for phenotype in self.population:
-            fitness_score = fitness_function.evaluate(phenotype)
-            phenotype_and_fitness_score_tuple_list.append((phenotype, fitness_score))
+        """Sort list of AbstractPhenotype by descending fitness score.
+
+        Fitness scores from the last call to evaluate_population are reused if the population has not been
+        updated since.
+        """
+        fitness_scores = self.fitness_scores
+        if fitness_scores is None:
+            fitness_scores = self.score_population(fitness_function)
 
+        phenotype_and_fitness_score_tuple_list = list(zip(self.population, fitness_scores.tolist()))
         sorted_phenotype_tuples = sorted(phenotype_and_fitness_score_tuple_list,
                                          key=get_score_for_sorting, reverse=True)
         sorted_phenotypes = []
@@ -0,0 +1,142 @@
+import cProfile
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from evolutionary_optimization.evolutionary_algorithm.ea_data_model import StageTiming
+
+_DISABLED_STAGE = nullcontext()
+
+
+class _Stage:
+    def __init__(self, stage_timer: "StageTimer", name: str):
+        """Context manager timing one call of a stage, created by StageTimer.stage."""
+        self.stage_timer = stage_timer
+        self.name = name
+        self.profile = stage_timer.profile_stages is not None and name in stage_timer.profile_stages \
+            and stage_timer.is_profiling_generation
+        self.start_time = 0.0
+
+    def __enter__(self):
+        if self.profile:
+            self.stage_timer.profiler.enable()
+        self.start_time = perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed_time = perf_counter() - self.start_time
+        if self.profile:
+            self.stage_timer.profiler.disable()
+        self.stage_timer.add_time(self.name, elapsed_time)
+
+
+class StageTimer:
+    def __init__(
+        self,
+        enabled: bool = True,
+        show_in_progress_bar: bool = False,
+        profiler=None,
+        profile_generations: Optional[range] = None,
+        profile_stages: Optional[List[str]] = None,
+    ):
+        """Initialise StageTimer class.
+
+        The StageTimer measures the wall time and the number of calls of each stage of a generation, e.g.
+        evaluate_population, split_elite_individuals, crossover, mutation, copy_elites and record_performance.
+        When it is disabled, stage returns a shared no-op context manager, so the instrumentation costs one
+        method call per stage.
+
+        A profiler can be run for a range of generations, either over whole generations or only around some
+        stages. Any object with enable and disable methods can be used, e.g. cProfile.Profile or a small wrapper
+        around the start and stop methods of a sampling profiler.
+
+        Args:
+            enabled: if False no time is measured.
+            show_in_progress_bar: if True Evolution.evolve shows the time of each stage in the last generation
+                in the tqdm postfix.
+            profiler: profiler enabled during profile_generations, defaults to a cProfile.Profile when
+                profile_generations is given.
+            profile_generations: range of generations during which the profiler is enabled, None to disable
+                profiling.
+            profile_stages: names of the stages the profiler is enabled around, None to profile whole generations.
+        """
+        self.enabled = enabled
+        self.show_in_progress_bar = show_in_progress_bar
+        self.profile_generations = profile_generations
+        self.profile_stages = profile_stages
+        self.profiler = profiler if profiler is not None or profile_generations is None else cProfile.Profile()
+
+        self.is_profiling_generation = False
+        self.number_of_generations = 0
+        self._total_seconds: Dict[str, float] = {}
+        self._number_of_calls: Dict[str, int] = {}
+        self._generation_seconds: Dict[str, float] = {}
+        self._last_generation_seconds: Dict[str, float] = {}
+
+    def stage(self, name: str):
+        """Return a context manager measuring the time spent in a stage.
+
+        Args:
+            name: name of the stage in the report.
+        """
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return _Stage(self, name)
+
+    def add_time(self, name: str, elapsed_time: float):
+        """Add the duration of one call of a stage."""
+        self._total_seconds[name] = self._total_seconds.get(name, 0.0) + elapsed_time
+        self._number_of_calls[name] = self._number_of_calls.get(name, 0) + 1
+        self._generation_seconds[name] = self._generation_seconds.get(name, 0.0) + elapsed_time
+
+    def start_generation(self, generation: int):
+        """Mark the start of a generation, enabling the profiler if the generation is in profile_generations."""
+        if not self.enabled:
+            return
+
+        self._generation_seconds = {}
+        self.is_profiling_generation = self.profile_generations is not None and generation in self.profile_generations
+        if self.is_profiling_generation and self.profile_stages is None:
+            self.profiler.enable()
+
+    def end_generation(self):
+        """Mark the end of a generation, disabling the profiler if it was enabled for the whole generation."""
+        if not self.enabled:
+            return
+
+        if self.is_profiling_generation and self.profile_stages is None:
+            self.profiler.disable()
+        self.is_profiling_generation = False
+        self._last_generation_seconds = dict(self._generation_seconds)
+        self.number_of_generations += 1
+
+    def report(self) -> Dict[str, StageTiming]:
+        """Return the timing of every stage measured so far, by stage name."""
+        return {
+            name: StageTiming(
+                number_of_calls=self._number_of_calls[name],
+                total_seconds=total_seconds,
+                last_generation_seconds=self._last_generation_seconds.get(name, 0.0),
+                mean_seconds_per_generation=total_seconds / max(self.number_of_generations, 1),
+            )
+            for name, total_seconds in self._total_seconds.items()
+        }
+
+    def postfix(self) -> Dict[str, str]:
+        """Return the time of each stage in the last generation, formatted for the tqdm postfix."""
+        return {name: f"{seconds * 1000:.1f}ms" for name, seconds in self._last_generation_seconds.items()}
+
+    def print_report(self):
+        """Print the timing of every stage, sorted by descending total time."""
+        report = sorted(self.report().items(), key=lambda item: item[1].total_seconds, reverse=True)
+        print(f"{'stage':<28}{'calls':>10}{'total (s)':>14}{'per generation (ms)':>22}")
+        for name, stage_timing in report:
+            print(f"{name:<28}{stage_timing.number_of_calls:>10}{stage_timing.total_seconds:>14.4f}"
+                  f"{stage_timing.mean_seconds_per_generation * 1000:>22.3f}")
+
+    def reset(self):
+        """Forget all measured times."""
+        self.number_of_generations = 0
+        self._total_seconds = {}
+        self._number_of_calls = {}
+        self._generation_seconds = {}
+        self._last_generation_seconds = {}
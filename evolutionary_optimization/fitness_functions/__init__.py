@@ -0,0 +1,2 @@
+from evolutionary_optimization.fitness_functions.fitness_utils import normalize_fitness_scores, \
+    normalized_rank_fitness_scores, rank_fitness_scores
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from types import SimpleNamespace
 from typing import Union
 
+import numpy as np
+from numpy import ndarray
+
 from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
 
 
@@ -16,3 +20,20 @@ class AbstractFitnessFunction(ABC):
             Processed phenotype value depending on desired fitness function.
         """
         pass
+
+    def evaluate_batch(self, values: ndarray) -> ndarray:
+        """Return the fitness scores of many phenotype values at once.
+
+        The default implementation calls evaluate once per value, fitness functions that can be
+        calculated with numpy operations should override it.
+
+        Args:
+            values: array of phenotype values.
+
+        Returns:
+            Array of the same shape as values with the fitness score of each phenotype value.
+        """
+        fitness_scores = np.empty(len(values))
+        for i, value in enumerate(values):
+            fitness_scores[i] = self.evaluate(SimpleNamespace(phenotype_value=value))
+        return fitness_scores
@@ -0,0 +1,76 @@
+import numpy as np
+from numpy import ndarray
+
+
+def rank_fitness_scores(fitness_scores: ndarray) -> ndarray:
+    """Replace fitness scores by their rank within the population.
+
+    The lowest fitness score gets rank 0 and the highest gets rank len(fitness_scores) - 1. Ties are ranked
+    in order of appearance. The ranks are calculated with a single argsort.
+
+    Args:
+        fitness_scores: array of fitness scores of a population.
+
+    Returns:
+        Array of the same shape with the rank of each fitness score.
+    """
+    fitness_scores = np.asarray(fitness_scores)
+    ranks = np.empty(len(fitness_scores))
+    ranks[np.argsort(fitness_scores, kind="stable")] = np.arange(len(fitness_scores))
+    return ranks
+
+
+def normalized_rank_fitness_scores(fitness_scores: ndarray) -> ndarray:
+    """Replace fitness scores by their rank within the population scaled to the [0, 1] interval.
+
+    Args:
+        fitness_scores: array of fitness scores of a population.
+
+    Returns:
+        Array of the same shape, the lowest fitness score maps to 0 and the highest to 1.
+    """
+    ranks = rank_fitness_scores(fitness_scores)
+    return ranks / max(len(ranks) - 1, 1)
+
+
+def normalize_fitness_scores(fitness_scores: ndarray) -> ndarray:
+    """Scale fitness scores linearly to the [0, 1] interval.
+
+    Args:
+        fitness_scores: array of fitness scores of a population.
+
+    Returns:
+        Array of the same shape, the lowest fitness score maps to 0 and the highest to 1. If all fitness
+            scores are equal they all map to 1.
+    """
+    fitness_scores = np.asarray(fitness_scores, dtype=float)
+    lowest_score = np.min(fitness_scores)
+    score_range = np.max(fitness_scores) - lowest_score
+    if score_range == 0:
+        return np.ones_like(fitness_scores)
+    return (fitness_scores - lowest_score) / score_range
+
+
+def select_top_k(fitness_scores: ndarray, k: int) -> ndarray:
+    """Return the indices of the k highest fitness scores.
+
+    The k best individuals are found with argpartition in O(n) and only those k are sorted, so this is
+    cheaper than sorting the whole population when k is small.
+
+    Args:
+        fitness_scores: array of fitness scores of a population.
+        k: number of indices to return, it is clipped to the size of the population.
+
+    Returns:
+        Integer array of k indices sorted by descending fitness score.
+    """
+    fitness_scores = np.asarray(fitness_scores)
+    k = min(max(k, 0), len(fitness_scores))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if k < len(fitness_scores):
+        top_k_indices = np.argpartition(-fitness_scores, k - 1)[:k]
+    else:
+        top_k_indices = np.arange(len(fitness_scores))
+    return top_k_indices[np.argsort(-fitness_scores[top_k_indices], kind="stable")]
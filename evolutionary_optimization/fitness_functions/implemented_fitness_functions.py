@@ -1,5 +1,8 @@
 from typing import Union
 
+import numpy as np
+from numpy import ndarray
+
 from evolutionary_optimization.fitness_functions.abstract_fitness_function import AbstractFitnessFunction
 from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
 
@@ -16,6 +19,10 @@ class MaximizeFitnessFunction(AbstractFitnessFunction):
         """
         return phenotype.phenotype_value
 
+    def evaluate_batch(self, values: ndarray) -> ndarray:
+        """Return the phenotype values directly as fitness scores."""
+        return np.asarray(values, dtype=float)
+
 
 class MinimizeFitnessFunction(AbstractFitnessFunction):
     def evaluate(self, phenotype: AbstractPhenotype) -> Union[float, int]:
@@ -30,6 +37,10 @@ class MinimizeFitnessFunction(AbstractFitnessFunction):
         """
         return phenotype.phenotype_value * -1
 
+    def evaluate_batch(self, values: ndarray) -> ndarray:
+        """Return the negative of the phenotype values as fitness scores."""
+        return np.asarray(values, dtype=float) * -1
+
 
 class ApproachValueFitnessFunction(AbstractFitnessFunction):
     def __init__(self, expected_value: Union[float, int]):
@@ -55,3 +66,16 @@ class ApproachValueFitnessFunction(AbstractFitnessFunction):
             return 1
         else:
             return 1 / delta_to_expected_value
+
+    def evaluate_batch(self, values: ndarray) -> ndarray:
+        """Return 1 divided by the absolute distance of each phenotype value to the expected value.
+
+        Values equal to the expected value score 1, as in evaluate, without branching on each value.
+        """
+        delta_to_expected_value = np.abs(self.expected_value - np.asarray(values, dtype=float))
+        return np.divide(
+            1,
+            delta_to_expected_value,
+            out=np.ones_like(delta_to_expected_value),
+            where=delta_to_expected_value != 0,
+        )
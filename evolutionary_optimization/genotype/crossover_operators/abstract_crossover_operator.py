@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
+
+
+class AbstractCrossoverOperator(ABC):
+    """Crossover operators combine two matrices of parent genes (pairs x genes) at once.
+
+    The random numbers of all pairs are drawn in a few calls and the children are built with numpy indexing,
+    without per-pair allocations.
+    """
+
+    @abstractmethod
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        genotype: "AbstractGenotype",
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform crossover between matching rows of two matrices of genes.
+
+        Args:
+            parents_1: array of shape (number of pairs, number of genes), not modified.
+            parents_2: array of the same shape, row i is crossed over with row i of parents_1.
+            genotype: genotype describing the genes, e.g. its value_range.
+            rng: random generator.
+
+        Returns:
+            Two new arrays of the same shape as the parents containing the children genes.
+        """
+        pass
@@ -0,0 +1,32 @@
+from enum import Enum
+
+from evolutionary_optimization.genotype.crossover_operators.abstract_crossover_operator import \
+    AbstractCrossoverOperator
+from evolutionary_optimization.genotype.crossover_operators.implemented_crossover_operators import \
+    SinglePointCrossoverOperator, TwoPointCrossoverOperator, UniformCrossoverOperator, ArithmeticCrossoverOperator, \
+    BlendCrossoverOperator
+
+
+class CrossoverOperators(str, Enum):
+    """Enum containing implemented crossover operators."""
+    SINGLE_POINT = "single_point"
+    TWO_POINT = "two_point"
+    UNIFORM = "uniform"
+    ARITHMETIC = "arithmetic"
+    BLEND = "blend"
+
+
+class CrossoverOperator:
+    """Maps CrossoverOperators to their associated concrete class based on AbstractCrossoverOperator."""
+    crossover_operators_dictionary = {
+        CrossoverOperators.SINGLE_POINT: SinglePointCrossoverOperator,
+        CrossoverOperators.TWO_POINT: TwoPointCrossoverOperator,
+        CrossoverOperators.UNIFORM: UniformCrossoverOperator,
+        CrossoverOperators.ARITHMETIC: ArithmeticCrossoverOperator,
+        CrossoverOperators.BLEND: BlendCrossoverOperator,
+    }
+
+    @classmethod
+    def get_crossover_operator(cls, crossover_operator: CrossoverOperators) -> type(AbstractCrossoverOperator):
+        """Return class of desired AbstractCrossoverOperator."""
+        return cls.crossover_operators_dictionary[crossover_operator]
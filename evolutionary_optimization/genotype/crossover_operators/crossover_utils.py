@@ -0,0 +1,56 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def crossover_with_mask(
+    parents_1: np.ndarray,
+    parents_2: np.ndarray,
+    is_from_first_parent: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Build two children per pair of parents from a mask.
+
+    Child 1 takes the genes where the mask is True from parent 1 and the others from parent 2, child 2 takes the
+    complementary genes.
+
+    Args:
+        parents_1: array of shape (number of pairs, number of genes).
+        parents_2: array of the same shape, row i is crossed over with row i of parents_1.
+        is_from_first_parent: boolean array broadcastable to the shape of the parents.
+
+    Returns:
+        Two arrays of the same shape as the parents containing the children genes.
+    """
+    children_1 = np.where(is_from_first_parent, parents_1, parents_2)
+    children_2 = np.where(is_from_first_parent, parents_2, parents_1)
+    return children_1, children_2
+
+
+def two_point_crossover_mask(number_of_pairs: int, number_of_genes: int, rng: np.random.Generator) -> np.ndarray:
+    """Return a mask that is False between two distinct gene slice indices of every pair and True elsewhere.
+
+    The two gene slice indices of a pair are drawn without replacement between 1 and number_of_genes - 1, so
+    that the swapped segment is never empty and never the whole genotype. At least 3 genes are needed.
+
+    Args:
+        number_of_pairs: number of pairs of parents.
+        number_of_genes: number of genes of a parent.
+        rng: random generator used to draw the gene slice indices.
+
+    Returns:
+        Boolean array of shape (number_of_pairs, number_of_genes).
+    """
+    first_slice_indices = rng.integers(1, number_of_genes, size=number_of_pairs)
+    second_slice_indices = rng.integers(1, number_of_genes - 1, size=number_of_pairs)
+    second_slice_indices += second_slice_indices >= first_slice_indices
+
+    gene_indices = np.arange(number_of_genes)
+    segment_start = np.minimum(first_slice_indices, second_slice_indices)[:, np.newaxis]
+    segment_stop = np.maximum(first_slice_indices, second_slice_indices)[:, np.newaxis]
+    return (gene_indices < segment_start) | (gene_indices >= segment_stop)
+
+
+def check_floating_point_genes(genes: np.ndarray, crossover_operator_name: str):
+    """Raise a TypeError if genes are not floating point numbers, for operators blending gene values."""
+    if not np.issubdtype(genes.dtype, np.floating):
+        raise TypeError(f"{crossover_operator_name} can only be used with floating point genes, got {genes.dtype}")
@@ -0,0 +1,137 @@
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import numpy as np
+
+from evolutionary_optimization.genotype.crossover_operators.abstract_crossover_operator import \
+    AbstractCrossoverOperator
+from evolutionary_optimization.genotype.crossover_operators.crossover_utils import crossover_with_mask, \
+    two_point_crossover_mask, check_floating_point_genes
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import single_point_crossover_population
+from evolutionary_optimization.genotype.mutation_operators.mutation_utils import BoundHandlings, apply_bounds
+
+if TYPE_CHECKING:
+    from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
+
+
+class SinglePointCrossoverOperator(AbstractCrossoverOperator):
+    """Swaps the genes after a random gene slice index, the crossover used by default by all genotypes."""
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        genotype: "AbstractGenotype",
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform single point crossover, drawing one gene slice index per pair."""
+        return single_point_crossover_population(parents_1, parents_2, rng)
+
+
+class TwoPointCrossoverOperator(AbstractCrossoverOperator):
+    """Swaps the genes between two random gene slice indices.
+
+    With 2 genes there is a single possible gene slice index and single point crossover is performed.
+    """
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        genotype: "AbstractGenotype",
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform two point crossover, drawing two gene slice indices per pair."""
+        number_of_pairs, number_of_genes = parents_1.shape
+        if number_of_genes < 3:
+            return single_point_crossover_population(parents_1, parents_2, rng)
+
+        is_from_first_parent = two_point_crossover_mask(number_of_pairs, number_of_genes, rng)
+        return crossover_with_mask(parents_1, parents_2, is_from_first_parent)
+
+
+class UniformCrossoverOperator(AbstractCrossoverOperator):
+    def __init__(self, swap_probability: float = 0.5):
+        """Initialise UniformCrossoverOperator class.
+
+        Swaps every gene between the two parents independently.
+
+        Args:
+            swap_probability: probability of a gene being swapped.
+        """
+        self.swap_probability = swap_probability
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        genotype: "AbstractGenotype",
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform uniform crossover, drawing one number per gene of every pair."""
+        is_from_first_parent = rng.random(parents_1.shape) >= self.swap_probability
+        return crossover_with_mask(parents_1, parents_2, is_from_first_parent)
+
+
+class ArithmeticCrossoverOperator(AbstractCrossoverOperator):
+    def __init__(self, weight: Optional[float] = None):
+        """Initialise ArithmeticCrossoverOperator class.
+
+        Child 1 is weight * parent_1 + (1 - weight) * parent_2 and child 2 is the complementary combination.
+        Only for floating point genes, the children stay within value_range if their parents are.
+
+        Args:
+            weight: weight of the first parent in the first child, between 0 and 1. Defaults to a weight drawn
+                uniformly for every pair.
+        """
+        self.weight = weight
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        genotype: "AbstractGenotype",
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform arithmetic crossover, drawing at most one weight per pair."""
+        check_floating_point_genes(parents_1, type(self).__name__)
+        if self.weight is None:
+            weights = rng.random((len(parents_1), 1))
+        else:
+            weights = self.weight
+
+        difference = parents_1 - parents_2
+        children_1 = parents_2 + weights * difference
+        children_2 = parents_1 - weights * difference
+        return children_1, children_2
+
+
+class BlendCrossoverOperator(AbstractCrossoverOperator):
+    def __init__(self, alpha: float = 0.5, bound_handling: BoundHandlings = BoundHandlings.NONE):
+        """Initialise BlendCrossoverOperator class.
+
+        BLX-alpha crossover: every gene of both children is drawn uniformly from the interval spanned by the
+        parents' genes, extended on both sides by alpha times its width. Only for floating point genes.
+
+        Args:
+            alpha: extension of the interval on each side, relative to the distance between the parents' genes.
+            bound_handling: how children genes outside the value_range of the genotype are handled.
+        """
+        self.alpha = alpha
+        self.bound_handling = bound_handling
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        genotype: "AbstractGenotype",
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform blend crossover, drawing one number per gene of every child."""
+        check_floating_point_genes(parents_1, type(self).__name__)
+        extension = self.alpha * np.abs(parents_1 - parents_2)
+        lower_bounds = np.minimum(parents_1, parents_2) - extension
+        upper_bounds = np.maximum(parents_1, parents_2) + extension
+
+        children = rng.uniform(lower_bounds, upper_bounds, size=(2,) + parents_1.shape)
+        children = apply_bounds(children, genotype.gene_value_range, self.bound_handling)
+        return children[0], children[1]
@@ -1,8 +1,17 @@
+import copy
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from typing import Tuple, Optional, List, Union
 
+import numpy as np
+
+from evolutionary_optimization.genotype.genotype_model.genotype_data_model import GenotypeParameters
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import accepts_rng_argument
+
 
 class AbstractGenotype(ABC):
+    __slots__ = ("parameters",)
+
     @abstractmethod
     def __init__(
         self,
@@ -38,6 +47,79 @@ class AbstractGenotype(ABC):
         """Genotype attribute setter."""
         pass
 
+    @property
+    def mutation_probability(self) -> float:
+        """Probability of a gene mutating."""
+        return self.parameters.mutation_probability
+
+    @mutation_probability.setter
+    def mutation_probability(self, value: float):
+        """Mutation_probability setter."""
+        self._replace_parameters(mutation_probability=value)
+
+    @property
+    def ratio_of_population_for_crossover(self) -> float:
+        """Ratio of population used for crossover when updating population."""
+        return self.parameters.ratio_of_population_for_crossover
+
+    @ratio_of_population_for_crossover.setter
+    def ratio_of_population_for_crossover(self, value: float):
+        """Ratio_of_population_for_crossover setter."""
+        self._replace_parameters(ratio_of_population_for_crossover=value)
+
+    @property
+    def number_of_genes(self) -> int:
+        """Number of genes in the genotype."""
+        return self.parameters.number_of_genes
+
+    @number_of_genes.setter
+    def number_of_genes(self, value: int):
+        """Number_of_genes setter."""
+        self._replace_parameters(number_of_genes=value)
+
+    @property
+    def value_range(self) -> Tuple[Union[int, float], Union[int, float]]:
+        """Minimum and maximum values of a gene."""
+        return self.parameters.value_range
+
+    @value_range.setter
+    def value_range(self, value: Tuple[Union[int, float], Union[int, float]]):
+        """Value_range setter."""
+        self._replace_parameters(value_range=value)
+
+    def _replace_parameters(self, **changes):
+        """Give this genotype new parameters with the given changes, other genotypes keep the shared ones.
+
+        Genotypes that set their parameters one attribute at a time in __init__ start from empty parameters.
+        """
+        parameters = getattr(self, "parameters", None)
+        if parameters is None:
+            parameters = GenotypeParameters(
+                mutation_probability=None,
+                ratio_of_population_for_crossover=None,
+                number_of_genes=None,
+                value_range=None,
+            )
+        self.parameters = replace(parameters, **changes)
+
+    @property
+    def gene_value_range(self) -> Tuple[Union[int, float], Union[int, float]]:
+        """Minimum and maximum values of a gene of the genes matrix, used by mutation and crossover operators.
+
+        By default the genes are the genotype values and this is value_range. Genotypes whose genes are decoded
+        into the genotype values, e.g. bits, should override it.
+        """
+        return self.value_range
+
+    @property
+    def number_of_variables(self) -> int:
+        """Number of values in the genotype attribute, used by phenotypes of any number of dimensions.
+
+        By default every gene is a variable. Genotypes whose genes are decoded into the genotype values, e.g. bits,
+        should override it.
+        """
+        return self.number_of_genes
+
     @classmethod
     @abstractmethod
     def build_random_genotype(
@@ -46,6 +128,7 @@ class AbstractGenotype(ABC):
         value_range: Tuple[int, int],
         mutation_probability: Optional[float],
         ratio_of_population_for_crossover: Optional[float],
+        rng: Optional[np.random.Generator] = None,
     ) -> "AbstractGenotype":
         """Build random genotype attribute based on class parameters.
 
@@ -54,6 +137,7 @@ class AbstractGenotype(ABC):
             value_range: minimum and maximum values of a gene.
             mutation_probability: probability of a gene mutating.
             ratio_of_population_for_crossover: ratio of population used for crossover when updating population.
+            rng: random generator, defaults to a module level generator.
 
         Returns:
             AbstractGenotype object with a randomly generated genotype attribute.
@@ -61,12 +145,20 @@ class AbstractGenotype(ABC):
         pass
 
     @abstractmethod
-    def mutate(self):
-        """In place modification of the genotype by randomly changing genes based on mutation probability."""
+    def mutate(self, rng: Optional[np.random.Generator] = None):
+        """In place modification of the genotype by randomly changing genes based on mutation probability.
+
+        Args:
+            rng: random generator, defaults to a module level generator.
+        """
         pass
 
     @abstractmethod
-    def crossover(self, parent_2_genotype: "AbstractGenotype") -> Tuple["AbstractGenotype", "AbstractGenotype"]:
+    def crossover(
+        self,
+        parent_2_genotype: "AbstractGenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple["AbstractGenotype", "AbstractGenotype"]:
         """Perform crossover between two phenotypes.
 
         Combines a portion of this object's genotype with that of parent_2 to return 2 new phenotypes
@@ -74,12 +166,40 @@ class AbstractGenotype(ABC):
 
         Args:
             parent_2_genotype: a genotype of the same class whose genotype will be mixed with
+            rng: random generator, defaults to a module level generator.
 
         Returns:
             Two new phenotype instances based on the combined genotypes of the two parents.
         """
         pass
 
+    @classmethod
+    def random_from_genotype(
+        cls,
+        base_genotype: "AbstractGenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> "AbstractGenotype":
+        """Create a new genotype using the parameters of an existing genotype and random genes.
+
+        The new genotype shares the parameters of base_genotype.
+
+        Args:
+            base_genotype: genotype whose parameters are used.
+            rng: random generator, defaults to a module level generator.
+
+        Returns:
+            AbstractGenotype object with a randomly generated genotype attribute.
+        """
+        return cls.from_array(base_genotype, base_genotype.build_random_population(1, rng)[0])
+
+    def copy(self) -> "AbstractGenotype":
+        """Return a new genotype sharing the parameters and the genes of this one.
+
+        Genes are never modified in place, mutation and crossover assign new genes, so the copy keeps sharing
+        them until one of the two genotypes is mutated (copy-on-write).
+        """
+        return copy.copy(self)
+
     @classmethod
     @abstractmethod
     def from_genotype(
@@ -89,3 +209,109 @@ class AbstractGenotype(ABC):
     ) -> "AbstractGenotype":
         """Create a new genotype using the parameters of an existing genotype."""
         pass
+
+    def to_array(self) -> np.ndarray:
+        """Return the genes of this genotype as a one dimensional numpy array.
+
+        This is the row stored for an individual by the ArrayPopulation. Genotypes whose genotype attribute
+        is not the list of genes itself (e.g. a decoded form) should override this method.
+        """
+        return np.asarray(self.genotype)
+
+    @classmethod
+    def from_array(cls, base_genotype: "AbstractGenotype", genes: np.ndarray) -> "AbstractGenotype":
+        """Create a new genotype using the parameters of an existing genotype and a row of genes."""
+        return cls.from_genotype(base_genotype, genes.tolist())
+
+    def decode_population(self, genes: np.ndarray) -> np.ndarray:
+        """Return the genotype values of every row of a matrix of genes.
+
+        The genotype values are what the genotype attribute holds and what phenotypes are calculated from.
+        By default they are the genes themselves.
+
+        Args:
+            genes: array of shape (number of individuals, number of genes).
+
+        Returns:
+            Array with one row of genotype values per individual.
+        """
+        return genes
+
+    def build_random_population(
+        self,
+        number_of_individuals: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """Build a matrix of random genes using the parameters of this genotype.
+
+        Args:
+            number_of_individuals: number of rows (individuals) in the matrix.
+            rng: random generator, defaults to a module level generator.
+
+        Returns:
+            Array of shape (number_of_individuals, number of genes), each row built by build_random_genotype.
+        """
+        rng_kwargs = {"rng": rng} if accepts_rng_argument(self.build_random_genotype) else {}
+        rows = []
+        for i in range(number_of_individuals):
+            new_genotype = self.build_random_genotype(
+                number_of_genes=self.number_of_genes,
+                value_range=self.value_range,
+                mutation_probability=self.mutation_probability,
+                ratio_of_population_for_crossover=self.ratio_of_population_for_crossover,
+                **rng_kwargs,
+            )
+            rows.append(new_genotype.to_array())
+        return np.stack(rows)
+
+    def mutate_population(self, genes: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Mutate every row of a matrix of genes using the parameters of this genotype.
+
+        The default implementation builds a genotype for every row and calls its mutate method. Genotypes
+        can override it with an operation on the whole matrix, drawing the random numbers of the whole
+        generation at once.
+
+        Args:
+            genes: array of shape (number of individuals, number of genes).
+            rng: random generator, defaults to a module level generator.
+
+        Returns:
+            Array of the same shape containing the mutated genes.
+        """
+        rng_kwargs = {"rng": rng} if accepts_rng_argument(self.mutate) else {}
+        mutated_genes = np.empty_like(genes)
+        for i, row in enumerate(genes):
+            genotype = self.from_array(self, row)
+            genotype.mutate(**rng_kwargs)
+            mutated_genes[i] = genotype.to_array()
+        return mutated_genes
+
+    def crossover_population(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform crossover between matching rows of two matrices of genes.
+
+        The default implementation builds a genotype for every parent and calls its crossover method. Genotypes
+        can override it with an operation on the whole matrix.
+
+        Args:
+            parents_1: array of shape (number of pairs, number of genes).
+            parents_2: array of the same shape, row i is crossed over with row i of parents_1.
+            rng: random generator, defaults to a module level generator.
+
+        Returns:
+            Two arrays of the same shape as the parents containing the children genes.
+        """
+        rng_kwargs = {"rng": rng} if accepts_rng_argument(self.crossover) else {}
+        children_1 = np.empty_like(parents_1)
+        children_2 = np.empty_like(parents_2)
+        for i in range(len(parents_1)):
+            child_1, child_2 = self.from_array(self, parents_1[i]).crossover(
+                self.from_array(self, parents_2[i]), **rng_kwargs
+            )
+            children_1[i] = child_1.to_array()
+            children_2[i] = child_2.to_array()
+        return children_1, children_2
@@ -0,0 +1,120 @@
+from enum import Enum
+from functools import lru_cache
+from typing import Tuple, Union
+
+import numpy as np
+
+MAX_NUMBER_OF_BITS_FOR_LOOKUP_TABLE = 16
+
+
+class BinaryDecodings(str, Enum):
+    """Enum containing the ways the bits of a variable of a binary genotype can be decoded."""
+    INTEGER = "integer"
+    GRAY_INTEGER = "gray_integer"
+    FIXED_POINT = "fixed_point"
+    GRAY_FIXED_POINT = "gray_fixed_point"
+
+
+GRAY_DECODINGS = (BinaryDecodings.GRAY_INTEGER, BinaryDecodings.GRAY_FIXED_POINT)
+FIXED_POINT_DECODINGS = (BinaryDecodings.FIXED_POINT, BinaryDecodings.GRAY_FIXED_POINT)
+
+
+def bits_to_unsigned_integers(bits: np.ndarray) -> np.ndarray:
+    """Return the unsigned integers encoded by the last axis of an array of bits, most significant bit first.
+
+    Integers of up to 63 bits are computed with an int64 dot product, wider ones are Python integers, which
+    do not overflow.
+
+    Args:
+        bits: array of 0 and 1.
+
+    Returns:
+        Array with the shape of bits without its last axis.
+    """
+    number_of_bits = bits.shape[-1]
+    if number_of_bits < 64:
+        powers_of_2 = np.left_shift(1, np.arange(number_of_bits - 1, -1, -1, dtype=np.int64))
+        return bits.astype(np.int64) @ powers_of_2
+    powers_of_2 = np.array([2 ** power for power in range(number_of_bits - 1, -1, -1)], dtype=object)
+    return bits.astype(object) @ powers_of_2
+
+
+def gray_to_binary_integers(gray_integers: np.ndarray, number_of_bits: int) -> np.ndarray:
+    """Return the integers whose Gray codes are gray_integers, with log2(number_of_bits) vectorized xor-shifts."""
+    binary_integers = gray_integers.copy()
+    shift = 1
+    while shift < number_of_bits:
+        binary_integers ^= binary_integers >> shift
+        shift *= 2
+    return binary_integers
+
+
+def scale_to_value_range(
+    integers: np.ndarray,
+    number_of_bits: int,
+    value_range: Tuple[Union[int, float], Union[int, float]],
+) -> np.ndarray:
+    """Map unsigned integers of number_of_bits bits linearly onto value_range, 0 to its minimum and all ones to its
+    maximum."""
+    lower_bound, upper_bound = value_range
+    resolution = (upper_bound - lower_bound) / (2 ** number_of_bits - 1)
+    return lower_bound + integers.astype(float) * resolution
+
+
+@lru_cache(maxsize=32)
+def build_decoding_lookup_table(
+    number_of_bits: int,
+    decoding: BinaryDecodings,
+    value_range: Tuple[Union[int, float], Union[int, float]],
+) -> np.ndarray:
+    """Return the decoded value of every unsigned integer of number_of_bits bits.
+
+    Tables are cached, so the values of a word width are computed once per run.
+
+    Args:
+        number_of_bits: width of a variable, at most MAX_NUMBER_OF_BITS_FOR_LOOKUP_TABLE.
+        decoding: how the bits are decoded.
+        value_range: interval the fixed point decodings map onto.
+
+    Returns:
+        Read-only array of length 2 ** number_of_bits, indexed by the plain unsigned integer of the bits.
+    """
+    lookup_table = np.arange(2 ** number_of_bits, dtype=np.int64)
+    if decoding in GRAY_DECODINGS:
+        lookup_table = gray_to_binary_integers(lookup_table, number_of_bits)
+    if decoding in FIXED_POINT_DECODINGS:
+        lookup_table = scale_to_value_range(lookup_table, number_of_bits, value_range)
+    lookup_table.flags.writeable = False
+    return lookup_table
+
+
+def decode_bits(
+    bits: np.ndarray,
+    decoding: BinaryDecodings,
+    value_range: Tuple[Union[int, float], Union[int, float]],
+) -> np.ndarray:
+    """Decode the variables of a whole population in one call.
+
+    Variables of up to MAX_NUMBER_OF_BITS_FOR_LOOKUP_TABLE bits are converted to their plain unsigned integer and
+    decoded through a lookup table. Wider variables are Gray decoded with a cumulative xor over their bits and
+    scaled arithmetically.
+
+    Args:
+        bits: array of 0 and 1 of shape (number of individuals, number of variables, number of bits per variable).
+        decoding: how the bits are decoded.
+        value_range: interval the fixed point decodings map onto.
+
+    Returns:
+        Array of shape (number of individuals, number of variables), of integers or of floats within value_range.
+    """
+    number_of_bits = bits.shape[-1]
+    if decoding != BinaryDecodings.INTEGER and number_of_bits <= MAX_NUMBER_OF_BITS_FOR_LOOKUP_TABLE:
+        lookup_table = build_decoding_lookup_table(number_of_bits, BinaryDecodings(decoding), tuple(value_range))
+        return lookup_table[bits_to_unsigned_integers(bits)]
+
+    if decoding in GRAY_DECODINGS:
+        bits = np.bitwise_xor.accumulate(bits, axis=-1)
+    integers = bits_to_unsigned_integers(bits)
+    if decoding in FIXED_POINT_DECODINGS:
+        return scale_to_value_range(integers, number_of_bits, value_range)
+    return integers
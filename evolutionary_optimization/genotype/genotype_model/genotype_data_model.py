@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+from evolutionary_optimization.genotype.genotype_model.binary_decoding_utils import BinaryDecodings
+
+
+@dataclass(frozen=True)
+class GenotypeParameters:
+    """Dataclass storing the parameters of a run shared by all genotype instances.
+
+    Genotypes built from another genotype, e.g. by from_genotype, mutation or crossover, reference the same
+    instance instead of holding their own copy of each parameter.
+    """
+    mutation_probability: float
+    ratio_of_population_for_crossover: float
+    number_of_genes: int
+    value_range: Tuple[Union[int, float], Union[int, float]]
+
+
+@dataclass(frozen=True)
+class BinaryGenotypeParameters(GenotypeParameters):
+    """GenotypeParameters with the number of variables encoded by the bits and how they are decoded."""
+    number_of_variables: int = 1
+    decoding: BinaryDecodings = BinaryDecodings.INTEGER
@@ -1,4 +1,29 @@
-from typing import List
+import inspect
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from evolutionary_optimization.genotype.crossover_operators.crossover_utils import crossover_with_mask
+
+_DEFAULT_RANDOM_GENERATOR = np.random.default_rng()
+
+
+def get_random_generator(rng: Optional[np.random.Generator] = None) -> np.random.Generator:
+    """Return rng, or a module level generator when none is given, e.g. for a genotype used outside Evolution."""
+    return rng if rng is not None else _DEFAULT_RANDOM_GENERATOR
+
+
+def accepts_rng_argument(method: Callable) -> bool:
+    """Return whether a method accepts the rng keyword argument.
+
+    Genotypes and phenotypes written before the random generator was passed to build_random_genotype,
+    from_phenotype, mutate and crossover define these methods without rng. They are then called without it and
+    draw their random numbers themselves, so such runs are not reproducible with a seed.
+    """
+    parameters = inspect.signature(method).parameters.values()
+    return any(parameter.name == "rng" or parameter.kind == inspect.Parameter.VAR_KEYWORD
+               for parameter in parameters)
+
 
 def single_point_crossover(
         parent_1_genotype: List[int],
@@ -9,17 +34,48 @@ def single_point_crossover(
 
     This is a single point crossover. Using the gene_slice_index, for both parents the genotype are sliced.
     The slice [:gene_slice_index] is taken from parent_1 and the slice [gene_slice_index:] is taken from parent_2.
-    The two complementary slices are then joined to create a new genotype (a child genotype).
+    The two complementary slices are then joined to create a new genotype (a child genotype). This is the crossover
+    of single_point_crossover_population for one pair of parents and a given gene slice index.
 
     Args:
         parent_1_genotype: genotype which will be used to create an offspring.
         parent_2_genotype: genotype which will be used to create an offspring.
-        gene_slice_index: random integer at which the parent genotypes will be sliced.
+        gene_slice_index: integer between 0 and the number of genes at which the parent genotypes will be sliced.
 
     Returns:
         A genotype used to build a Genotype object.
     """
-    child_genotype_part_1 = parent_1_genotype[:gene_slice_index]
-    child_genotype_part_2 = parent_2_genotype[gene_slice_index:]
-    child_genotype = child_genotype_part_1 + child_genotype_part_2
-    return child_genotype
+    is_from_first_parent = np.arange(len(parent_1_genotype)) < gene_slice_index
+    child_genotype, _ = crossover_with_mask(
+        np.asarray([parent_1_genotype]), np.asarray([parent_2_genotype]), is_from_first_parent[np.newaxis],
+    )
+    return child_genotype[0].tolist()
+
+
+def single_point_crossover_population(
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: np.random.Generator,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """A single point crossover between matching rows of two matrices of genes.
+
+    The gene slice index of every pair is drawn in one batch, between 1 and the number of genes - 1.
+    Child 1 takes the genes before the gene slice index from parent 1 and the rest from parent 2,
+    child 2 takes the complementary genes. With a single gene crossover is impossible and copies of the
+    parents are returned.
+
+    Args:
+        parents_1: array of shape (number of pairs, number of genes).
+        parents_2: array of the same shape, row i is crossed over with row i of parents_1.
+        rng: random generator used to draw the gene slice indices.
+
+    Returns:
+        Two arrays of the same shape as the parents containing the children genes.
+    """
+    number_of_pairs, number_of_genes = parents_1.shape
+    if number_of_genes == 1:
+        return parents_1.copy(), parents_2.copy()
+
+    gene_slice_indices = rng.integers(1, number_of_genes, size=number_of_pairs)
+    is_from_first_parent = np.arange(number_of_genes) < gene_slice_indices[:, np.newaxis]
+    return crossover_with_mask(parents_1, parents_2, is_from_first_parent)
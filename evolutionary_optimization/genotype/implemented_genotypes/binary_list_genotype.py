@@ -1,47 +1,73 @@
-from random import randint
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Union
 
 import numpy as np
 
 from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
-from evolutionary_optimization.genotype.genotype_model.genotype_utils import single_point_crossover
+from evolutionary_optimization.genotype.genotype_model.binary_decoding_utils import BinaryDecodings, decode_bits
+from evolutionary_optimization.genotype.genotype_model.genotype_data_model import BinaryGenotypeParameters
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import get_random_generator, \
+    single_point_crossover_population
+from evolutionary_optimization.genotype.mutation_operators.implemented_mutation_operators import \
+    BitFlipMutationOperator
 
 
 class BinaryListGenotype(AbstractGenotype):
+    __slots__ = ("_genotype", "packed_genotype")
+
     def __init__(
         self,
-        genotype: Optional[List[int]] = None,
+        genotype: Optional[Union[List[int], np.ndarray]] = None,
         mutation_probability: float = 0.5,
         ratio_of_population_for_crossover: float = 0.5,
         number_of_genes: int = 32,
         value_range: Optional[Tuple[int, int]] = (0, 1),
+        number_of_variables: int = 1,
+        decoding: BinaryDecodings = BinaryDecodings.INTEGER,
+        parameters: Optional[BinaryGenotypeParameters] = None,
     ):
         """Initialise instance of AbstractGenotype.
 
+        The bits are stored packed, 8 per byte, in an immutable bytes object, and the bit string is split into
+        number_of_variables variables of number_of_genes / number_of_variables bits each. The genotype attribute
+        holds the decoded value of every variable, e.g. number_of_genes=32 and number_of_variables=2 encode the
+        two variables of a BoothPhenotype with 16 bits each. With the INTEGER decoding a variable is the unsigned
+        integer of its bits, the fixed point decodings map it linearly onto value_range and the Gray decodings
+        read its bits as a Gray code, so that consecutive values differ by a single bit.
+
         Args:
-            genotype: genotype used for mutation, crossover and to calculate phenotype_value in binary form.
+            genotype: bits used for mutation, crossover and to calculate phenotype_value.
             mutation_probability: probability of a gene mutating.
             ratio_of_population_for_crossover: ratio of population used for crossover when updating population.
-            number_of_genes: number of genes in the genotype.
-            value_range: minimum and maximum values of a gene.
-
-        .. warning::
-            This genotype can only be used for single value optimization e.g. for a ParabolaPhenotype,
-            and would not work for BoothPhenotype.
+            number_of_genes: number of genes (bits) in the genotype.
+            value_range: minimum and maximum values of a variable, used by the fixed point decodings.
+            number_of_variables: number of variables encoded by the bits, must divide number_of_genes.
+            decoding: how the bits of a variable are decoded.
+            parameters: parameters shared with other genotypes of the run, e.g. by from_genotype. When given they
+                are used instead of the other parameters.
         """
+        if parameters is None:
+            if genotype is not None:
+                number_of_genes = len(genotype)
+            if number_of_genes % number_of_variables != 0:
+                raise ValueError(f"number_of_genes ({number_of_genes}) must be a multiple of number_of_variables "
+                                 f"({number_of_variables})")
+            parameters = BinaryGenotypeParameters(
+                mutation_probability=mutation_probability,
+                ratio_of_population_for_crossover=ratio_of_population_for_crossover,
+                number_of_genes=number_of_genes,
+                value_range=value_range,
+                number_of_variables=number_of_variables,
+                decoding=decoding,
+            )
+        self.parameters = parameters
         self.binary_genotype = genotype
-        self._genotype = self.return_integer_form()
-        self.mutation_probability = mutation_probability
-        self.ratio_of_population_for_crossover = ratio_of_population_for_crossover
-        self.number_of_genes = number_of_genes
-        self.value_range = (0, 1)
 
     @property
     def genotype(self):
         """Genotype value used for evaluation of phenotype.
 
         .. warning::
-            This is the integer form of the self.binary_genotype."""
+            This is the decoded form of every variable of self.binary_genotype."""
         return self._genotype
 
     @genotype.setter
@@ -49,30 +75,70 @@ class BinaryListGenotype(AbstractGenotype):
         """Genotype attribute setter."""
         self._genotype = value
 
+    @property
+    def binary_genotype(self) -> Optional[List[int]]:
+        """Bits of the genotype as a list of 0 and 1."""
+        if self.packed_genotype is None:
+            return None
+        return self.to_array().tolist()
+
+    @binary_genotype.setter
+    def binary_genotype(self, value: Optional[Union[List[int], np.ndarray]]):
+        """Pack the bits and decode every variable."""
+        if value is None:
+            self.packed_genotype = None
+            self._genotype = None
+        else:
+            bits = np.asarray(value, dtype=np.uint8)
+            self.packed_genotype = np.packbits(bits).tobytes()
+            self._genotype = self.decode_population(bits[np.newaxis])[0].tolist()
+
+    @property
+    def number_of_variables(self) -> int:
+        """Number of variables encoded by the bits."""
+        return self.parameters.number_of_variables
+
+    @property
+    def decoding(self) -> BinaryDecodings:
+        """How the bits of a variable are decoded."""
+        return self.parameters.decoding
+
+    @property
+    def gene_value_range(self) -> Tuple[int, int]:
+        """Minimum and maximum values of a gene, which is a bit."""
+        return 0, 1
+
+    @property
+    def number_of_bits_per_variable(self) -> int:
+        """Number of bits encoding each variable."""
+        return self.number_of_genes // self.number_of_variables
+
     @classmethod
     def build_random_genotype(
         cls,
         number_of_genes: int = 32,
         value_range: Tuple[int, int] = (0, 1),
         mutation_probability: Optional[float] = 0.1,
-        ratio_of_population_for_crossover: Optional[float] = 0.5
+        ratio_of_population_for_crossover: Optional[float] = 0.5,
+        rng: Optional[np.random.Generator] = None,
+        number_of_variables: int = 1,
+        decoding: BinaryDecodings = BinaryDecodings.INTEGER,
     ) -> "BinaryListGenotype":
         """Build random genotype attribute based on requirements.
 
         Args:
             number_of_genes: number of genes in the genotype.
-            value_range: minimum and maximum values of a gene.
+            value_range: minimum and maximum values of a variable, used by the fixed point decodings.
             mutation_probability: probability of a gene mutating.
             ratio_of_population_for_crossover: ratio of population used for crossover when updating population.
+            rng: random generator, defaults to a module level generator.
+            number_of_variables: number of variables encoded by the bits.
+            decoding: how the bits of a variable are decoded.
 
         Returns:
               Genotype object with updated genotype attribute.
         """
-        genotype = []
-
-        for i in range(number_of_genes):
-            new_gene = randint(0, 1)
-            genotype.append(new_gene)
+        genotype = get_random_generator(rng).integers(0, 2, size=number_of_genes, dtype=np.uint8)
 
         return cls(
             genotype=genotype,
@@ -80,37 +146,36 @@ class BinaryListGenotype(AbstractGenotype):
             ratio_of_population_for_crossover=ratio_of_population_for_crossover,
             number_of_genes=number_of_genes,
             value_range=value_range,
+            number_of_variables=number_of_variables,
+            decoding=decoding,
         )
 
     @classmethod
-    def from_genotype(cls, base_genotype: "BinaryListGenotype", new_genotype: List[int]) -> "BinaryListGenotype":
+    def from_genotype(
+        cls,
+        base_genotype: "BinaryListGenotype",
+        new_genotype: Union[List[int], np.ndarray],
+    ) -> "BinaryListGenotype":
         """Create a new genotype using the parameters of an existing genotype."""
-        return cls(
-            genotype=new_genotype,
-            value_range=base_genotype.value_range,
-            mutation_probability=base_genotype.mutation_probability,
-            ratio_of_population_for_crossover=base_genotype.ratio_of_population_for_crossover
-        )
-
-    def mutate(self):
-        """In place modification of the genotype by randomly changing genes based on mutation probability."""
-
-        mutation_mask = np.random.choice([True, False],
-                                         p=[self.mutation_probability, 1 - self.mutation_probability],
-                                         size=len(self.binary_genotype))
-
-        logical_binary_genotype = np.array(self.binary_genotype).astype(bool)
+        return cls(genotype=new_genotype, parameters=base_genotype.parameters)
 
-        mutated_logical_binary_genotype = np.logical_xor(logical_binary_genotype, mutation_mask)
+    @classmethod
+    def from_array(cls, base_genotype: "BinaryListGenotype", genes: np.ndarray) -> "BinaryListGenotype":
+        """Create a new genotype using the parameters of an existing genotype and a row of bits."""
+        return cls.from_genotype(base_genotype, genes)
 
-        mutated_binary_genotype = mutated_logical_binary_genotype.astype(int)
+    def mutate(self, rng: Optional[np.random.Generator] = None):
+        """In place modification of the genotype by randomly changing genes based on mutation probability.
 
-        self.binary_genotype = list(mutated_binary_genotype)
-        self.genotype = self.return_integer_form()
+        Args:
+            rng: random generator, defaults to a module level generator.
+        """
+        self.binary_genotype = self.mutate_population(self.to_array()[np.newaxis], rng)[0]
 
     def crossover(
         self,
         parent_2_genotype: "BinaryListGenotype",
+        rng: Optional[np.random.Generator] = None,
     ) -> Tuple["BinaryListGenotype", "BinaryListGenotype"]:
         """Performs single point crossover operation for 1 set of parents.
 
@@ -129,36 +194,67 @@ class BinaryListGenotype(AbstractGenotype):
 
         Args:
             parent_2_genotype: Individual which will be used to create an offspring.
+            rng: random generator, defaults to a module level generator.
 
         Returns:
             Tuple of AbstractGenotype, representing two children genotypes that are a combination of the parents.
         """
-        if len(self.binary_genotype) != len(parent_2_genotype.binary_genotype):
+        if self.number_of_genes != parent_2_genotype.number_of_genes:
             raise NameError("The Individuals have genotypes of different lengths - crossover is impossible")
 
         if self.number_of_genes == 1:
             return self, parent_2_genotype
         else:
-            last_slice_index = self.number_of_genes - 1
-            gene_slice_index = randint(1, last_slice_index)
+            children_1, children_2 = self.crossover_population(
+                self.to_array()[np.newaxis], parent_2_genotype.to_array()[np.newaxis], rng,
+            )
+            child_1 = self.from_array(parent_2_genotype, children_1[0])
+            child_2 = self.from_array(parent_2_genotype, children_2[0])
 
-            child_1_genotype = single_point_crossover(self.binary_genotype, parent_2_genotype.binary_genotype, gene_slice_index)
-            child_2_genotype = single_point_crossover(parent_2_genotype.binary_genotype, self.binary_genotype, gene_slice_index)
+            return child_1, child_2
 
-            child_1 = self.from_genotype(parent_2_genotype, child_1_genotype)
-            child_2 = self.from_genotype(parent_2_genotype, child_2_genotype)
+    def to_array(self) -> np.ndarray:
+        """Return the bits of the genotype as a one dimensional uint8 numpy array."""
+        return np.unpackbits(np.frombuffer(self.packed_genotype, dtype=np.uint8), count=self.number_of_genes)
 
-            return child_1, child_2
+    def build_random_population(
+        self,
+        number_of_individuals: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """Build a matrix of random bits in a single draw."""
+        return get_random_generator(rng).integers(0, 2, size=(number_of_individuals, self.number_of_genes),
+                                                  dtype=np.uint8)
+
+    def mutate_population(self, genes: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Flip the bits of every row with probability mutation_probability."""
+        return BitFlipMutationOperator().mutate(genes, self, get_random_generator(rng))
+
+    def crossover_population(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform single point crossover between matching rows of two matrices of bits."""
+        return single_point_crossover_population(parents_1, parents_2, get_random_generator(rng))
+
+    def decode_population(self, genes: np.ndarray) -> np.ndarray:
+        """Return the decoded value of every variable of every row of a matrix of bits.
 
-    def return_integer_form(self):
-        """Return integer form of a binary number."""
-        power_of_2 = 0
-        integer_form = 0
+        The whole matrix is decoded in one call, through a cached lookup table for variables of up to 16 bits.
+
+        Args:
+            genes: array of bits of shape (number of individuals, number_of_genes).
 
-        if self.binary_genotype is None:
+        Returns:
+            Array of shape (number of individuals, number_of_variables).
+        """
+        bits = genes.reshape(len(genes), self.number_of_variables, self.number_of_bits_per_variable)
+        return decode_bits(bits, self.decoding, self.value_range)
+
+    def return_integer_form(self) -> Optional[List[int]]:
+        """Return decoded form of every variable of the binary number."""
+        if self.packed_genotype is None:
             return None
-        else:
-            for i in range(len(self.binary_genotype) - 1, -1, -1):
-                integer_form += self.binary_genotype[i] * 2 ** power_of_2
-                power_of_2 += 1
-            return [integer_form]
+        return self.decode_population(self.to_array()[np.newaxis])[0].tolist()
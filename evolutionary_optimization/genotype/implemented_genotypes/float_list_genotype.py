@@ -1,12 +1,18 @@
-from random import uniform, randint
 from typing import Tuple, List, Optional
 
 import numpy as np
 
-from evolutionary_optimization.genotype.genotype_model.genotype_utils import single_point_crossover
+from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
+from evolutionary_optimization.genotype.genotype_model.genotype_data_model import GenotypeParameters
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import get_random_generator, \
+    single_point_crossover_population
+from evolutionary_optimization.genotype.mutation_operators.implemented_mutation_operators import \
+    GaussianMutationOperator
 
 
-class FloatListGenotype:
+class FloatListGenotype(AbstractGenotype):
+    __slots__ = ("_genotype",)
+
     def __init__(
             self,
             genotype: Optional[List[float]] = None,
@@ -14,6 +20,7 @@ class FloatListGenotype:
             ratio_of_population_for_crossover: float = 0,
             number_of_genes: int = 1,
             value_range: Tuple[int, int] = (-10000, 10000),
+            parameters: Optional[GenotypeParameters] = None,
     ):
         """Initialise instance of AbstractGenotype.
 
@@ -23,16 +30,23 @@ class FloatListGenotype:
             ratio_of_population_for_crossover: ratio of population used for crossover when updating population.
             number_of_genes: number of genes in the genotype.
             value_range: minimum and maximum values of a gene.
+            parameters: parameters shared with other genotypes of the run, e.g. by from_genotype. When given they
+                are used instead of mutation_probability, ratio_of_population_for_crossover, number_of_genes and
+                value_range.
 
         Todo:
             * (Marta): How to deal with genotype typing.
             * (Marta): value range maybe shouldn't be in the constructor
         """
         self._genotype = genotype
-        self.mutation_probability = mutation_probability
-        self.ratio_of_population_for_crossover = ratio_of_population_for_crossover
-        self.number_of_genes = number_of_genes
-        self.value_range = value_range
+        if parameters is None:
+            parameters = GenotypeParameters(
+                mutation_probability=mutation_probability,
+                ratio_of_population_for_crossover=ratio_of_population_for_crossover,
+                number_of_genes=number_of_genes,
+                value_range=value_range,
+            )
+        self.parameters = parameters
 
     @property
     def genotype(self):
@@ -51,21 +65,20 @@ class FloatListGenotype:
             value_range: Tuple[int, int] = (-10000, 10000),
             mutation_probability: float = 0.5,
             ratio_of_population_for_crossover: float = 0,
+            rng: Optional[np.random.Generator] = None,
     ) -> "AbstractGenotype":
         """Build random genotype attribute based on class parameters.
 
         Args:
             mutation_probability: probability of a gene mutating.
             ratio_of_population_for_crossover: ratio of population used for crossover when updating population.
+            rng: random generator, defaults to a module level generator.
 
         Returns:
             AbstractGenotype object with a randomly generated genotype attribute.
         """
-        genotype = []
-
-        for i in range(number_of_genes):
-            new_gene = uniform(value_range[0], value_range[1])
-            genotype.append(new_gene)
+        rng = get_random_generator(rng)
+        genotype = rng.uniform(value_range[0], value_range[1], size=number_of_genes).tolist()
 
         return cls(
             genotype=genotype,
@@ -78,21 +91,21 @@ class FloatListGenotype:
     @classmethod
     def from_genotype(cls, base_genotype: "FloatListGenotype", new_genotype: List[float]) -> "FloatListGenotype":
         """Create a new genotype using the parameters of an existing genotype."""
-        return cls(
-            genotype=new_genotype,
-            value_range=base_genotype.value_range,
-            mutation_probability=base_genotype.mutation_probability,
-            ratio_of_population_for_crossover=base_genotype.ratio_of_population_for_crossover,
-        )
+        return cls(genotype=new_genotype, parameters=base_genotype.parameters)
 
-    def mutate(self):
-        """In place modification of the genotype by randomly changing genes based on mutation probability."""
-        noise = np.random.normal(0, 1, len(self.genotype))
-        mutation_mask = np.random.choice([True, False], p=[self.mutation_probability, 1 - self.mutation_probability], size=len(self.genotype)).astype(int)
-        mutation_noise = noise * mutation_mask
-        self.genotype += mutation_noise
+    def mutate(self, rng: Optional[np.random.Generator] = None):
+        """In place modification of the genotype by randomly changing genes based on mutation probability.
+
+        Args:
+            rng: random generator, defaults to a module level generator.
+        """
+        self.genotype = self.mutate_population(np.asarray([self.genotype], dtype=float), rng)[0].tolist()
 
-    def crossover(self, parent_2_genotype: "AbstractGenotype") -> Tuple["AbstractGenotype", "AbstractGenotype"]:
+    def crossover(
+            self,
+            parent_2_genotype: "AbstractGenotype",
+            rng: Optional[np.random.Generator] = None,
+    ) -> Tuple["AbstractGenotype", "AbstractGenotype"]:
         """Perform crossover between two phenotypes.
 
         Combines a portion of this object's genotype with that of parent_2 to return 2 new phenotypes
@@ -100,6 +113,7 @@ class FloatListGenotype:
 
         Args:
             parent_2_genotype: a genotype of the same class whose genotype will be mixed with
+            rng: random generator, defaults to a module level generator.
 
         Returns:
             Two new phenotype instances based on the combined genotypes of the two parents.
@@ -110,13 +124,33 @@ class FloatListGenotype:
         if self.number_of_genes == 1:
             return self, parent_2_genotype
         else:
-            last_slice_index = self.number_of_genes - 1
-            gene_slice_index = randint(1, last_slice_index)
+            children_1, children_2 = self.crossover_population(
+                self.to_array()[np.newaxis], parent_2_genotype.to_array()[np.newaxis], rng,
+            )
+            child_1 = self.from_array(parent_2_genotype, children_1[0])
+            child_2 = self.from_array(parent_2_genotype, children_2[0])
 
-            child_1_genotype = single_point_crossover(self.genotype, parent_2_genotype.genotype, gene_slice_index)
-            child_2_genotype = single_point_crossover(parent_2_genotype.genotype, self.genotype, gene_slice_index)
+            return child_1, child_2
 
-            child_1 = self.from_genotype(parent_2_genotype, child_1_genotype)
-            child_2 = self.from_genotype(parent_2_genotype, child_2_genotype)
+    def build_random_population(
+            self,
+            number_of_individuals: int,
+            rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """Build a matrix of genes drawn uniformly from value_range, in a single draw."""
+        return get_random_generator(rng).uniform(
+            self.value_range[0], self.value_range[1], size=(number_of_individuals, self.number_of_genes)
+        )
 
-            return child_1, child_2
+    def mutate_population(self, genes: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Add standard normal noise to the genes of every row with probability mutation_probability."""
+        return GaussianMutationOperator().mutate(genes, self, get_random_generator(rng))
+
+    def crossover_population(
+            self,
+            parents_1: np.ndarray,
+            parents_2: np.ndarray,
+            rng: Optional[np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform single point crossover between matching rows of two matrices of genes."""
+        return single_point_crossover_population(parents_1, parents_2, get_random_generator(rng))
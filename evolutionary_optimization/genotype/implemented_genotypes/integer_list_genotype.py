@@ -1,14 +1,17 @@
-import random
-from random import randint
 from typing import Tuple, Optional, List
 
 import numpy as np
 
 from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
-from evolutionary_optimization.genotype.genotype_model.genotype_utils import single_point_crossover
+from evolutionary_optimization.genotype.genotype_model.genotype_data_model import GenotypeParameters
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import get_random_generator, \
+    single_point_crossover_population
+from evolutionary_optimization.genotype.mutation_operators.implemented_mutation_operators import \
+    IntegerStepMutationOperator
 
 
 class IntegerListGenotype(AbstractGenotype):
+    __slots__ = ("_genotype",)
 
     def __init__(
         self,
@@ -17,6 +20,7 @@ class IntegerListGenotype(AbstractGenotype):
         ratio_of_population_for_crossover: float = 0.5,
         number_of_genes: int = 1,
         value_range: Tuple[int, int] = (-10000, 10000),
+        parameters: Optional[GenotypeParameters] = None,
     ):
         """Initialise instance of AbstractGenotype.
 
@@ -26,12 +30,19 @@ class IntegerListGenotype(AbstractGenotype):
             ratio_of_population_for_crossover: ratio of population used for crossover when updating population.
             number_of_genes: number of genes in the genotype.
             value_range: minimum and maximum values of a gene.
+            parameters: parameters shared with other genotypes of the run, e.g. by from_genotype. When given they
+                are used instead of mutation_probability, ratio_of_population_for_crossover, number_of_genes and
+                value_range.
         """
         self._genotype = genotype
-        self.mutation_probability = mutation_probability
-        self.ratio_of_population_for_crossover = ratio_of_population_for_crossover
-        self.number_of_genes = number_of_genes
-        self.value_range = value_range
+        if parameters is None:
+            parameters = GenotypeParameters(
+                mutation_probability=mutation_probability,
+                ratio_of_population_for_crossover=ratio_of_population_for_crossover,
+                number_of_genes=number_of_genes,
+                value_range=value_range,
+            )
+        self.parameters = parameters
 
     @property
     def genotype(self):
@@ -50,6 +61,7 @@ class IntegerListGenotype(AbstractGenotype):
         value_range: Tuple[int, int] = (-10000, 10000),
         mutation_probability: Optional[float] = 0.5,
         ratio_of_population_for_crossover: Optional[float] = 0.5,
+        rng: Optional[np.random.Generator] = None,
     ) -> "IntegerListGenotype":
         """Builds random genotype attribute based on requirements.
 
@@ -58,6 +70,7 @@ class IntegerListGenotype(AbstractGenotype):
             value_range: minimum and maximum values of a gene.
             mutation_probability: probability of a gene mutating.
             ratio_of_population_for_crossover: ratio of population used for crossover when updating population.
+            rng: random generator, defaults to a module level generator.
 
         Returns:
               Genotype object with updated genotype attribute.
@@ -65,11 +78,8 @@ class IntegerListGenotype(AbstractGenotype):
         Todo:
             * (Marta): set infinity as value range defaults
         """
-        genotype = []
-
-        for i in range(number_of_genes):
-            new_gene = randint(value_range[0], value_range[1])
-            genotype.append(new_gene)
+        rng = get_random_generator(rng)
+        genotype = rng.integers(value_range[0], value_range[1], size=number_of_genes, endpoint=True).tolist()
 
         return cls(
             genotype=genotype,
@@ -82,35 +92,22 @@ class IntegerListGenotype(AbstractGenotype):
     @classmethod
     def from_genotype(cls, base_genotype: "IntegerListGenotype", new_genotype: List[int]) -> "IntegerListGenotype":
         """Create a new genotype using the parameters of an existing genotype."""
-        return cls(
-            genotype=new_genotype,
-            value_range=base_genotype.value_range,
-            mutation_probability=base_genotype.mutation_probability,
-            ratio_of_population_for_crossover=base_genotype.ratio_of_population_for_crossover,
-        )
+        return cls(genotype=new_genotype, parameters=base_genotype.parameters)
 
-    def mutate(self):
-        """In place modification of the genotype by randomly changing genes based on mutation probability."""
-        new_genotype = []
+    def mutate(self, rng: Optional[np.random.Generator] = None):
+        """In place modification of the genotype by randomly changing genes based on mutation probability.
 
-        for gene in self.genotype:
-            mutation = np.random.choice([True, False], p=[self.mutation_probability, 1 - self.mutation_probability])
+        A mutated gene is incremented or decremented by 1 with equal probability.
 
-            if mutation:
-                noise = random.uniform(-1, 1)
-                if noise > 0:
-                    new_gene = gene + 1
-                else:
-                    new_gene = gene - 1
-            else:
-                new_gene = gene
-
-            new_genotype.append(new_gene)
-        self.genotype = new_genotype
+        Args:
+            rng: random generator, defaults to a module level generator.
+        """
+        self.genotype = self.mutate_population(np.asarray([self.genotype]), rng)[0].tolist()
 
     def crossover(
         self,
         parent_2_genotype: "IntegerListGenotype",
+        rng: Optional[np.random.Generator] = None,
     ) -> Tuple["IntegerListGenotype", "IntegerListGenotype"]:
         """Performs single point crossover operation for 1 set of parents.
 
@@ -129,6 +126,7 @@ class IntegerListGenotype(AbstractGenotype):
 
         Args:
             parent_2_genotype: Individual which will be used to create an offspring.
+            rng: random generator, defaults to a module level generator.
 
         Returns:
             Tuple of AbstractGenotype, representing two children genotypes that are a combination of the parents.
@@ -139,13 +137,34 @@ class IntegerListGenotype(AbstractGenotype):
         if self.number_of_genes == 1:
             return self, parent_2_genotype
         else:
-            last_slice_index = self.number_of_genes - 1
-            gene_slice_index = randint(1, last_slice_index)
+            children_1, children_2 = self.crossover_population(
+                self.to_array()[np.newaxis], parent_2_genotype.to_array()[np.newaxis], rng,
+            )
+            child_1 = self.from_array(parent_2_genotype, children_1[0])
+            child_2 = self.from_array(parent_2_genotype, children_2[0])
 
-            child_1_genotype = single_point_crossover(self.genotype, parent_2_genotype.genotype, gene_slice_index)
-            child_2_genotype = single_point_crossover(parent_2_genotype.genotype, self.genotype, gene_slice_index)
+            return child_1, child_2
+
+    def build_random_population(
+        self,
+        number_of_individuals: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """Build a matrix of integer genes drawn uniformly from value_range, bounds included, in a single draw."""
+        return get_random_generator(rng).integers(
+            self.value_range[0], self.value_range[1], size=(number_of_individuals, self.number_of_genes),
+            endpoint=True,
+        )
 
-            child_1 = self.from_genotype(parent_2_genotype, child_1_genotype)
-            child_2 = self.from_genotype(parent_2_genotype, child_2_genotype)
+    def mutate_population(self, genes: np.ndarray, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Increment or decrement the genes of every row by 1 with probability mutation_probability."""
+        return IntegerStepMutationOperator().mutate(genes, self, get_random_generator(rng))
 
-            return child_1, child_2
+    def crossover_population(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Perform single point crossover between matching rows of two matrices of genes."""
+        return single_point_crossover_population(parents_1, parents_2, get_random_generator(rng))
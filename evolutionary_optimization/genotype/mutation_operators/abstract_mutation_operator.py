@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+import numpy as np
+
+from evolutionary_optimization.genotype.mutation_operators.mutation_utils import BoundHandlings, apply_bounds
+
+if TYPE_CHECKING:
+    from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
+
+
+class AbstractMutationOperator(ABC):
+    def __init__(
+        self,
+        mutation_probability: Optional[Union[float, Sequence[float]]] = None,
+        bound_handling: BoundHandlings = BoundHandlings.NONE,
+    ):
+        """Initialise AbstractMutationOperator class.
+
+        Mutation operators mutate a whole matrix of genes (individuals x genes) at once, drawing the random numbers
+        of the whole generation in a few calls.
+
+        Args:
+            mutation_probability: probability of a gene mutating, either one value or one value per gene.
+                Defaults to the mutation_probability of the genotype.
+            bound_handling: how mutated genes outside the value_range of the genotype are handled.
+        """
+        self.mutation_probability = None if mutation_probability is None else np.asarray(mutation_probability)
+        self.bound_handling = bound_handling
+
+    def get_mutation_probability(self, genotype: "AbstractGenotype") -> Union[float, np.ndarray]:
+        """Return the probability of a gene mutating, one value or one value per gene."""
+        return self.mutation_probability if self.mutation_probability is not None else genotype.mutation_probability
+
+    def mutation_mask(self, genes: np.ndarray, genotype: "AbstractGenotype", rng: np.random.Generator) -> np.ndarray:
+        """Return a boolean array of the shape of genes, True for the genes that mutate."""
+        return rng.random(genes.shape) < self.get_mutation_probability(genotype)
+
+    def apply_bounds(self, genes: np.ndarray, genotype: "AbstractGenotype") -> np.ndarray:
+        """Bring mutated genes outside the value_range of the genotype back into it, following bound_handling."""
+        return apply_bounds(genes, genotype.gene_value_range, self.bound_handling)
+
+    @abstractmethod
+    def mutate(self, genes: np.ndarray, genotype: "AbstractGenotype", rng: np.random.Generator) -> np.ndarray:
+        """Mutate every row of a matrix of genes.
+
+        Args:
+            genes: array of shape (number of individuals, number of genes), not modified.
+            genotype: genotype describing the genes, e.g. its mutation_probability and value_range.
+            rng: random generator.
+
+        Returns:
+            New array of the same shape and dtype containing the mutated genes.
+        """
+        pass
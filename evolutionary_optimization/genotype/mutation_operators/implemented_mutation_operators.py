@@ -0,0 +1,134 @@
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+import numpy as np
+
+from evolutionary_optimization.genotype.mutation_operators.abstract_mutation_operator import \
+    AbstractMutationOperator
+from evolutionary_optimization.genotype.mutation_operators.mutation_utils import BoundHandlings
+
+if TYPE_CHECKING:
+    from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
+
+
+class GaussianMutationOperator(AbstractMutationOperator):
+    def __init__(
+        self,
+        standard_deviation: Union[float, Sequence[float]] = 1.0,
+        mutation_probability: Optional[Union[float, Sequence[float]]] = None,
+        bound_handling: BoundHandlings = BoundHandlings.NONE,
+    ):
+        """Initialise GaussianMutationOperator class.
+
+        Adds normally distributed noise to the mutated genes. Integer genes are rounded to the nearest integer.
+
+        Args:
+            standard_deviation: standard deviation of the noise, either one value or one value per gene.
+            mutation_probability: probability of a gene mutating, either one value or one value per gene.
+                Defaults to the mutation_probability of the genotype.
+            bound_handling: how mutated genes outside the value_range of the genotype are handled.
+        """
+        super().__init__(mutation_probability=mutation_probability, bound_handling=bound_handling)
+        self.standard_deviation = np.asarray(standard_deviation)
+
+    def mutate(self, genes: np.ndarray, genotype: "AbstractGenotype", rng: np.random.Generator) -> np.ndarray:
+        """Add normal noise to the genes, drawing one number per mutated gene."""
+        mutation_mask = self.mutation_mask(genes, genotype, rng)
+        standard_deviation = np.broadcast_to(self.standard_deviation, genes.shape)[mutation_mask]
+        noise = rng.standard_normal(len(standard_deviation)) * standard_deviation
+
+        if np.issubdtype(genes.dtype, np.integer):
+            mutated_genes = genes.copy()
+            mutated_genes[mutation_mask] += np.rint(noise).astype(genes.dtype)
+        else:
+            mutated_genes = genes.astype(float)
+            mutated_genes[mutation_mask] += noise
+        return self.apply_bounds(mutated_genes, genotype)
+
+
+class UniformMutationOperator(AbstractMutationOperator):
+    def __init__(
+        self,
+        mutation_probability: Optional[Union[float, Sequence[float]]] = None,
+    ):
+        """Initialise UniformMutationOperator class.
+
+        Replaces the mutated genes with values drawn uniformly from the value_range of the genotype, bounds
+        included for integer genes, so the genes always stay within value_range.
+
+        Args:
+            mutation_probability: probability of a gene mutating, either one value or one value per gene.
+                Defaults to the mutation_probability of the genotype.
+        """
+        super().__init__(mutation_probability=mutation_probability)
+
+    def mutate(self, genes: np.ndarray, genotype: "AbstractGenotype", rng: np.random.Generator) -> np.ndarray:
+        """Replace the mutated genes with uniform draws from value_range, one number per mutated gene."""
+        mutation_mask = self.mutation_mask(genes, genotype, rng)
+        number_of_mutated_genes = np.count_nonzero(mutation_mask)
+        lower_bound, upper_bound = genotype.gene_value_range
+
+        mutated_genes = genes.copy()
+        if np.issubdtype(genes.dtype, np.integer):
+            mutated_genes[mutation_mask] = rng.integers(lower_bound, upper_bound, size=number_of_mutated_genes,
+                                                        endpoint=True)
+        else:
+            mutated_genes[mutation_mask] = rng.uniform(lower_bound, upper_bound, size=number_of_mutated_genes)
+        return mutated_genes
+
+
+class IntegerStepMutationOperator(AbstractMutationOperator):
+    def __init__(
+        self,
+        step_size: Union[int, float] = 1,
+        mutation_probability: Optional[Union[float, Sequence[float]]] = None,
+        bound_handling: BoundHandlings = BoundHandlings.NONE,
+    ):
+        """Initialise IntegerStepMutationOperator class.
+
+        Increments or decrements the mutated genes by step_size with equal probability. The mutated genes keep the
+        dtype of the genes, for integer genes a float step_size is rounded to the nearest integer.
+
+        Args:
+            step_size: value added to or subtracted from a mutated gene.
+            mutation_probability: probability of a gene mutating, either one value or one value per gene.
+                Defaults to the mutation_probability of the genotype.
+            bound_handling: how mutated genes outside the value_range of the genotype are handled.
+        """
+        super().__init__(mutation_probability=mutation_probability, bound_handling=bound_handling)
+        self.step_size = step_size
+
+    def mutate(self, genes: np.ndarray, genotype: "AbstractGenotype", rng: np.random.Generator) -> np.ndarray:
+        """Step the mutated genes up or down.
+
+        A single uniform number is drawn per gene: below mutation_probability / 2 the gene is decremented, between
+        mutation_probability / 2 and mutation_probability it is incremented.
+        """
+        mutation_probability = self.get_mutation_probability(genotype)
+        draws = rng.random(genes.shape)
+        steps = (draws < mutation_probability).astype(genes.dtype)
+        steps -= 2 * (draws < mutation_probability / 2)
+        step_size = self.step_size
+        if np.issubdtype(genes.dtype, np.integer):
+            step_size = np.rint(step_size).astype(genes.dtype)
+        mutated_genes = self.apply_bounds(genes + steps * step_size, genotype)
+        return mutated_genes.astype(genes.dtype, copy=False)
+
+
+class BitFlipMutationOperator(AbstractMutationOperator):
+    def __init__(
+        self,
+        mutation_probability: Optional[Union[float, Sequence[float]]] = None,
+    ):
+        """Initialise BitFlipMutationOperator class.
+
+        Flips the mutated genes of a matrix of bits.
+
+        Args:
+            mutation_probability: probability of a bit flipping, either one value or one value per bit.
+                Defaults to the mutation_probability of the genotype.
+        """
+        super().__init__(mutation_probability=mutation_probability)
+
+    def mutate(self, genes: np.ndarray, genotype: "AbstractGenotype", rng: np.random.Generator) -> np.ndarray:
+        """Flip the mutated bits."""
+        return genes ^ self.mutation_mask(genes, genotype, rng)
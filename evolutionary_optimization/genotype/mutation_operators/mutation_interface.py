@@ -0,0 +1,29 @@
+from enum import Enum
+
+from evolutionary_optimization.genotype.mutation_operators.abstract_mutation_operator import \
+    AbstractMutationOperator
+from evolutionary_optimization.genotype.mutation_operators.implemented_mutation_operators import \
+    GaussianMutationOperator, UniformMutationOperator, IntegerStepMutationOperator, BitFlipMutationOperator
+
+
+class MutationOperators(str, Enum):
+    """Enum containing implemented mutation operators."""
+    GAUSSIAN = "gaussian"
+    UNIFORM = "uniform"
+    INTEGER_STEP = "integer_step"
+    BIT_FLIP = "bit_flip"
+
+
+class MutationOperator:
+    """Maps MutationOperators to their associated concrete class based on AbstractMutationOperator."""
+    mutation_operators_dictionary = {
+        MutationOperators.GAUSSIAN: GaussianMutationOperator,
+        MutationOperators.UNIFORM: UniformMutationOperator,
+        MutationOperators.INTEGER_STEP: IntegerStepMutationOperator,
+        MutationOperators.BIT_FLIP: BitFlipMutationOperator,
+    }
+
+    @classmethod
+    def get_mutation_operator(cls, mutation_operator: MutationOperators) -> type(AbstractMutationOperator):
+        """Return class of desired AbstractMutationOperator."""
+        return cls.mutation_operators_dictionary[mutation_operator]
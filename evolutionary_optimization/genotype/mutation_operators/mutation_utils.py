@@ -0,0 +1,47 @@
+from enum import Enum
+from typing import Tuple, Union
+
+import numpy as np
+
+
+class BoundHandlings(str, Enum):
+    """Enum containing the ways mutation operators can keep genes within the value_range of the genotype."""
+    NONE = "none"
+    CLIP = "clip"
+    REFLECT = "reflect"
+
+
+def apply_bounds(
+    genes: np.ndarray,
+    value_range: Tuple[Union[int, float], Union[int, float]],
+    bound_handling: BoundHandlings,
+) -> np.ndarray:
+    """Bring the genes outside value_range back into it.
+
+    With CLIP a gene outside the range is set to the nearest bound, with REFLECT it is mirrored at the bound it
+    crossed, as many times as needed, so that a mutation near a bound keeps its magnitude.
+
+    Args:
+        genes: array of genes.
+        value_range: minimum and maximum values of a gene.
+        bound_handling: how genes outside value_range are handled, NONE leaves them unchanged.
+
+    Returns:
+        Array of the same shape with every gene within value_range.
+    """
+    if bound_handling == BoundHandlings.NONE:
+        return genes
+
+    lower_bound, upper_bound = value_range
+    if bound_handling == BoundHandlings.CLIP or upper_bound == lower_bound:
+        return np.clip(genes, lower_bound, upper_bound)
+    elif bound_handling == BoundHandlings.REFLECT:
+        width = upper_bound - lower_bound
+        position_in_period = np.mod(genes - lower_bound, 2 * width)
+        reflected_genes = lower_bound + np.where(
+            position_in_period > width, 2 * width - position_in_period, position_in_period,
+        )
+        # genes within range are kept as they are, so that they are not changed by rounding errors
+        return np.where((genes < lower_bound) | (genes > upper_bound), reflected_genes, genes)
+    else:
+        raise NameError(f"Unknown bound handling {bound_handling}")
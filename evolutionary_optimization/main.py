@@ -1,3 +1,12 @@
+import argparse
+import sys
+
+from evolutionary_optimization.benchmarks.convergence_benchmark import CONVERGENCE_PROBLEMS, DEFAULT_TARGETS, \
+    build_convergence_cases, run_convergence_benchmark, save_convergence_runs, summarise_convergence_runs
+from evolutionary_optimization.benchmarks.throughput_benchmark import build_benchmark_cases, \
+    compare_benchmark_results, load_benchmark_results, run_benchmark_suite, save_benchmark_results
+from evolutionary_optimization.evaluators.evaluator_utils import parse_address
+from evolutionary_optimization.evaluators.remote_worker import run_worker
 from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
 from evolutionary_optimization.fitness_functions.fitness_interface import FitnessFunctions, FitnessFunction
 from evolutionary_optimization.genotype.genotype_model.genotype_interface import Genotype, Genotypes
@@ -35,5 +44,131 @@ def run_evolutionary_alg():
     evolutionary_algorithm.plot_phenotype_function_and_best_individuals(phenotype_function_points_tuple)
     evolutionary_algorithm.create_gif(phenotype_function_points_tuple)
 
+
+def run_evolution_worker():
+    parser = argparse.ArgumentParser(description="Evaluate phenotypes for a RemoteEvaluator.")
+    parser.add_argument("address", help="address of the coordinator, host:port or unix:path")
+    parser.add_argument("--authentication-key", default=None, help="key shared with the coordinator")
+    parser.add_argument("--name", default=None, help="name identifying the worker on the coordinator")
+    parser.add_argument("--connect-timeout", type=float, default=30.0,
+                        help="time in seconds during which connection attempts are repeated")
+    arguments = parser.parse_args()
+
+    run_worker(
+        address=parse_address(arguments.address),
+        authentication_key=arguments.authentication_key.encode() if arguments.authentication_key else None,
+        name=arguments.name,
+        connect_timeout=arguments.connect_timeout,
+    )
+
+
+def run_evolution_benchmark():
+    parser = argparse.ArgumentParser(description="Measure the throughput and memory use of the evolution loop.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run benchmark cases and write the results to a JSON file")
+    run_parser.add_argument("--genotypes", nargs="+", type=Genotypes, default=list(Genotypes),
+                            choices=list(Genotypes), metavar="GENOTYPE")
+    run_parser.add_argument("--phenotypes", nargs="+", type=Phenotypes, default=list(Phenotypes),
+                            choices=list(Phenotypes), metavar="PHENOTYPE")
+    run_parser.add_argument("--fitness-functions", nargs="+", type=FitnessFunctions, default=list(FitnessFunctions),
+                            choices=list(FitnessFunctions), metavar="FITNESS_FUNCTION")
+    run_parser.add_argument("--population-sizes", nargs="+", type=int, default=[100, 1000])
+    run_parser.add_argument("--gene-counts", nargs="+", type=int, default=[1, 2])
+    run_parser.add_argument("--backends", nargs="+", choices=["object", "array"], default=["object", "array"])
+    run_parser.add_argument("--generations", type=int, default=10, help="number of timed generations per case")
+    run_parser.add_argument("--output", default="benchmark_results.json")
+    run_parser.add_argument("--no-isolation", action="store_true",
+                            help="run all cases in this process, peak RSS is then shared by the cases")
+
+    compare_parser = subparsers.add_parser("compare", help="compare results against a baseline")
+    compare_parser.add_argument("baseline", help="JSON file of the baseline results")
+    compare_parser.add_argument("current", help="JSON file of the results to check")
+    compare_parser.add_argument("--tolerance", type=float, default=0.1,
+                                help="relative change allowed before a metric is flagged")
+
+    convergence_parser = subparsers.add_parser(
+        "convergence", help="measure the number of evaluations needed to reach target precisions"
+    )
+    convergence_parser.add_argument("--problems", nargs="+", choices=list(CONVERGENCE_PROBLEMS),
+                                    default=list(CONVERGENCE_PROBLEMS))
+    convergence_parser.add_argument("--genotypes", nargs="+", type=Genotypes, default=[Genotypes.FLOAT_LIST],
+                                    choices=list(Genotypes), metavar="GENOTYPE")
+    convergence_parser.add_argument("--population-sizes", nargs="+", type=int, default=[100])
+    convergence_parser.add_argument("--ratios-of-elite-individuals", nargs="+", type=float, default=[0.1])
+    convergence_parser.add_argument("--mutation-probabilities", nargs="+", type=float, default=[0.1])
+    convergence_parser.add_argument("--ratios-of-population-for-crossover", nargs="+", type=float, default=[0.5])
+    convergence_parser.add_argument("--max-evaluations", type=int, default=100000,
+                                    help="evaluation budget of every run")
+    convergence_parser.add_argument("--targets", nargs="+", type=float, default=list(DEFAULT_TARGETS),
+                                    help="precisions to reach, as absolute differences from the optimum")
+    convergence_parser.add_argument("--repetitions", type=int, default=15, help="number of seeded runs per case")
+    convergence_parser.add_argument("--seed", type=int, default=0)
+    convergence_parser.add_argument("--workers", type=int, default=None, help="number of processes")
+    convergence_parser.add_argument("--output", default="convergence_results.json")
+    arguments = parser.parse_args()
+
+    if arguments.command == "convergence":
+        cases = build_convergence_cases(
+            problems=[CONVERGENCE_PROBLEMS[name] for name in arguments.problems],
+            genotypes=arguments.genotypes,
+            population_sizes=arguments.population_sizes,
+            ratios_of_elite_individuals=arguments.ratios_of_elite_individuals,
+            mutation_probabilities=arguments.mutation_probabilities,
+            ratios_of_population_for_crossover=arguments.ratios_of_population_for_crossover,
+            max_number_of_evaluations=arguments.max_evaluations,
+        )
+        runs = run_convergence_benchmark(
+            cases,
+            number_of_repetitions=arguments.repetitions,
+            targets=arguments.targets,
+            seed=arguments.seed,
+            max_workers=arguments.workers,
+        )
+        save_convergence_runs(arguments.output, runs)
+        print(f"{'case':<90}{'target':>10}{'success':>10}{'ERT':>12}")
+        for summary in summarise_convergence_runs(runs):
+            print(f"{summary.case_key:<90}{summary.target:>10.0e}{summary.success_rate:>10.0%}"
+                  f"{summary.expected_running_time:>12.0f}")
+        print(f"results written to {arguments.output}")
+        return
+
+    if arguments.command == "run":
+        cases = build_benchmark_cases(
+            genotypes=arguments.genotypes,
+            phenotypes=arguments.phenotypes,
+            fitness_functions=arguments.fitness_functions,
+            population_sizes=arguments.population_sizes,
+            gene_counts=arguments.gene_counts,
+            use_array_population=[backend == "array" for backend in arguments.backends],
+            number_of_generations=arguments.generations,
+        )
+        results = run_benchmark_suite(cases, isolate=not arguments.no_isolation)
+        save_benchmark_results(arguments.output, results)
+        number_of_skipped_cases = sum(result.status == "skipped" for result in results)
+        number_of_failed_cases = sum(result.status == "failed" for result in results)
+        for result in results:
+            if result.status == "failed":
+                print(f"{result.case.key} failed: {result.reason}")
+        print(f"{len(results) - number_of_skipped_cases - number_of_failed_cases} cases measured, "
+              f"{number_of_skipped_cases} skipped, {number_of_failed_cases} failed, "
+              f"results written to {arguments.output}")
+        return
+
+    regressions = compare_benchmark_results(
+        load_benchmark_results(arguments.baseline),
+        load_benchmark_results(arguments.current),
+        tolerance=arguments.tolerance,
+    )
+    for regression in regressions:
+        if regression.reason is not None:
+            print(f"{regression.case_key} {regression.metric}: ok -> {regression.reason}")
+        else:
+            print(f"{regression.case_key} {regression.metric}: {regression.baseline_value:.6g} -> "
+                  f"{regression.current_value:.6g} ({regression.relative_change:+.1%})")
+    print(f"{len(regressions)} regressions found")
+    sys.exit(1 if regressions else 0)
+
+
 if __name__ == '__main__':
    run_evolutionary_alg()
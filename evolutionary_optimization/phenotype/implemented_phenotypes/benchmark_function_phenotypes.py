@@ -0,0 +1,54 @@
+from evolutionary_optimization.phenotype.phenotype_model.abstract_benchmark_phenotype import AbstractBenchmarkPhenotype
+from evolutionary_optimization.phenotype.phenotype_model.benchmark_function_utils import sphere_function, \
+    rastrigin_function, rosenbrock_function, ackley_function, griewank_function, schwefel_function, \
+    SCHWEFEL_OPTIMUM_ARGUMENT
+
+
+class SpherePhenotype(AbstractBenchmarkPhenotype):
+    """Sum of the squares of the genotype values, unimodal and separable."""
+    __slots__ = ()
+
+    objective_function = staticmethod(sphere_function)
+    default_value_range = (-5.12, 5.12)
+
+
+class RastriginPhenotype(AbstractBenchmarkPhenotype):
+    """Sphere with a cosine modulation, a regular grid of local minima around the global one."""
+    __slots__ = ()
+
+    objective_function = staticmethod(rastrigin_function)
+    default_value_range = (-5.12, 5.12)
+
+
+class RosenbrockPhenotype(AbstractBenchmarkPhenotype):
+    """Narrow curved valley leading to the optimum where every genotype value is 1, needs at least 2 genes."""
+    __slots__ = ()
+
+    objective_function = staticmethod(rosenbrock_function)
+    optimum_argument = 1.0
+    default_value_range = (-2.048, 2.048)
+
+
+class AckleyPhenotype(AbstractBenchmarkPhenotype):
+    """Nearly flat surface with many shallow local minima and a deep hole at the optimum."""
+    __slots__ = ()
+
+    objective_function = staticmethod(ackley_function)
+    default_value_range = (-32.768, 32.768)
+
+
+class GriewankPhenotype(AbstractBenchmarkPhenotype):
+    """Wide parabola with a product of cosines adding local minima that flatten out in high dimensions."""
+    __slots__ = ()
+
+    objective_function = staticmethod(griewank_function)
+    default_value_range = (-600.0, 600.0)
+
+
+class SchwefelPhenotype(AbstractBenchmarkPhenotype):
+    """Deceptive function whose optimum is far from the second best local minima, close to the bounds."""
+    __slots__ = ()
+
+    objective_function = staticmethod(schwefel_function)
+    optimum_argument = SCHWEFEL_OPTIMUM_ARGUMENT
+    default_value_range = (-500.0, 500.0)
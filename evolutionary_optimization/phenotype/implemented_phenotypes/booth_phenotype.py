@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Tuple, Optional
 
 import numpy as np
 
@@ -6,6 +6,8 @@ from evolutionary_optimization.genotype.genotype_model.abstract_genotype import
 from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
 
 class BoothPhenotype(AbstractPhenotype):
+    __slots__ = ("_genotype", "_phenotype_value")
+
     # TODO (Marta): Import of abstract phenotype doesn't work
     def __init__(self, genotype: AbstractGenotype): # Union[BinaryListGenotype, IntegerListGenotype]
         """Initialise InvertedParabolaPhenotype object.
@@ -15,6 +17,7 @@ class BoothPhenotype(AbstractPhenotype):
         """
         self._genotype = genotype
         self._phenotype_value = None
+        self._fitness_score = None
 
     @property
     def genotype(self):
@@ -23,8 +26,9 @@ class BoothPhenotype(AbstractPhenotype):
 
     @genotype.setter
     def genotype(self, value):
-        """Setter for genotype property."""
+        """Setter for genotype property, invalidates the cached phenotype value and fitness score."""
         self._genotype = value
+        self.invalidate_cache()
 
     @property
     def phenotype_value(self):
@@ -37,14 +41,13 @@ class BoothPhenotype(AbstractPhenotype):
         self._phenotype_value = value
 
     @classmethod
-    def from_phenotype(cls, base_phenotype: "BoothPhenotype") -> "BoothPhenotype":
+    def from_phenotype(
+        cls,
+        base_phenotype: "BoothPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> "BoothPhenotype":
         """Create new phenotype with the same attributes as the base phenotype, but a new random genotype.genotype."""
-        new_genotype = base_phenotype.genotype.build_random_genotype(
-            number_of_genes=base_phenotype.genotype.number_of_genes,
-            value_range=base_phenotype.genotype.value_range,
-            mutation_probability=base_phenotype.genotype.mutation_probability,
-            ratio_of_population_for_crossover=base_phenotype.genotype.ratio_of_population_for_crossover,
-        )
+        new_genotype = base_phenotype.genotype.random_from_genotype(base_phenotype.genotype, rng)
         return cls(new_genotype)
 
     def evaluate_phenotype(self):
@@ -65,7 +68,16 @@ class BoothPhenotype(AbstractPhenotype):
     def evaluate_phenotype_using_arrays(x_values: np.ndarray, y_values: np.ndarray) -> np.ndarray:
         return (x_values + y_values - 7) ** 2 + (2 * x_values + y_values - 5) ** 2
 
-    def crossover(self, parent_2: "BoothPhenotype") -> Tuple["BoothPhenotype", "BoothPhenotype"]:
+    def evaluate_phenotype_batch(self, genotype_matrix: np.ndarray) -> np.ndarray:
+        """Calculate phenotype values for many genotypes at once, using the first two genes of each row."""
+        genotype_matrix = np.asarray(genotype_matrix, dtype=float)
+        return self.evaluate_phenotype_using_arrays(genotype_matrix[:, 0], genotype_matrix[:, 1])
+
+    def crossover(
+        self,
+        parent_2: "BoothPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple["BoothPhenotype", "BoothPhenotype"]:
         """Perform crossover between two phenotypes.
 
         Calls crossover method from the genotype attribute. Combines a portion of this object's genotype
@@ -74,19 +86,27 @@ class BoothPhenotype(AbstractPhenotype):
 
         Args:
             parent_2: a phenotype of the same class whose genotype will be mixed with
+            rng: random generator, defaults to a module level generator.
 
         Returns:
-            Two new phenotype instances based on the combined genotypes of the two parents.
+            Two new phenotype instances based on the combined genotypes of the two parents. If the genotypes
+                could not be combined the parents are returned, keeping their cached phenotype values.
         """
-        child_genotype_1, child_genotype_2 = self.genotype.crossover(parent_2.genotype)
-        child_1 = BoothPhenotype(child_genotype_1)
-        child_2 = BoothPhenotype(child_genotype_2)
+        child_genotype_1, child_genotype_2 = self.genotype.crossover(parent_2.genotype, rng)
+        if child_genotype_1 is self.genotype and child_genotype_2 is parent_2.genotype:
+            return self, parent_2
+        child_1 = self.from_genotype(self, child_genotype_1)
+        child_2 = self.from_genotype(self, child_genotype_2)
         return child_1, child_2
 
-    def mutate(self):
+    def mutate(self, rng: Optional[np.random.Generator] = None):
         """In place modification of the genotype by randomly changing genes based on mutation probability.
 
         Calls mutate method as implemented for the genotype attribute in order to perform mutation.
-        Updates genotype attribute in place.
+        Updates genotype attribute in place and invalidates the cached phenotype value and fitness score.
+
+        Args:
+            rng: random generator, defaults to a module level generator.
         """
-        self.genotype.mutate()
+        self.genotype.mutate(rng)
+        self.invalidate_cache()
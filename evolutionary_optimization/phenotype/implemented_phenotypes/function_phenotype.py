@@ -0,0 +1,126 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
+from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
+
+
+class FunctionPhenotype(AbstractPhenotype):
+    __slots__ = ("_genotype", "_phenotype_value", "function")
+
+    def __init__(self, genotype: AbstractGenotype, function: Callable[[ndarray], ndarray]):
+        """Initialise FunctionPhenotype object.
+
+        The phenotype value is calculated by a single vectorized function taking a matrix with one row of
+        genotype.genotype values per individual and returning one value per row, e.g.
+        lambda genotype_matrix: np.sum(genotype_matrix ** 2, axis=1). The same function is used to evaluate one
+        individual, a whole population at once and the grid of points used for plotting.
+
+        Args
+            genotype: an AbstractGenotype that defines the phenotype.
+            function: vectorized function mapping an array of shape (number of individuals, number of genotype
+                values) to an array of shape (number of individuals,). It has to be picklable, e.g. defined at
+                module level, to be used with a ProcessPoolEvaluator or an IslandModel.
+        """
+        self._genotype = genotype
+        self._phenotype_value = None
+        self._fitness_score = None
+        self.function = function
+
+    @property
+    def genotype(self):
+        """AbstractGenotype that defines the phenotype."""
+        return self._genotype
+
+    @genotype.setter
+    def genotype(self, value):
+        """Setter for genotype property, invalidates the cached phenotype value and fitness score."""
+        self._genotype = value
+        self.invalidate_cache()
+
+    @property
+    def phenotype_value(self):
+        """Stores value of the phenotype based on the genotype - calculated using evaluate_phenotype."""
+        return self._phenotype_value
+
+    @phenotype_value.setter
+    def phenotype_value(self, value):
+        """Setter for phenotype_value property."""
+        self._phenotype_value = value
+
+    @classmethod
+    def from_phenotype(
+        cls,
+        base_phenotype: "FunctionPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> "FunctionPhenotype":
+        """Create new phenotype with the function of the base phenotype and a new random genotype."""
+        new_genotype = base_phenotype.genotype.random_from_genotype(base_phenotype.genotype, rng)
+        return cls(new_genotype, base_phenotype.function)
+
+    @classmethod
+    def from_genotype(cls, base_phenotype: "FunctionPhenotype", genotype: AbstractGenotype) -> "FunctionPhenotype":
+        """Create new phenotype with the function of the base phenotype and the given genotype."""
+        return cls(genotype, base_phenotype.function)
+
+    def evaluate_phenotype(self):
+        """In place method to calculate phenotype value using genotype, by calling the function on a single row."""
+        phenotype_values = self.evaluate_phenotype_batch(np.asarray([self.genotype.genotype]))
+        self.phenotype_value = phenotype_values[0].item()
+
+    def crossover(
+        self,
+        parent_2: "FunctionPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple["FunctionPhenotype", "FunctionPhenotype"]:
+        """Perform crossover between two phenotypes.
+
+        Calls crossover method from the genotype attribute. Combines a portion of this object's genotype
+        with that of parent_2 to return 2 new phenotypes based on the combined genotypes.
+        The new genotype length is the same as of the parents.
+
+        Args:
+            parent_2: a phenotype of the same class whose genotype will be mixed with
+            rng: random generator, defaults to a module level generator.
+
+        Returns:
+            Two new phenotype instances based on the combined genotypes of the two parents. If the genotypes
+                could not be combined the parents are returned, keeping their cached phenotype values.
+        """
+        child_genotype_1, child_genotype_2 = self.genotype.crossover(parent_2.genotype, rng)
+        if child_genotype_1 is self.genotype and child_genotype_2 is parent_2.genotype:
+            return self, parent_2
+        child_1 = self.from_genotype(self, child_genotype_1)
+        child_2 = self.from_genotype(self, child_genotype_2)
+        return child_1, child_2
+
+    def mutate(self, rng: Optional[np.random.Generator] = None):
+        """In place modification of the genotype by randomly changing genes based on mutation probability.
+
+        Calls mutate method as implemented for the genotype attribute in order to perform mutation.
+        Updates genotype attribute in place and invalidates the cached phenotype value and fitness score.
+
+        Args:
+            rng: random generator, defaults to a module level generator.
+        """
+        self.genotype.mutate(rng)
+        self.invalidate_cache()
+
+    def evaluate_phenotype_using_arrays(self, x_values: ndarray, y_values: Optional[ndarray] = None) -> ndarray:
+        """Calculate phenotype values on a grid of points, e.g. the meshgrid used for plotting.
+
+        Args:
+            x_values: array of values of the first genotype value.
+            y_values: optional array of the same shape of values of the second genotype value.
+
+        Returns:
+            Array of the shape of x_values with the phenotype value of each point.
+        """
+        columns = [np.ravel(x_values)] if y_values is None else [np.ravel(x_values), np.ravel(y_values)]
+        return self.evaluate_phenotype_batch(np.stack(columns, axis=1)).reshape(np.shape(x_values))
+
+    def evaluate_phenotype_batch(self, genotype_matrix: ndarray) -> ndarray:
+        """Calculate phenotype values for many genotypes at once with a single call of the function."""
+        return np.asarray(self.function(np.asarray(genotype_matrix, dtype=float)), dtype=float)
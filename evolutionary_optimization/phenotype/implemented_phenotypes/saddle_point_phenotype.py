@@ -1,11 +1,14 @@
-from typing import Tuple
+from typing import Tuple, Optional
 
+import numpy as np
 from numpy import ndarray
 
 from evolutionary_optimization.genotype.implemented_genotypes.float_list_genotype import FloatListGenotype
 from evolutionary_optimization.phenotype import AbstractPhenotype
 
 class SaddlePointPhenotype(AbstractPhenotype):
+    __slots__ = ("_genotype", "_phenotype_value")
+
     def __init__(self, genotype: FloatListGenotype):
         """Initialise AbstractPhenotype object.
 
@@ -14,6 +17,7 @@ class SaddlePointPhenotype(AbstractPhenotype):
         """
         self._genotype = genotype
         self._phenotype_value = None
+        self._fitness_score = None
 
     @property
     def genotype(self):
@@ -22,8 +26,9 @@ class SaddlePointPhenotype(AbstractPhenotype):
 
     @genotype.setter
     def genotype(self, value):
-        """Setter for genotype property."""
+        """Setter for genotype property, invalidates the cached phenotype value and fitness score."""
         self._genotype = value
+        self.invalidate_cache()
 
     @property
     def phenotype_value(self):
@@ -41,7 +46,11 @@ class SaddlePointPhenotype(AbstractPhenotype):
         y = (x ** 4) - (2 * x ** 3) + 2
         self.phenotype_value = y
 
-    def crossover(self, parent_2: "AbstractPhenotype") -> Tuple["AbstractPhenotype", "AbstractPhenotype"]:
+    def crossover(
+        self,
+        parent_2: "AbstractPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple["AbstractPhenotype", "AbstractPhenotype"]:
         """Perform crossover between two phenotypes.
 
         Calls crossover method from the genotype attribute. Combines a portion of this object's genotype
@@ -50,34 +59,46 @@ class SaddlePointPhenotype(AbstractPhenotype):
 
         Args:
             parent_2: a phenotype of the same class whose genotype will be mixed with
+            rng: random generator, defaults to a module level generator.
 
         Returns:
-            Two new phenotype instances based on the combined genotypes of the two parents.
+            Two new phenotype instances based on the combined genotypes of the two parents. If the genotypes
+                could not be combined the parents are returned, keeping their cached phenotype values.
         """
-        child_genotype_1, child_genotype_2 = self.genotype.crossover(parent_2.genotype)
-        child_1 = SaddlePointPhenotype(child_genotype_1)
-        child_2 = SaddlePointPhenotype(child_genotype_2)
+        child_genotype_1, child_genotype_2 = self.genotype.crossover(parent_2.genotype, rng)
+        if child_genotype_1 is self.genotype and child_genotype_2 is parent_2.genotype:
+            return self, parent_2
+        child_1 = self.from_genotype(self, child_genotype_1)
+        child_2 = self.from_genotype(self, child_genotype_2)
         return child_1, child_2
 
-    def mutate(self):
+    def mutate(self, rng: Optional[np.random.Generator] = None):
         """In place modification of the genotype by randomly changing genes based on mutation probability.
 
         Calls mutate method as implemented for the genotype attribute in order to perform mutation.
-        Updates genotype attribute in place.
+        Updates genotype attribute in place and invalidates the cached phenotype value and fitness score.
+
+        Args:
+            rng: random generator, defaults to a module level generator.
         """
-        self.genotype.mutate()
+        self.genotype.mutate(rng)
+        self.invalidate_cache()
 
     @classmethod
-    def from_phenotype(cls, base_phenotype: "AbstractPhenotype"):
+    def from_phenotype(
+        cls,
+        base_phenotype: "AbstractPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ):
         """Create new phenotype with the same attributes as the base phenotype."""
-        new_genotype = base_phenotype.genotype.build_random_genotype(
-            number_of_genes=base_phenotype.genotype.number_of_genes,
-            value_range=base_phenotype.genotype.value_range,
-            mutation_probability=base_phenotype.genotype.mutation_probability,
-            ratio_of_population_for_crossover=base_phenotype.genotype.ratio_of_population_for_crossover,
-        )
+        new_genotype = base_phenotype.genotype.random_from_genotype(base_phenotype.genotype, rng)
         return cls(new_genotype)
 
     @staticmethod
-    def evaluate_phenotype_using_arrays(x_values: ndarray, y_values: ndarray) -> ndarray:
-        pass
+    def evaluate_phenotype_using_arrays(x_values: ndarray, y_values: Optional[ndarray] = None) -> ndarray:
+        """Calculate multiple phenotype values from numpy arrays, y_values are not used."""
+        return (x_values ** 4) - (2 * x_values ** 3) + 2
+
+    def evaluate_phenotype_batch(self, genotype_matrix: ndarray) -> ndarray:
+        """Calculate phenotype values for many genotypes at once, only the first gene of each row is used."""
+        return self.evaluate_phenotype_using_arrays(np.asarray(genotype_matrix, dtype=float)[:, 0])
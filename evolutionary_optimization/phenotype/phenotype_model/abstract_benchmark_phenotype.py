@@ -0,0 +1,96 @@
+from abc import abstractmethod
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+
+from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
+from evolutionary_optimization.phenotype.implemented_phenotypes.function_phenotype import FunctionPhenotype
+from evolutionary_optimization.phenotype.phenotype_model.benchmark_function_utils import TransformedFunction
+
+
+class AbstractBenchmarkPhenotype(FunctionPhenotype):
+    """FunctionPhenotype of a standard test function of any number of dimensions with a known optimum.
+
+    Attributes:
+        optimum_argument: value of every coordinate of the optimum of the untransformed objective function.
+        optimum_phenotype_value: phenotype value at the optimum, unchanged by the shift and rotation.
+        default_value_range: search domain in which the function is usually benchmarked.
+    """
+    __slots__ = ()
+
+    optimum_argument: float = 0.0
+    optimum_phenotype_value: float = 0.0
+    default_value_range: Tuple[float, float] = (-5.12, 5.12)
+
+    def __init__(
+        self,
+        genotype: AbstractGenotype,
+        shift: Optional[ndarray] = None,
+        rotation: Optional[ndarray] = None,
+        function: Optional[TransformedFunction] = None,
+    ):
+        """Initialise AbstractBenchmarkPhenotype object.
+
+        The phenotype value is objective_function(rotation @ (x - shift)) where x is the genotype.genotype, one
+        value per dimension. Build the shift and rotation once per run, e.g. with build_random_shift and
+        build_random_rotation, the phenotypes created from this one share them.
+
+        Args
+            genotype: an AbstractGenotype that defines the phenotype, with one genotype value per dimension.
+            shift: optional vector of length number of dimensions moving the optimum.
+            rotation: optional orthogonal matrix of shape (number of dimensions, number of dimensions) making the
+                coordinates non separable.
+            function: transformed objective function shared with other phenotypes of the run, e.g. by
+                from_genotype. When given it is used instead of shift and rotation.
+        """
+        if function is None:
+            function = TransformedFunction(self.objective_function, shift, rotation)
+        super().__init__(genotype, function)
+
+    @staticmethod
+    @abstractmethod
+    def objective_function(points: ndarray) -> ndarray:
+        """Vectorized test function, mapping an array of shape (number of points, number of dimensions) to an
+        array of shape (number of points,)."""
+        pass
+
+    @property
+    def shift(self) -> Optional[ndarray]:
+        """Vector moving the optimum, None if the function is not shifted."""
+        return self.function.shift
+
+    @property
+    def rotation(self) -> Optional[ndarray]:
+        """Orthogonal matrix applied after the shift, None if the function is not rotated."""
+        return self.function.rotation
+
+    @classmethod
+    def from_phenotype(
+        cls,
+        base_phenotype: "AbstractBenchmarkPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> "AbstractBenchmarkPhenotype":
+        """Create new phenotype with the transformed function of the base phenotype and a new random genotype."""
+        new_genotype = base_phenotype.genotype.random_from_genotype(base_phenotype.genotype, rng)
+        return cls(new_genotype, function=base_phenotype.function)
+
+    @classmethod
+    def from_genotype(
+        cls,
+        base_phenotype: "AbstractBenchmarkPhenotype",
+        genotype: AbstractGenotype,
+    ) -> "AbstractBenchmarkPhenotype":
+        """Create new phenotype with the transformed function of the base phenotype and the given genotype."""
+        return cls(genotype, function=base_phenotype.function)
+
+    def optimum_location(self) -> ndarray:
+        """Return the genotype values at which the phenotype value is optimum_phenotype_value.
+
+        The number of dimensions is that of the shift or rotation, otherwise the number of genotype values.
+        A shift can move the optimum outside of the value range of the genotype.
+        """
+        number_of_dimensions = self.function.number_of_dimensions
+        if number_of_dimensions is None:
+            number_of_dimensions = self.genotype.number_of_variables
+        return self.function.transform_to_input(np.full(number_of_dimensions, self.optimum_argument))
@@ -1,11 +1,15 @@
+import inspect
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Optional, Tuple
 
+import numpy as np
 from numpy import ndarray
 
 from evolutionary_optimization.genotype.genotype_model.abstract_genotype import AbstractGenotype
 
 class AbstractPhenotype(ABC):
+    __slots__ = ("_fitness_score",)
+
     @abstractmethod
     def __init__(self, genotype: AbstractGenotype):
         """Initialise AbstractPhenotype object.
@@ -39,19 +43,47 @@ class AbstractPhenotype(ABC):
         """Phenotype_value setter."""
         pass
 
+    @property
+    def fitness_score(self):
+        """Cached fitness score of the phenotype, None if it was not scored since the genotype last changed."""
+        return getattr(self, "_fitness_score", None)
+
+    @fitness_score.setter
+    def fitness_score(self, value):
+        """Fitness_score setter."""
+        self._fitness_score = value
+
+    def invalidate_cache(self):
+        """Clear the cached phenotype value and fitness score, e.g. after the genotype has changed."""
+        self.phenotype_value = None
+        self.fitness_score = None
+
     @abstractmethod
     def evaluate_phenotype(self):
-        """Calculate phenotype value using genotype."""
+        """Calculate phenotype value using genotype.
+
+        This method can be defined with async def for phenotypes that wait on external resources,
+        such phenotypes are evaluated concurrently by Evolution.evolve_async.
+        """
         pass
 
+    def has_async_evaluation(self) -> bool:
+        """Return True if evaluate_phenotype is a coroutine function."""
+        return inspect.iscoroutinefunction(self.evaluate_phenotype)
+
     @abstractmethod
-    def crossover(self, parent_2: "AbstractPhenotype") -> Tuple["AbstractPhenotype", "AbstractPhenotype"]:
+    def crossover(
+        self,
+        parent_2: "AbstractPhenotype",
+        rng: Optional[np.random.Generator] = None,
+    ) -> Tuple["AbstractPhenotype", "AbstractPhenotype"]:
         """Perform crossover between two phenotypes.
 
         Calls crossover method from the genotype attribute.
 
         Args:
             parent_2: a phenotype of the same class whose genotype will be mixed with
+            rng: random generator, defaults to a module level generator.
 
         Returns:
             Two new phenotype instances based on the combined genotypes of the two parents.
@@ -59,18 +91,62 @@ class AbstractPhenotype(ABC):
         pass
 
     @abstractmethod
-    def mutate(self):
-        """In place modification of the genotype by randomly changing genes based on mutation probability."""
+    def mutate(self, rng: Optional[np.random.Generator] = None):
+        """In place modification of the genotype by randomly changing genes based on mutation probability.
+
+        Args:
+            rng: random generator, defaults to a module level generator.
+        """
         pass
 
     @classmethod
     @abstractmethod
-    def from_phenotype(cls, base_phenotype: "AbstractPhenotype"):
-        """Create new phenotype with the same attributes as the base phenotype."""
+    def from_phenotype(cls, base_phenotype: "AbstractPhenotype", rng: Optional[np.random.Generator] = None):
+        """Create new phenotype with the same attributes as the base phenotype and a random genotype.
+
+        Args:
+            base_phenotype: phenotype whose attributes are copied.
+            rng: random generator used to build the genotype, defaults to a module level generator.
+        """
         pass
 
+    @classmethod
+    def from_genotype(cls, base_phenotype: "AbstractPhenotype", genotype: AbstractGenotype) -> "AbstractPhenotype":
+        """Create new phenotype with the same attributes as the base phenotype and the given genotype."""
+        return cls(genotype)
+
+    def copy(self) -> "AbstractPhenotype":
+        """Return a new phenotype with a copy-on-write copy of the genotype and the same cached values.
+
+        The copy shares the genes of this phenotype until one of them is mutated, e.g. for the elite individuals
+        that are kept and also passed on to crossover and mutation.
+        """
+        phenotype_copy = self.from_genotype(self, self.genotype.copy())
+        phenotype_copy.phenotype_value = self.phenotype_value
+        phenotype_copy.fitness_score = self.fitness_score
+        return phenotype_copy
+
     @staticmethod
     @abstractmethod
     def evaluate_phenotype_using_arrays(x_values: ndarray, y_values: ndarray) -> ndarray:
         """Calculate multiple phenotype values from numpy arrays."""
         pass
+
+    def evaluate_phenotype_batch(self, genotype_matrix: ndarray) -> ndarray:
+        """Calculate phenotype values for many genotypes at once.
+
+        Phenotypes that can be calculated with numpy operations should override this method, the population
+        will then use it instead of calling evaluate_phenotype once per individual.
+
+        Args:
+            genotype_matrix: array of shape (number of individuals, number of genes), where each row holds the
+                genotype.genotype values of one individual.
+
+        Returns:
+            Array of shape (number of individuals,) with the phenotype value of each row.
+        """
+        raise NotImplementedError
+
+    def has_batch_evaluation(self) -> bool:
+        """Return True if this phenotype implements evaluate_phenotype_batch."""
+        return type(self).evaluate_phenotype_batch is not AbstractPhenotype.evaluate_phenotype_batch
@@ -0,0 +1,134 @@
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+from numpy import ndarray
+
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import get_random_generator
+
+SCHWEFEL_OPTIMUM_ARGUMENT = 420.9687462275036
+SCHWEFEL_CONSTANT = 418.9828872724339
+
+
+def sphere_function(points: ndarray) -> ndarray:
+    """Sum of the squares of the coordinates, minimum 0 at the origin."""
+    return np.sum(points ** 2, axis=1)
+
+
+def rastrigin_function(points: ndarray) -> ndarray:
+    """Highly multimodal function with a regular grid of local minima, minimum 0 at the origin."""
+    return 10 * points.shape[1] + np.sum(points ** 2 - 10 * np.cos(2 * np.pi * points), axis=1)
+
+
+def rosenbrock_function(points: ndarray) -> ndarray:
+    """Function with a narrow curved valley, minimum 0 where every coordinate is 1. Needs at least 2 dimensions."""
+    current, following = points[:, :-1], points[:, 1:]
+    return np.sum(100 * (following - current ** 2) ** 2 + (1 - current) ** 2, axis=1)
+
+
+def ackley_function(points: ndarray) -> ndarray:
+    """Nearly flat multimodal function with a deep hole, minimum 0 at the origin."""
+    root_mean_square = np.sqrt(np.mean(points ** 2, axis=1))
+    mean_cosine = np.mean(np.cos(2 * np.pi * points), axis=1)
+    return -20 * np.exp(-0.2 * root_mean_square) - np.exp(mean_cosine) + 20 + np.e
+
+
+def griewank_function(points: ndarray) -> ndarray:
+    """Multimodal function whose local minima flatten out in high dimensions, minimum 0 at the origin."""
+    dimension_indices = np.arange(1, points.shape[1] + 1)
+    return 1 + np.sum(points ** 2, axis=1) / 4000 - np.prod(np.cos(points / np.sqrt(dimension_indices)), axis=1)
+
+
+def schwefel_function(points: ndarray) -> ndarray:
+    """Deceptive multimodal function, minimum close to 0 where every coordinate is SCHWEFEL_OPTIMUM_ARGUMENT."""
+    return SCHWEFEL_CONSTANT * points.shape[1] - np.sum(points * np.sin(np.sqrt(np.abs(points))), axis=1)
+
+
+class TransformedFunction:
+    def __init__(
+        self,
+        function: Callable[[ndarray], ndarray],
+        shift: Optional[ndarray] = None,
+        rotation: Optional[ndarray] = None,
+    ):
+        """Initialise TransformedFunction object.
+
+        Evaluates function at rotation @ (x - shift) for every row x of a matrix, so that the optimum of the
+        function is moved by shift and its coordinates are no longer separable. The shift and rotation are
+        converted once and the same instance is shared by every phenotype of a run.
+
+        Args:
+            function: vectorized function mapping an array of shape (number of points, number of dimensions) to
+                an array of shape (number of points,).
+            shift: optional vector of length number of dimensions.
+            rotation: optional orthogonal matrix of shape (number of dimensions, number of dimensions).
+        """
+        self.function = function
+        self.shift = None if shift is None else np.asarray(shift, dtype=float)
+        self.rotation = None if rotation is None else np.asarray(rotation, dtype=float)
+        if self.shift is not None and self.rotation is not None and self.rotation.shape != 2 * self.shift.shape:
+            raise ValueError(f"Rotation of shape {self.rotation.shape} does not match shift of shape "
+                             f"{self.shift.shape}")
+
+    @property
+    def number_of_dimensions(self) -> Optional[int]:
+        """Number of dimensions fixed by the shift or rotation, None if the function is not transformed."""
+        if self.shift is not None:
+            return len(self.shift)
+        if self.rotation is not None:
+            return len(self.rotation)
+        return None
+
+    def __call__(self, points: ndarray) -> ndarray:
+        """Evaluate the function on every row of points after shifting and rotating them."""
+        if self.shift is not None:
+            points = points - self.shift
+        if self.rotation is not None:
+            points = points @ self.rotation.T
+        return self.function(points)
+
+    def transform_to_input(self, transformed_point: ndarray) -> ndarray:
+        """Return the point x whose transformed value rotation @ (x - shift) is transformed_point."""
+        point = np.asarray(transformed_point, dtype=float)
+        if self.rotation is not None:
+            point = self.rotation.T @ point
+        if self.shift is not None:
+            point = point + self.shift
+        return point
+
+
+def build_random_shift(
+    number_of_dimensions: int,
+    value_range: Tuple[Union[int, float], Union[int, float]],
+    rng: Optional[np.random.Generator] = None,
+    ratio_of_value_range: float = 0.8,
+) -> ndarray:
+    """Build a random shift vector for a benchmark phenotype.
+
+    Args:
+        number_of_dimensions: length of the shift.
+        value_range: minimum and maximum values of the genotype values.
+        rng: random generator, defaults to a module level generator.
+        ratio_of_value_range: ratio of the value range, centred on its middle, the shift is drawn from, so that the
+            moved optimum stays away from the bounds.
+
+    Returns:
+        Array of shape (number_of_dimensions,).
+    """
+    centre = (value_range[0] + value_range[1]) / 2
+    half_width = ratio_of_value_range * (value_range[1] - value_range[0]) / 2
+    return get_random_generator(rng).uniform(centre - half_width, centre + half_width, size=number_of_dimensions)
+
+
+def build_random_rotation(number_of_dimensions: int, rng: Optional[np.random.Generator] = None) -> ndarray:
+    """Build a random orthogonal matrix, uniformly distributed, from the QR decomposition of a gaussian matrix.
+
+    Args:
+        number_of_dimensions: number of rows and columns of the matrix.
+        rng: random generator, defaults to a module level generator.
+
+    Returns:
+        Array of shape (number_of_dimensions, number_of_dimensions).
+    """
+    gaussian_matrix = get_random_generator(rng).standard_normal((number_of_dimensions, number_of_dimensions))
+    orthogonal_matrix, upper_triangular_matrix = np.linalg.qr(gaussian_matrix)
+    return orthogonal_matrix * np.sign(np.diag(upper_triangular_matrix))
@@ -1,6 +1,9 @@
 from enum import Enum
 
+from evolutionary_optimization.phenotype.implemented_phenotypes.benchmark_function_phenotypes import \
+    AckleyPhenotype, GriewankPhenotype, RastriginPhenotype, RosenbrockPhenotype, SchwefelPhenotype, SpherePhenotype
 from evolutionary_optimization.phenotype.implemented_phenotypes.booth_phenotype import BoothPhenotype
+from evolutionary_optimization.phenotype.implemented_phenotypes.function_phenotype import FunctionPhenotype
 from evolutionary_optimization.phenotype.phenotype_model.abstract_phenotype import AbstractPhenotype
 from evolutionary_optimization.phenotype.implemented_phenotypes.inverted_parabola_phenotype import InvertedParabolaPhenotype
 from evolutionary_optimization.phenotype.implemented_phenotypes.parabola_phenotype import ParabolaPhenotype
@@ -13,6 +16,13 @@ class Phenotypes(str, Enum):
     INVERTED_PARABOLA = "inverted_parabola"
     SADDLE_POINT = "saddle_point"
     BOOTH = "booth"
+    FUNCTION = "function"
+    SPHERE = "sphere"
+    RASTRIGIN = "rastrigin"
+    ROSENBROCK = "rosenbrock"
+    ACKLEY = "ackley"
+    GRIEWANK = "griewank"
+    SCHWEFEL = "schwefel"
 
 class Phenotype:
     """Map Phenotypes to their associated concrete class based on AbstractPhenotype."""
@@ -21,6 +31,13 @@ class Phenotype:
         Phenotypes.INVERTED_PARABOLA: InvertedParabolaPhenotype,
         Phenotypes.SADDLE_POINT: SaddlePointPhenotype,
         Phenotypes.BOOTH: BoothPhenotype,
+        Phenotypes.FUNCTION: FunctionPhenotype,
+        Phenotypes.SPHERE: SpherePhenotype,
+        Phenotypes.RASTRIGIN: RastriginPhenotype,
+        Phenotypes.ROSENBROCK: RosenbrockPhenotype,
+        Phenotypes.ACKLEY: AckleyPhenotype,
+        Phenotypes.GRIEWANK: GriewankPhenotype,
+        Phenotypes.SCHWEFEL: SchwefelPhenotype,
     }
 
     @classmethod
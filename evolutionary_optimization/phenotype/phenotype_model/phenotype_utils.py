@@ -36,7 +36,11 @@ def generate_points_for_function(
     function_data = PlottingData(x=np.empty(0), y=np.empty(0))
     range_of_x = np.linspace(bottom_plotting_limit, upper_plotting_limit, num=number_of_points)
 
-    if number_of_dimensions == 2:
+    if number_of_dimensions == 2 and phenotype.has_batch_evaluation():
+        function_data.x = range_of_x
+        function_data.y = phenotype.evaluate_phenotype_batch(range_of_x[:, np.newaxis])
+
+    elif number_of_dimensions == 2:
         for x_datapoint in range_of_x:
             function_data.x = np.append(function_data.x, x_datapoint)
             phenotype.genotype.genotype = [x_datapoint]
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
+
+
+class AbstractTerminationCriterion(ABC):
+    reason: Optional[str] = None
+
+    def reset(self):
+        """Reset the state of the criterion, called by Evolution at the start of a run."""
+        self.reason = None
+
+    @abstractmethod
+    def is_met(self, evolution: "Evolution") -> bool:
+        """This method will check whether the run should stop, it is called by Evolution after every generation.
+
+        When the criterion is met, the reason attribute should describe why the run stopped.
+
+        Args:
+            evolution: Evolution instance being run.
+
+        Returns:
+            True if the run should stop.
+        """
+        pass
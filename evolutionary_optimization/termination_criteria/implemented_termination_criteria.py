@@ -0,0 +1,157 @@
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+from evolutionary_optimization.termination_criteria.abstract_termination_criterion import \
+    AbstractTerminationCriterion
+
+if TYPE_CHECKING:
+    from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
+
+
+class StagnationTerminationCriterion(AbstractTerminationCriterion):
+    def __init__(self, number_of_generations: int, tolerance: float = 0.0):
+        """Stop when the best fitness score did not improve over a number of generations.
+
+        Args:
+            number_of_generations: number of consecutive generations without improvement after which the run stops.
+            tolerance: minimum increase of the best fitness score counted as an improvement.
+        """
+        self.number_of_generations = number_of_generations
+        self.tolerance = tolerance
+        self.reset()
+
+    def reset(self):
+        """Forget the best fitness score seen so far."""
+        super().reset()
+        self._best_fitness_score: Optional[float] = None
+        self._generations_without_improvement = 0
+
+    def is_met(self, evolution: "Evolution") -> bool:
+        """Check whether the best fitness score improved by more than the tolerance in the last generations."""
+        best_fitness_score = evolution.population.best_fitness_score
+        if self._best_fitness_score is None or best_fitness_score > self._best_fitness_score + self.tolerance:
+            self._best_fitness_score = best_fitness_score
+            self._generations_without_improvement = 0
+            return False
+
+        self._generations_without_improvement += 1
+        if self._generations_without_improvement >= self.number_of_generations:
+            self.reason = f"Best fitness score did not improve by more than {self.tolerance} " \
+                          f"for {self.number_of_generations} generations"
+            return True
+        return False
+
+
+class TargetFitnessTerminationCriterion(AbstractTerminationCriterion):
+    def __init__(self, target_fitness_score: float):
+        """Stop when the best fitness score reaches a target.
+
+        Args:
+            target_fitness_score: fitness score at or above which the run stops. Fitness scores are maximised,
+                e.g. with a MinimizeFitnessFunction a target phenotype value of 0.01 is a fitness score of -0.01.
+        """
+        self.target_fitness_score = target_fitness_score
+
+    def is_met(self, evolution: "Evolution") -> bool:
+        """Check whether the best fitness score reached the target."""
+        best_fitness_score = evolution.population.best_fitness_score
+        if best_fitness_score is not None and best_fitness_score >= self.target_fitness_score:
+            self.reason = f"Best fitness score {best_fitness_score} reached target {self.target_fitness_score}"
+            return True
+        return False
+
+
+class EvaluationBudgetTerminationCriterion(AbstractTerminationCriterion):
+    def __init__(self, max_number_of_evaluations: int):
+        """Stop when the number of phenotype evaluations reaches a budget.
+
+        The criterion is checked between generations, so the budget can be exceeded by up to one generation.
+        Phenotype values reused from the previous generation or found in the evaluation cache are not counted.
+
+        Args:
+            max_number_of_evaluations: number of phenotype evaluations after which the run stops.
+        """
+        self.max_number_of_evaluations = max_number_of_evaluations
+
+    def is_met(self, evolution: "Evolution") -> bool:
+        """Check whether the population performed the maximum number of phenotype evaluations."""
+        number_of_evaluations = evolution.population.number_of_evaluations
+        if number_of_evaluations >= self.max_number_of_evaluations:
+            self.reason = f"Performed {number_of_evaluations} phenotype evaluations, " \
+                          f"budget is {self.max_number_of_evaluations}"
+            return True
+        return False
+
+
+class WallClockTerminationCriterion(AbstractTerminationCriterion):
+    def __init__(self, max_seconds: float):
+        """Stop when the run has lasted longer than a deadline.
+
+        The criterion is checked between generations, so the run can exceed the deadline by up to one generation.
+
+        Args:
+            max_seconds: duration of the run in seconds after which it stops.
+        """
+        self.max_seconds = max_seconds
+        self.reset()
+
+    def reset(self):
+        """Start the clock."""
+        super().reset()
+        self._start_time = time.monotonic()
+
+    def is_met(self, evolution: "Evolution") -> bool:
+        """Check whether the time elapsed since the start of the run exceeds the deadline."""
+        elapsed_time = time.monotonic() - self._start_time
+        if elapsed_time >= self.max_seconds:
+            self.reason = f"Run lasted {elapsed_time:.1f}s, deadline is {self.max_seconds}s"
+            return True
+        return False
+
+
+class AnyTerminationCriteria(AbstractTerminationCriterion):
+    def __init__(self, criteria: List[AbstractTerminationCriterion]):
+        """Stop as soon as one of several criteria is met.
+
+        Args:
+            criteria: termination criteria to combine.
+        """
+        self.criteria = criteria
+
+    def reset(self):
+        """Reset all combined criteria."""
+        super().reset()
+        for criterion in self.criteria:
+            criterion.reset()
+
+    def is_met(self, evolution: "Evolution") -> bool:
+        """Check every criterion, so that stateful criteria see every generation, and stop if any is met."""
+        met_criteria = [criterion for criterion in self.criteria if criterion.is_met(evolution)]
+        if met_criteria:
+            self.reason = met_criteria[0].reason
+            return True
+        return False
+
+
+class AllTerminationCriteria(AbstractTerminationCriterion):
+    def __init__(self, criteria: List[AbstractTerminationCriterion]):
+        """Stop when all of several criteria are met at the same generation.
+
+        Args:
+            criteria: termination criteria to combine.
+        """
+        self.criteria = criteria
+
+    def reset(self):
+        """Reset all combined criteria."""
+        super().reset()
+        for criterion in self.criteria:
+            criterion.reset()
+
+    def is_met(self, evolution: "Evolution") -> bool:
+        """Check every criterion, so that stateful criteria see every generation, and stop if all are met."""
+        criteria_met = [criterion.is_met(evolution) for criterion in self.criteria]
+        if all(criteria_met):
+            self.reason = " and ".join(criterion.reason for criterion in self.criteria)
+            return True
+        return False
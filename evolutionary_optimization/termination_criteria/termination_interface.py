@@ -0,0 +1,35 @@
+from enum import Enum
+
+from evolutionary_optimization.termination_criteria.abstract_termination_criterion import \
+    AbstractTerminationCriterion
+from evolutionary_optimization.termination_criteria.implemented_termination_criteria import \
+    StagnationTerminationCriterion, TargetFitnessTerminationCriterion, EvaluationBudgetTerminationCriterion, \
+    WallClockTerminationCriterion, AnyTerminationCriteria, AllTerminationCriteria
+
+
+class TerminationCriteria(str, Enum):
+    """Enum containing implemented termination criteria."""
+    STAGNATION = "stagnation"
+    TARGET_FITNESS = "target_fitness"
+    EVALUATION_BUDGET = "evaluation_budget"
+    WALL_CLOCK = "wall_clock"
+    ANY = "any"
+    ALL = "all"
+
+
+class TerminationCriterion:
+    """Maps TerminationCriteria to their associated concrete class based on AbstractTerminationCriterion."""
+    termination_criteria_dictionary = {
+        TerminationCriteria.STAGNATION: StagnationTerminationCriterion,
+        TerminationCriteria.TARGET_FITNESS: TargetFitnessTerminationCriterion,
+        TerminationCriteria.EVALUATION_BUDGET: EvaluationBudgetTerminationCriterion,
+        TerminationCriteria.WALL_CLOCK: WallClockTerminationCriterion,
+        TerminationCriteria.ANY: AnyTerminationCriteria,
+        TerminationCriteria.ALL: AllTerminationCriteria,
+    }
+
+    @classmethod
+    def get_termination_criterion(cls, termination_criterion: TerminationCriteria) \
+            -> type(AbstractTerminationCriterion):
+        """Return class of desired AbstractTerminationCriterion."""
+        return cls.termination_criteria_dictionary[termination_criterion]
@@ -0,0 +1,28 @@
+import numpy as np
+
+from evolutionary_optimization.fitness_functions import normalize_fitness_scores, normalized_rank_fitness_scores, \
+    rank_fitness_scores
+
+
+def test_rank_fitness_scores_ranks_ties_in_order_of_appearance():
+    ranks = rank_fitness_scores(np.array([3.0, 1.0, 3.0, -2.0, 1.0]))
+    np.testing.assert_array_equal(ranks, [3, 1, 4, 0, 2])
+
+
+def test_normalized_rank_fitness_scores_are_in_unit_interval():
+    scaled_ranks = normalized_rank_fitness_scores(np.array([5.0, -1.0, 5.0, 2.0, 0.0]))
+    np.testing.assert_allclose(scaled_ranks, [0.75, 0.0, 1.0, 0.5, 0.25])
+
+
+def test_normalized_rank_fitness_scores_of_single_individual():
+    np.testing.assert_array_equal(normalized_rank_fitness_scores(np.array([7.0])), [0.0])
+
+
+def test_normalize_fitness_scores_maps_extremes_to_0_and_1():
+    normalized_scores = normalize_fitness_scores(np.array([-10.0, 0.0, 30.0, 30.0]))
+    np.testing.assert_allclose(normalized_scores, [0.0, 0.25, 1.0, 1.0])
+    assert normalized_scores.min() == 0 and normalized_scores.max() == 1
+
+
+def test_normalize_fitness_scores_with_equal_scores():
+    np.testing.assert_array_equal(normalize_fitness_scores(np.array([2.0, 2.0, 2.0])), [1.0, 1.0, 1.0])
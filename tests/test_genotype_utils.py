@@ -0,0 +1,21 @@
+import numpy as np
+
+from evolutionary_optimization.genotype.genotype_model.genotype_utils import single_point_crossover, \
+    single_point_crossover_population
+
+
+def test_single_point_crossover_joins_the_complementary_slices():
+    child_genotype = single_point_crossover([1, 2, 3, 4, 5], [6, 7, 8, 9, 10], 2)
+
+    assert child_genotype == [1, 2, 8, 9, 10]
+    assert all(isinstance(gene, int) for gene in child_genotype)
+
+
+def test_single_point_crossover_matches_the_first_child_of_the_population_crossover():
+    parents_1 = np.arange(6, dtype=float).reshape(2, 3)
+    parents_2 = -parents_1 - 1
+    children_1, _ = single_point_crossover_population(parents_1, parents_2, np.random.default_rng(0))
+
+    gene_slice_indices = np.random.default_rng(0).integers(1, 3, size=2)
+    for parent_1, parent_2, gene_slice_index, child in zip(parents_1, parents_2, gene_slice_indices, children_1):
+        assert single_point_crossover(parent_1.tolist(), parent_2.tolist(), gene_slice_index) == child.tolist()
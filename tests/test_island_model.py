@@ -0,0 +1,46 @@
+import pytest
+
+from evolutionary_optimization.evolutionary_algorithm.checkpoint import Checkpointer
+from evolutionary_optimization.evolutionary_algorithm.island_model import IslandModel
+from evolutionary_optimization.fitness_functions.implemented_fitness_functions import MinimizeFitnessFunction
+from evolutionary_optimization.genotype.implemented_genotypes.float_list_genotype import FloatListGenotype
+from evolutionary_optimization.phenotype.implemented_phenotypes.booth_phenotype import BoothPhenotype
+from evolutionary_optimization.termination_criteria.implemented_termination_criteria import \
+    TargetFitnessTerminationCriterion
+
+
+def build_island_model(**evolution_kwargs) -> IslandModel:
+    genotype = FloatListGenotype(number_of_genes=2, value_range=(-10, 10))
+    return IslandModel(
+        phenotype=BoothPhenotype(genotype),
+        fitness_function=MinimizeFitnessFunction(),
+        number_of_islands=2,
+        number_of_individuals=10,
+        number_of_generations=20,
+        migration_interval=5,
+        seed=0,
+        **evolution_kwargs,
+    )
+
+
+def test_termination_criteria_stop_the_island_model():
+    island_model = build_island_model(
+        termination_criteria=[TargetFitnessTerminationCriterion(target_fitness_score=float("-inf"))],
+    )
+    island_model.evolve()
+
+    assert island_model.termination_reason.startswith("Island 0: ")
+    assert len(island_model.performance_over_time.records) == 5
+
+
+def test_island_model_without_termination_criteria_runs_every_generation():
+    island_model = build_island_model()
+    island_model.evolve()
+
+    assert island_model.termination_reason == "Reached number_of_generations (20)"
+    assert len(island_model.performance_over_time.records) == 20
+
+
+def test_checkpointer_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        build_island_model(checkpointer=Checkpointer(str(tmp_path / "checkpoint.npz")))
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from evolutionary_optimization.genotype.implemented_genotypes.float_list_genotype import FloatListGenotype
+from evolutionary_optimization.genotype.implemented_genotypes.integer_list_genotype import IntegerListGenotype
+from evolutionary_optimization.genotype.mutation_operators.implemented_mutation_operators import \
+    IntegerStepMutationOperator
+from evolutionary_optimization.genotype.mutation_operators.mutation_utils import BoundHandlings
+
+
+@pytest.mark.parametrize("bound_handling", [BoundHandlings.NONE, BoundHandlings.CLIP, BoundHandlings.REFLECT])
+def test_integer_step_mutation_with_float_step_size_keeps_integer_genes(bound_handling):
+    genotype = IntegerListGenotype(number_of_genes=4, value_range=(0, 10))
+    genes = np.array([[0, 3, 7, 10], [5, 5, 5, 5]])
+    mutation_operator = IntegerStepMutationOperator(
+        step_size=1.5, mutation_probability=1.0, bound_handling=bound_handling,
+    )
+
+    mutated_genes = mutation_operator.mutate(genes, genotype, np.random.default_rng(0))
+
+    assert mutated_genes.dtype == genes.dtype
+    assert np.all(np.abs(mutated_genes - genes) == 2)
+    if bound_handling != BoundHandlings.NONE:
+        assert np.all((mutated_genes >= 0) & (mutated_genes <= 10))
+
+
+def test_integer_step_mutation_of_float_genes_keeps_the_step_size():
+    genotype = FloatListGenotype(number_of_genes=3, value_range=(-10, 10))
+    genes = np.zeros((2, 3))
+    mutation_operator = IntegerStepMutationOperator(step_size=0.5, mutation_probability=1.0)
+
+    mutated_genes = mutation_operator.mutate(genes, genotype, np.random.default_rng(0))
+
+    assert mutated_genes.dtype == genes.dtype
+    assert np.all(np.abs(mutated_genes) == 0.5)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from evolutionary_optimization.evolutionary_algorithm.array_population import ArrayPopulation
+from evolutionary_optimization.evolutionary_algorithm.population import Population
+from evolutionary_optimization.fitness_functions.implemented_fitness_functions import MinimizeFitnessFunction
+from evolutionary_optimization.genotype.implemented_genotypes.float_list_genotype import FloatListGenotype
+from evolutionary_optimization.phenotype.implemented_phenotypes.booth_phenotype import BoothPhenotype
+
+
+def get_genes(population) -> np.ndarray:
+    """Return the gene matrix of either population backend."""
+    if isinstance(population, ArrayPopulation):
+        return population.genes.copy()
+    return np.stack([individual.genotype.to_array() for individual in population.population])
+
+
+@pytest.mark.parametrize("population_class", [Population, ArrayPopulation])
+def test_crossover_without_mutation(population_class):
+    genotype = FloatListGenotype(number_of_genes=2, mutation_probability=0, ratio_of_population_for_crossover=0.5)
+    population = population_class(
+        number_of_individuals=20,
+        phenotype=BoothPhenotype(genotype),
+        ratio_of_elite_individuals=0.1,
+        rng=np.random.default_rng(0),
+    )
+    assert population.crossover
+    assert not population.mutation
+
+    initial_genes = get_genes(population)
+    fitness_function = MinimizeFitnessFunction()
+    population.evaluate_population(fitness_function)
+    population.update_population(fitness_function)
+    new_genes = get_genes(population)
+
+    initial_rows = {tuple(row) for row in initial_genes}
+    assert any(tuple(row) not in initial_rows for row in new_genes)
+    initial_values = {(gene_index, value) for row in initial_genes for gene_index, value in enumerate(row)}
+    assert all((gene_index, value) in initial_values for row in new_genes for gene_index, value in enumerate(row))
+
+
+def test_assigning_best_individual_offers_it_to_the_hall_of_fame():
+    genotype = FloatListGenotype(number_of_genes=2, value_range=(-10, 10))
+    population = Population(number_of_individuals=10, phenotype=BoothPhenotype(genotype),
+                            ratio_of_elite_individuals=0.1, rng=np.random.default_rng(0))
+    fitness_function = MinimizeFitnessFunction()
+    population.evaluate_population(fitness_function)
+
+    optimum = BoothPhenotype(FloatListGenotype.from_genotype(genotype, [1.0, 3.0]))
+    optimum.evaluate_phenotype()
+    optimum.fitness_score = fitness_function.evaluate(optimum)
+    population.best_individual = optimum
+    assert population.best_individual.genotype.genotype == [1.0, 3.0]
+    assert population.best_fitness_score == optimum.fitness_score
+
+    worse_individual = BoothPhenotype(FloatListGenotype.from_genotype(genotype, [10.0, 10.0]))
+    worse_individual.evaluate_phenotype()
+    worse_individual.fitness_score = fitness_function.evaluate(worse_individual)
+    population.best_individual = worse_individual
+    assert population.best_individual.genotype.genotype == [1.0, 3.0]
@@ -0,0 +1,60 @@
+from evolutionary_optimization.evolutionary_algorithm.checkpoint import Checkpointer
+from evolutionary_optimization.evolutionary_algorithm.evolution import Evolution
+from evolutionary_optimization.evolutionary_algorithm.stage_timer import StageTimer
+from evolutionary_optimization.fitness_functions.implemented_fitness_functions import MinimizeFitnessFunction
+from evolutionary_optimization.genotype.implemented_genotypes.float_list_genotype import FloatListGenotype
+from evolutionary_optimization.phenotype.implemented_phenotypes.booth_phenotype import BoothPhenotype
+
+
+class RecordingProfiler:
+    """Profiler stand-in recording whether it is enabled."""
+    def __init__(self):
+        self.is_enabled = False
+
+    def enable(self):
+        self.is_enabled = True
+
+    def disable(self):
+        self.is_enabled = False
+
+
+class RecordingCheckpointer(Checkpointer):
+    """Checkpointer recording, instead of saving, whether the profiler was enabled when a checkpoint was due."""
+    def __init__(self, path: str, profiler: RecordingProfiler):
+        super().__init__(path, every_n_generations=1)
+        self.profiler = profiler
+        self.profiler_enabled_at_save = []
+
+    def save(self, evolution: Evolution):
+        self.profiler_enabled_at_save.append(self.profiler.is_enabled)
+
+
+def test_checkpoint_is_timed_and_profiled_within_its_generation(tmp_path):
+    profiler = RecordingProfiler()
+    checkpointer = RecordingCheckpointer(str(tmp_path / "checkpoint.npz"), profiler)
+    stage_timer = StageTimer(profiler=profiler, profile_generations=range(0, 2))
+    evolution = Evolution(
+        phenotype=BoothPhenotype(FloatListGenotype(number_of_genes=2)),
+        fitness_function=MinimizeFitnessFunction(),
+        number_of_individuals=10,
+        number_of_generations=3,
+        checkpointer=checkpointer,
+        stage_timer=stage_timer,
+        seed=0,
+    )
+    evolution.evolve()
+
+    assert checkpointer.profiler_enabled_at_save == [True, True, False]
+    report = stage_timer.report()
+    assert report["checkpoint"].number_of_calls == 3
+    assert report["checkpoint"].last_generation_seconds > 0
+
+
+def test_last_generation_seconds_are_kept_when_a_new_generation_starts():
+    stage_timer = StageTimer()
+    stage_timer.start_generation(0)
+    stage_timer.add_time("mutation", 1.0)
+    stage_timer.end_generation()
+    stage_timer.add_time("mutation", 2.0)
+
+    assert stage_timer.report()["mutation"].last_generation_seconds == 1.0